@@ -0,0 +1,46 @@
+"""
+vaxio_poc – Extraktion der STIKO-Reiseimpf-Ländertabelle.
+
+pdfplumber wird erst importiert, wenn tatsächlich ein PDF gelesen wird; der
+Import dieses Pakets (und damit JSON-/Cache-Befehle der CLI) bleibt billig.
+"""
+from .helpers import (
+    canonical_vaccine_from_line,
+    cleanup_vaccine,
+    dedup_keep_order,
+    extract_alias,
+    extract_bullets,
+    extract_entry_requirements,
+    is_heading_candidate,
+    looks_like_alpha_separator,
+    norm,
+    split_into_sections,
+)
+from .metrics import Metrics
+from .pipeline import ExtractOptions, extract, extract_from_text, write_json
+from .profiles import PROFILES, OutputProfile, extract_profiles, write_profiles
+from .stream import stream_extract, stream_from_lines
+
+__all__ = [
+    "ExtractOptions",
+    "Metrics",
+    "extract",
+    "extract_from_text",
+    "PROFILES",
+    "OutputProfile",
+    "extract_profiles",
+    "write_profiles",
+    "stream_extract",
+    "stream_from_lines",
+    "write_json",
+    "canonical_vaccine_from_line",
+    "cleanup_vaccine",
+    "dedup_keep_order",
+    "extract_alias",
+    "extract_bullets",
+    "extract_entry_requirements",
+    "is_heading_candidate",
+    "looks_like_alpha_separator",
+    "norm",
+    "split_into_sections",
+]
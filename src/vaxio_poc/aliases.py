@@ -0,0 +1,86 @@
+"""
+Alias-Auflösung über einmalig berechnete norm()-Indizes.
+
+  resolved, unresolved = resolve_alias_targets(output, alias_map)
+
+Ein Alias-Target wird zuerst unter den geparsten Ländern gesucht (norm-
+Gleichheit, erster Treffer in Einfügereihenfolge). Ist es selbst ein Alias
+(Alias -> Alias -> Land), wird der Kette bis zum Land gefolgt; Zyklen werden
+erkannt. Länder-Einträge ohne eigene Empfehlungen, die von einem
+gleichnamigen Alias ersetzt werden, gelten dabei als Zwischenglied.
+Pro Alias kostet das eine Dict-Abfrage je Kettenglied statt eines Scans über
+alle Länder.
+"""
+from .helpers import norm
+
+
+def build_norm_index(keys) -> dict:
+    """norm(key) -> erster key mit dieser Normalform."""
+    index = {}
+    for k in keys:
+        index.setdefault(norm(k), k)
+    return index
+
+
+def _follow(target, country_index, alias_targets, shadowed):
+    """Gibt (land_key, fehlergrund) zurück; fehlergrund None bei Erfolg."""
+    seen = set()
+    fallback = None
+    name = target
+    while True:
+        n = norm(name)
+        if n in seen:
+            return fallback, None if fallback else "Zyklus"
+        seen.add(n)
+
+        key = country_index.get(n)
+        if key is not None:
+            if key not in shadowed:
+                return key, None
+            fallback = fallback or key
+
+        nxt = alias_targets.get(n)
+        if nxt is None:
+            return fallback, None if fallback else "nicht gefunden"
+        name = nxt
+
+
+def resolve_alias_targets(output: dict, alias_map: dict):
+    """
+    Ordnet jedem Alias den Länder-Key zu.
+    Rückgabe: (resolved {alias: land_key}, unresolved {alias: (target, grund)})
+    """
+    country_index = build_norm_index(output)
+    alias_targets = {}
+    for a, t in alias_map.items():
+        alias_targets.setdefault(norm(a), t)
+
+    # Länder ohne Empfehlungen werden von einem gleichnamigen Alias ersetzt
+    shadowed = {
+        a for a in alias_map if a in output and not output[a].get("recommendedForAll")
+    }
+
+    resolved, unresolved = {}, {}
+    for alias_name, target_name in alias_map.items():
+        key, reason = _follow(target_name, country_index, alias_targets, shadowed)
+        if key is None:
+            unresolved[alias_name] = (target_name, reason)
+        else:
+            resolved[alias_name] = key
+    return resolved, unresolved
+
+
+def format_unresolved(unresolved: dict) -> str:
+    lines = [f"{len(unresolved)} Alias-Target(s) nicht gefunden:"]
+    for alias_name, (target_name, reason) in unresolved.items():
+        lines.append(f"  {alias_name} -> {target_name} ({reason})")
+    return "\n".join(lines)
+
+
+def copy_record(value):
+    """Tiefe Kopie eines Länder-Records (nur dict/list/Skalare)."""
+    if isinstance(value, dict):
+        return {k: copy_record(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_record(v) for v in value]
+    return value
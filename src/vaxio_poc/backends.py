@@ -0,0 +1,237 @@
+"""
+Text-Backends für die Seitenextraktion.
+
+  backend = get_backend("auto")        # schnellstes installiertes Backend
+  with backend.open("EB-14-2025.pdf") as doc:
+      len(doc), doc.text(0)
+
+  pdfplumber  Referenz (extract_text mit x/y_tolerance=3), langsam: baut
+              für jede Seite alle Zeichen-Objekte auf
+  pdfium      pypdfium2 (Abhängigkeit von pdfplumber), Textlayer direkt
+  pdfminer    pdfminer.six direkt mit eigenen LAParams, ohne pdfplumber
+
+"auto" wählt in FAST_ORDER das erste installierte Backend. PdfPageTexts
+prüft bei "auto" eine Tabellen-Seite gegen die Referenz und schaltet bei
+Abweichung auf pdfplumber um (siehe pdftext.py). Ob die Länder-Records
+identisch sind, zeigt python -m vaxio_poc.bench_backends.
+"""
+import abc
+import importlib.util
+from importlib import metadata
+
+REFERENCE = "pdfplumber"
+FAST_ORDER = ["pdfium", "pdfminer", "pdfplumber"]
+# Pakete hinter den Backends (Distributionsnamen)
+DISTRIBUTIONS = ("pdfplumber", "pypdfium2", "pdfminer.six")
+
+
+def _version(dist: str) -> str:
+    try:
+        return metadata.version(dist)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def library_versions() -> dict:
+    """Installierte Versionen aller Backend-Pakete (auch der Referenz für "auto")."""
+    return {dist: _version(dist) for dist in DISTRIBUTIONS}
+
+
+def text_lines(text: str) -> list:
+    """Nicht-leere, gestrippte Zeilen – so sieht die Pipeline einen Seitentext."""
+    return [ln.strip() for ln in text.splitlines() if ln.strip()]
+
+
+# eine Seite mit so vielen Länder-Markern ist sicher eine Tabellen-Seite
+SAMPLE_MARKER = "Nachweispflicht"
+SAMPLE_MIN_MARKERS = 2
+
+
+def sample_score(text: str) -> tuple:
+    """Eignung als Seite für den Referenz-Abgleich (größer = besser)."""
+    return text.count(SAMPLE_MARKER), len(text)
+
+
+class _Document(abc.ABC):
+    """Geöffnetes PDF eines Backends; Unterklassen liefern Seitenzahl und Seitentext."""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def text(self, i: int) -> str:
+        ...
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PdfplumberBackend:
+    name = "pdfplumber"
+    module = "pdfplumber"
+
+    def __init__(self, x_tolerance: float = 3, y_tolerance: float = 3):
+        self.x_tolerance = x_tolerance
+        self.y_tolerance = y_tolerance
+
+    def settings(self) -> dict:
+        return {
+            "extractor": self.name,
+            "x_tolerance": self.x_tolerance,
+            "y_tolerance": self.y_tolerance,
+            "version": _version("pdfplumber"),
+        }
+
+    def open(self, pdf_path):
+        import pdfplumber
+
+        backend = self
+
+        class Doc(_Document):
+            def __init__(self):
+                self.pdf = pdfplumber.open(str(pdf_path))
+
+            def __len__(self):
+                return len(self.pdf.pages)
+
+            def text(self, i):
+                page = self.pdf.pages[i]
+                t = page.extract_text(
+                    x_tolerance=backend.x_tolerance, y_tolerance=backend.y_tolerance
+                ) or ""
+                page.close()
+                return t
+
+            def close(self):
+                self.pdf.close()
+
+        return Doc()
+
+
+class PdfiumBackend:
+    name = "pdfium"
+    module = "pypdfium2"
+
+    def settings(self) -> dict:
+        return {"extractor": self.name, "version": _version("pypdfium2")}
+
+    def open(self, pdf_path):
+        import pypdfium2
+
+        class Doc(_Document):
+            def __init__(self):
+                self.pdf = pypdfium2.PdfDocument(str(pdf_path))
+
+            def __len__(self):
+                return len(self.pdf)
+
+            def text(self, i):
+                page = self.pdf[i]
+                textpage = page.get_textpage()
+                t = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                return t.replace("\r\n", "\n")
+
+            def close(self):
+                self.pdf.close()
+
+        return Doc()
+
+
+class PdfminerBackend:
+    name = "pdfminer"
+    module = "pdfminer"
+
+    # ganze Tabellenzeilen zusammenhalten, keine Spalten-/Boxen-Umsortierung
+    def __init__(self, char_margin: float = 50.0, line_margin: float = 0.1, word_margin: float = 0.1):
+        self.char_margin = char_margin
+        self.line_margin = line_margin
+        self.word_margin = word_margin
+
+    def settings(self) -> dict:
+        return {
+            "extractor": self.name,
+            "char_margin": self.char_margin,
+            "line_margin": self.line_margin,
+            "word_margin": self.word_margin,
+            "version": _version("pdfminer.six"),
+        }
+
+    def open(self, pdf_path):
+        from pdfminer.converter import PDFPageAggregator
+        from pdfminer.layout import LAParams, LTTextContainer
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        laparams = LAParams(
+            char_margin=self.char_margin,
+            line_margin=self.line_margin,
+            word_margin=self.word_margin,
+            boxes_flow=None,
+        )
+
+        class Doc(_Document):
+            def __init__(self):
+                self.fp = open(pdf_path, "rb")
+                self.pages = list(PDFPage.create_pages(PDFDocument(PDFParser(self.fp))))
+                rsrc = PDFResourceManager(caching=True)
+                self.device = PDFPageAggregator(rsrc, laparams=laparams)
+                self.interpreter = PDFPageInterpreter(rsrc, self.device)
+
+            def __len__(self):
+                return len(self.pages)
+
+            def text(self, i):
+                self.interpreter.process_page(self.pages[i])
+                layout = self.device.get_result()
+                return "".join(
+                    obj.get_text() for obj in layout if isinstance(obj, LTTextContainer)
+                )
+
+            def close(self):
+                self.fp.close()
+
+        return Doc()
+
+
+BACKENDS = {
+    "pdfplumber": PdfplumberBackend,
+    "pdfium": PdfiumBackend,
+    "pdfminer": PdfminerBackend,
+}
+
+
+def is_available(name: str) -> bool:
+    return importlib.util.find_spec(BACKENDS[name].module) is not None
+
+
+def available_backends() -> list:
+    return [name for name in FAST_ORDER if is_available(name)]
+
+
+def get_backend(name: str = REFERENCE, **kwargs):
+    """Backend-Instanz; "auto" = erstes installiertes aus FAST_ORDER."""
+    if name == "auto":
+        name = next(iter(available_backends()), REFERENCE)
+    if name not in BACKENDS:
+        raise ValueError(f"Unbekanntes Backend: {name} (bekannt: {', '.join(BACKENDS)})")
+    return BACKENDS[name](**kwargs)
+
+
+def backend_from_settings(settings: dict):
+    """Gegenstück zu backend.settings() – für Worker-Prozesse."""
+    cls = BACKENDS[settings["extractor"]]
+    params = {
+        k: v for k, v in settings.items() if k not in ("extractor", "version", "verifiedAgainst")
+    }
+    return cls(**params)
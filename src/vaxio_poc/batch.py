@@ -0,0 +1,151 @@
+"""
+Batch-Extraktion über ein Archiv von Bulletin-Ausgaben.
+
+  vaxio-poc batch archiv/ "entwurf/EB-*.pdf" -d out/ --jobs 4
+
+Jedes PDF läuft in einem eigenen Prozess eines begrenzten Pools (--jobs).
+Die Ausgabe heißt nach der Ausgabe im Seitenkopf ("Epidemiologisches
+Bulletin 14 | 2025" -> stiko_EB-14-2025.json), ohne erkennbaren Kopf nach dem
+Dateinamen. Ein fehlerhaftes PDF bricht den Lauf nicht ab; am Ende gibt es
+eine Übersicht mit Laufzeit und Länderzahl pro Datei. Die [WARN]-Ausgaben
+jeder Datei erscheinen auf stderr mit dem Dateinamen davor, in
+Eingabereihenfolge (auch bei --jobs > 1 nicht verschränkt).
+"""
+import contextlib
+import glob
+import io
+import re
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from .pipeline import ExtractOptions, extract_from_text, load_land_pages, write_json
+
+_EDITION_RE = re.compile(r"Epidemiologisches Bulletin\s+(\d{1,2})\s*\|\s*(\d{4})")
+
+
+def find_inputs(patterns) -> list:
+    """Verzeichnisse (-> *.pdf darin), Globs und Dateien; sortiert, ohne Duplikate."""
+    found = []
+    for pat in patterns:
+        p = Path(pat)
+        if p.is_dir():
+            found.extend(sorted(p.glob("*.pdf")) + sorted(p.glob("*.PDF")))
+        elif glob.has_magic(pat):
+            found.extend(Path(x) for x in sorted(glob.glob(pat)))
+        else:
+            found.append(p)
+    seen, unique = set(), []
+    for p in found:
+        key = p.resolve()
+        if key not in seen:
+            seen.add(key)
+            unique.append(p)
+    return unique
+
+
+def detect_edition(texts) -> str:
+    """'EB-<nr>-<jahr>' aus dem ersten Seitenkopf, sonst None."""
+    for t in texts:
+        m = _EDITION_RE.search(t)
+        if m:
+            return f"EB-{int(m.group(1)):02d}-{m.group(2)}"
+    return None
+
+
+def extract_one(pdf_path, options: ExtractOptions) -> dict:
+    """
+    Worker: ein PDF komplett extrahieren. Fehler werden nicht geworfen,
+    sondern im Ergebnis zurückgegeben; stderr (die [WARN]-Ausgaben) steht
+    in "log", die Anzahl der Warnungen in "warnings".
+    """
+    result = {"pdf": str(pdf_path), "edition": None, "ok": False, "error": None}
+    t0 = time.perf_counter()
+    stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(stderr):
+            land_pages = load_land_pages(pdf_path, options)
+            texts = [t for _, t in land_pages]
+            output = extract_from_text("\n".join(texts), options)
+        result.update(
+            edition=detect_edition(texts),
+            ok=True,
+            output=output,
+            countries=sum(1 for r in output.values() if "aliasOf" not in r),
+            aliases=sum(1 for r in output.values() if "aliasOf" in r),
+        )
+    except Exception as e:  # pro Datei isolieren
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - t0
+    result["log"] = stderr.getvalue()
+    result["warnings"] = result["log"].count("[WARN]")
+    return result
+
+
+def output_name(result: dict, used: set) -> str:
+    stem = Path(result["pdf"]).stem
+    name = f"stiko_{result['edition'] or stem}.json"
+    if name in used:  # z.B. Entwurf und Endfassung derselben Ausgabe
+        name = f"stiko_{result['edition'] or 'x'}_{stem}.json"
+    used.add(name)
+    return name
+
+
+def run_batch(pdf_paths, out_dir, options: ExtractOptions = None, jobs: int = 1) -> list:
+    """
+    Extrahiert alle PDFs mit höchstens jobs Prozessen und schreibt die
+    Ergebnisse nach out_dir. Rückgabe: Zusammenfassung pro Datei (ohne output),
+    in Eingabereihenfolge.
+    """
+    # parallelisiert wird über Dateien, nicht über Seiten; Kopie, der Aufrufer behält seine
+    options = replace(options or ExtractOptions(), workers=1)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if jobs <= 1 or len(pdf_paths) < 2:
+        results = [extract_one(p, options) for p in pdf_paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pdf_paths))) as pool:
+            futures = [pool.submit(extract_one, str(p), options) for p in pdf_paths]
+            results = []
+            for p, fut in zip(pdf_paths, futures):
+                try:
+                    results.append(fut.result())
+                except Exception as e:  # z.B. abgestürzter Worker
+                    results.append(
+                        {"pdf": str(p), "edition": None, "ok": False, "seconds": 0.0,
+                         "warnings": 0, "log": "", "error": f"{type(e).__name__}: {e}"}
+                    )
+
+    used = set()
+    for r in results:
+        for line in r["log"].splitlines():
+            print(f"{Path(r['pdf']).name}: {line}", file=sys.stderr)
+        output = r.pop("output", None)
+        if r["ok"]:
+            r["output"] = str(write_json(output, out_dir / output_name(r, used)))
+    return results
+
+
+def format_summary(results: list, wall: float = None) -> str:
+    w1 = max([len("Datei")] + [len(Path(r["pdf"]).name) for r in results])
+    w2 = max([len("Ausgabe")] + [len(Path(r["output"]).name) for r in results if r["ok"]])
+    rows = [f"{'Datei':<{w1}} {'Ausgabe':<{w2}} {'Sek.':>7} {'Länder':>7} {'Aliase':>7} {'WARN':>5}"]
+    for r in results:
+        pdf = Path(r["pdf"]).name
+        if r["ok"]:
+            rows.append(
+                f"{pdf:<{w1}} {Path(r['output']).name:<{w2}} {r['seconds']:>7.2f} "
+                f"{r['countries']:>7} {r['aliases']:>7} {r['warnings']:>5}"
+            )
+        else:
+            rows.append(f"{pdf:<{w1}} FEHLER: {r['error']}")
+    failed = sum(1 for r in results if not r["ok"])
+    total = f"{len(results)} Datei(en), {failed} fehlgeschlagen"
+    if wall is not None:
+        total += f", {wall:.2f} s gesamt"
+    rows.append(total)
+    return "\n".join(rows)
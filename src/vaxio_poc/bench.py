@@ -0,0 +1,190 @@
+"""
+Benchmark-Suite für die Extraktion – offline, auf synthetischen Bulletins.
+
+  python -m vaxio_poc.bench --countries 1000 --repeat 5 --out bench.json
+  python -m vaxio_poc.bench --countries 250 --pdf --baseline bench.json
+
+Misst jede Stufe einzeln (Seitenauswahl, Zeilen, Headings, Blöcke, Parsen,
+Aliase, Cleanup) sowie End-to-End auf dem Text-Layer, den Streaming-Pfad
+und mit --pdf zusätzlich Seitenextraktion und End-to-End auf einem lokal
+erzeugten PDF. Ergebnisse (min/median in Sekunden) gehen als JSON raus;
+mit --baseline wird (über min) gegen einen gespeicherten Lauf verglichen und
+bei Regressionen über --tolerance mit Exit-Code 1 beendet.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .aliases import copy_record
+from .pipeline import (
+    ExtractOptions,
+    build_blocks,
+    clean_lines_from_text,
+    extract,
+    extract_from_text,
+    final_cleanup,
+    find_headings,
+    find_land_pages,
+    merge_aliases,
+    parse_blocks,
+    resolve_aliases,
+)
+from .stream import stream_from_lines
+from .synthetic import synthetic_bulletin_texts, write_synthetic_bulletin
+
+
+class _TextSource:
+    """Seitentexte aus dem Speicher, mit der Schnittstelle von PdfPageTexts."""
+
+    def __init__(self, texts):
+        self.texts = texts
+
+    def __len__(self):
+        return len(self.texts)
+
+    def text(self, i):
+        return self.texts[i]
+
+    def iter_texts(self, indices=None):
+        for i in indices if indices is not None else range(len(self.texts)):
+            yield i, self.texts[i]
+
+
+def _synthetic_manual_aliases(output: dict, every: int = 10) -> dict:
+    return {f"Region {name[5:]}": name for name in list(output)[::every]}
+
+
+def _time(fn, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - t0)
+    return {"min": min(samples), "median": statistics.median(samples)}, result
+
+
+def run_suite(n_countries: int, repeat: int = 5, seed: int = 0, with_pdf: bool = False) -> dict:
+    texts = synthetic_bulletin_texts(n_countries, seed)
+    src = _TextSource(texts)
+    stages = {}
+
+    def stage(name, fn, rep=repeat):
+        stages[name], result = _time(fn, rep)
+        return result
+
+    # [WARN]-Ausgaben (IfRisk ohne Tags etc.) gehören nicht in die Messung
+    with contextlib.redirect_stderr(io.StringIO()):
+        land_pages = stage("land_pages", lambda: find_land_pages(src))
+        land_text = "\n".join(texts[i] for i in land_pages)
+        clean_lines = stage("clean_lines", lambda: clean_lines_from_text(land_text))
+        headings, alias_map = stage("headings", lambda: find_headings(clean_lines))
+        blocks = stage("blocks", lambda: build_blocks(clean_lines, headings))
+        parsed = stage("parse", lambda: parse_blocks(blocks))
+
+        options = ExtractOptions(manual_aliases=_synthetic_manual_aliases(parsed))
+        copies = [copy_record(parsed) for _ in range(repeat)]
+        resolved = stage(
+            "aliases",
+            lambda: resolve_aliases(copies.pop(), merge_aliases(alias_map, options.manual_aliases)),
+        )
+        copies = [copy_record(resolved) for _ in range(repeat)]
+        output = stage("cleanup", lambda: final_cleanup(copies.pop()))
+
+        stage("end_to_end_text", lambda: extract_from_text(land_text, options))
+        stage("stream_text", lambda: sum(1 for _ in stream_from_lines(iter(clean_lines), options)))
+
+        pdf_pages = None
+        if with_pdf:
+            from .pdftext import PdfPageTexts
+
+            with tempfile.TemporaryDirectory() as tmp:
+                pdf_path = write_synthetic_bulletin(Path(tmp) / "synthetic.pdf", n_countries, seed)
+
+                def pdf_extract():
+                    with PdfPageTexts(pdf_path) as pdf:
+                        return [pdf.text(i) for i in range(len(pdf))]
+
+                pdf_pages = len(stage("pdf_extract", pdf_extract, 1))
+                options.use_cache = False
+                stage("end_to_end_pdf", lambda: extract(pdf_path, options), 1)
+
+    return {
+        "meta": {
+            "countries": n_countries,
+            "seed": seed,
+            "repeat": repeat,
+            "pages": len(texts),
+            "pdfPages": pdf_pages,
+            "lines": len(clean_lines),
+            "records": len(output),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "stages": stages,
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float, floor: float = 0.001):
+    """
+    Gibt [(stage, baseline_s, aktuell_s, faktor, regression)] zurück.
+    Stufen, die in beiden Läufen unter floor Sekunden bleiben, zählen nie als
+    Regression (reines Messrauschen).
+    """
+    rows = []
+    for name, cur in result["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base:
+            continue
+        # min ist bei kurzen Stufen deutlich stabiler als der Median
+        ratio = cur["min"] / base["min"] if base["min"] else float("inf")
+        regressed = ratio > 1 + tolerance and max(cur["min"], base["min"]) >= floor
+        rows.append((name, base["min"], cur["min"], ratio, regressed))
+    return rows
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark-Suite der STIKO-Extraktion")
+    ap.add_argument("--countries", type=int, default=250)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--pdf", action="store_true", help="zusätzlich lokal erzeugtes PDF messen")
+    ap.add_argument("--out", help="Ergebnis als JSON speichern")
+    ap.add_argument("--baseline", help="gespeichertes Ergebnis zum Vergleich")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="erlaubte Verlangsamung (0.2 = 20%%)")
+    ap.add_argument("--floor-ms", type=float, default=1.0, help="kürzere Stufen nie als Regression werten")
+    args = ap.parse_args(argv)
+
+    result = run_suite(args.countries, args.repeat, args.seed, args.pdf)
+
+    meta = result["meta"]
+    print(f"{meta['countries']} Länder, {meta['pages']} Seiten, {meta['lines']} Zeilen")
+    print(f"{'stufe':<16} {'min ms':>10} {'median ms':>10}")
+    for name, t in result["stages"].items():
+        print(f"{name:<16} {t['min'] * 1000:>10.2f} {t['median'] * 1000:>10.2f}")
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        rows = compare(result, baseline, args.tolerance, args.floor_ms / 1000)
+        print(f"\n{'stufe':<16} {'basis min':>10} {'jetzt min':>10} {'faktor':>7}")
+        for name, base, cur, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<16} {base * 1000:>10.2f} {cur * 1000:>10.2f} {ratio:>6.2f}x{flag}")
+        if any(r[-1] for r in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
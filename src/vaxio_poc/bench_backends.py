@@ -0,0 +1,88 @@
+"""
+Konformität und Durchsatz der Text-Backends.
+
+  python -m vaxio_poc.bench_backends --pdf EB-14-2025.pdf --pdf EB-14-2024.pdf
+  python -m vaxio_poc.bench_backends --countries 250      # synthetisches Bulletin
+
+Jedes installierte Backend extrahiert alle Seiten (ohne Cache, ohne
+verify); daraus werden die Länder-Records gebaut und mit denen von
+pdfplumber verglichen. Exit-Code 1, wenn ein Backend abweicht.
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from .backends import REFERENCE, available_backends, get_backend
+from .pdftext import PdfPageTexts
+from .pipeline import ExtractOptions, extract_from_text, find_land_pages
+from .synthetic import write_synthetic_bulletin
+
+
+class _Texts(list):
+    """Liste von Seitentexten mit der Schnittstelle von PdfPageTexts."""
+
+    def text(self, i):
+        return self[i]
+
+
+def run_backend(pdf_path, name: str):
+    """Rückgabe: (sekunden, seiten, records)"""
+    t0 = time.perf_counter()
+    with PdfPageTexts(pdf_path, backend=get_backend(name)) as src:
+        texts = _Texts(src.text(i) for i in range(len(src)))
+    elapsed = time.perf_counter() - t0
+
+    with contextlib.redirect_stderr(io.StringIO()):
+        land_text = "\n".join(texts[i] for i in find_land_pages(texts))
+        records = extract_from_text(land_text, ExtractOptions())
+    return elapsed, len(texts), records
+
+
+def diff_records(reference: dict, records: dict) -> list:
+    """Keys, deren Records fehlen, überzählig sind oder abweichen."""
+    keys = list(reference) + [k for k in records if k not in reference]
+    return [k for k in keys if reference.get(k) != records.get(k)]
+
+
+def check_pdf(pdf_path, names) -> bool:
+    print(f"\n{pdf_path}")
+    print(f"{'backend':<12} {'sekunden':>9} {'seiten/s':>9} {'speedup':>8}  records")
+    ref_time, pages, reference = run_backend(pdf_path, REFERENCE)
+    ok = True
+    for name in [REFERENCE] + [n for n in names if n != REFERENCE]:
+        if name == REFERENCE:
+            elapsed, records = ref_time, reference
+        else:
+            elapsed, pages, records = run_backend(pdf_path, name)
+        diffs = diff_records(reference, records)
+        ok = ok and not diffs
+        same = "identisch" if not diffs else f"ABWEICHEND ({len(diffs)}): " + ", ".join(diffs[:5])
+        print(
+            f"{name:<12} {elapsed:>9.2f} {pages / elapsed:>9.1f} "
+            f"{ref_time / elapsed:>7.2f}x  {same}"
+        )
+    return ok
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--pdf", action="append", default=[], help="PDF-Datei (mehrfach möglich)")
+    ap.add_argument("--countries", type=int, default=250, help="Länder im synthetischen Bulletin")
+    ap.add_argument("--backends", help="kommagetrennt (Default: alle installierten)")
+    args = ap.parse_args(argv)
+
+    names = args.backends.split(",") if args.backends else available_backends()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdfs = [Path(p) for p in args.pdf] or [
+            write_synthetic_bulletin(Path(tmp) / "synthetic.pdf", args.countries)
+        ]
+        ok = all([check_pdf(p, names) for p in pdfs])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
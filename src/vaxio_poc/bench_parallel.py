@@ -0,0 +1,68 @@
+"""
+Benchmark: serielle vs. parallele Seitenextraktion.
+
+  python -m vaxio_poc.bench_parallel --pdf EB-14-2025.pdf --workers 1,2,4,8
+  python -m vaxio_poc.bench_parallel --pages 400            # synthetisches PDF
+
+Läuft ohne Cache und prüft, dass jede Worker-Zahl exakt dieselben
+Seitentexte (und damit dieselben clean_lines) liefert wie der serielle Pfad.
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from .pdftext import PdfPageTexts
+from .synthetic import write_text_pdf
+
+
+def _filler_pages(n_pages: int, lines_per_page: int = 60):
+    pages = []
+    for p in range(n_pages):
+        pages.append(
+            [
+                f"Seite {p + 1} Zeile {k}: Gelbfieber Typhus Tollwut Hepatitis A "
+                f"Nachweispflicht bei Einreise aus Endemiegebieten"
+                for k in range(lines_per_page)
+            ]
+        )
+    return pages
+
+
+def _run(pdf_path: Path, workers: int):
+    t0 = time.perf_counter()
+    with PdfPageTexts(pdf_path, cache=None) as src:
+        src.prefetch(workers=workers)
+        texts = [src.text(i) for i in range(len(src))]
+    return time.perf_counter() - t0, "\n".join(texts)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--pdf", help="PDF-Datei (sonst synthetisch)")
+    ap.add_argument("--pages", type=int, default=300, help="Seiten des synthetischen PDFs")
+    ap.add_argument("--workers", default=f"1,2,4,{os.cpu_count() or 1}")
+    args = ap.parse_args(argv)
+
+    worker_counts = sorted({int(w) for w in args.workers.split(",")} | {1})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.pdf:
+            pdf_path = Path(args.pdf)
+        else:
+            pdf_path = write_text_pdf(Path(tmp) / "synthetic.pdf", _filler_pages(args.pages))
+
+        base_time, base_text = None, None
+        print(f"{'workers':>8} {'sekunden':>10} {'speedup':>8}  identisch")
+        for w in worker_counts:
+            elapsed, text = _run(pdf_path, w)
+            if base_time is None:
+                base_time, base_text = elapsed, text
+            same = "ja" if text == base_text else "NEIN"
+            print(f"{w:>8} {elapsed:>10.2f} {base_time / elapsed:>7.2f}x  {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+"""
+Skalierungs-Benchmark für Stufe 4 (Headings + Blöcke).
+
+  python -m vaxio_poc.bench_segment --sizes 5000,10000,20000,40000
+
+Vergleicht die lineare Segmentierung mit der früheren Variante (Marker-Liste
++ Regex pro Zeile, für jedes Heading Suche des nächsten in heading_positions,
+O(H²)) auf synthetischen Ländertabellen und prüft, dass beide dieselben
+Headings, PDF-Aliase und Blöcke liefern. Die alte Variante läuft nur bis
+--legacy-max Headings.
+"""
+import argparse
+import re
+import time
+
+from .helpers import extract_alias, is_heading_candidate
+from .pipeline import build_blocks, find_headings
+from .synthetic import synthetic_country_lines
+
+
+def _legacy_is_heading_candidate(line):
+    bad_markers = [
+        "Nachweispflicht", "Impfungen bei", "Impfungen für alle",
+        "Reisenden", "Risiken", "Tabelle", "Aufbau", "Disclaimer",
+        "Name des Landes",
+    ]
+    if any(k in line for k in bad_markers):
+        return False
+    letters_only = re.sub(r"[^A-Za-zÄÖÜäöüß]", "", line)
+    if 1 <= len(letters_only) <= 3 and letters_only.upper() == letters_only:
+        return False
+    if line.isupper() and len(line) > 10:
+        return False
+    if re.search(r"\d", line):
+        return False
+    if len(line) > 60:
+        return False
+    if len(line) <= 2:
+        return False
+    if not re.match(r"^[A-ZÄÖÜ]", line):
+        return False
+    return True
+
+
+def _legacy_segment(clean_lines):
+    headings = []
+    alias_map = {}
+    for i, ln in enumerate(clean_lines[:-2]):
+        if not _legacy_is_heading_candidate(ln):
+            continue
+        alias = extract_alias(ln)
+        if alias:
+            alias_map[alias[0]] = alias[1]
+            continue
+        if ("Nachweispflicht" in clean_lines[i + 1]) or ("Nachweispflicht" in clean_lines[i + 2]):
+            headings.append((i, ln))
+    return _legacy_build_blocks(clean_lines, headings), alias_map
+
+
+def _new_segment(clean_lines):
+    headings, alias_map = find_headings(clean_lines)
+    return build_blocks(clean_lines, headings), alias_map
+
+
+def _legacy_build_blocks(clean_lines, headings):
+    heading_positions = sorted([pos for pos, _ in headings])
+
+    blocks = {}
+    for pos, name in headings:
+        next_pos = None
+        for hp in heading_positions:
+            if hp > pos:
+                next_pos = hp
+                break
+
+        block_lines = clean_lines[pos : next_pos if next_pos else len(clean_lines)]
+        blocks[name] = "\n".join(block_lines)
+    return blocks
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - t0, result
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Skalierung der Heading-Segmentierung")
+    ap.add_argument("--sizes", default="2500,5000,10000,20000,40000")
+    ap.add_argument("--legacy-max", type=int, default=10000)
+    args = ap.parse_args(argv)
+
+    print(
+        f"{'headings':>9} {'zeilen':>8} {'kandidat µs/z':>14} "
+        f"{'segment ms':>11} {'µs/heading':>11} {'alt ms':>9}  identisch"
+    )
+    for n in (int(x) for x in args.sizes.split(",")):
+        lines = synthetic_country_lines(n)
+
+        t_cand, _ = _timed(lambda: [is_heading_candidate(ln) for ln in lines])
+        t_new, (blocks, aliases) = _timed(_new_segment, lines)
+
+        legacy_ms, same = "-", "-"
+        if n <= args.legacy_max:
+            t_old, (old_blocks, old_aliases) = _timed(_legacy_segment, lines)
+            legacy_ms = f"{t_old * 1000:.0f}"
+            same = (
+                list(old_blocks.items()) == list(blocks.items())
+                and list(old_aliases.items()) == list(aliases.items())
+            )
+            same = "ja" if same else "NEIN"
+
+        print(
+            f"{len(blocks):>9} {len(lines):>8} {t_cand / len(lines) * 1e6:>14.2f} "
+            f"{t_new * 1000:>11.1f} {t_new / len(blocks) * 1e6:>11.2f} {legacy_ms:>9}  {same}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
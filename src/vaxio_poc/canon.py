@@ -0,0 +1,68 @@
+"""
+Impfstoff-Kanonisierung: Longest-Match über alle Schlüssel eines Canon-Dicts.
+
+Statt jeden Schlüssel einzeln als Substring zu testen, werden alle Schlüssel
+zu einem Trie-förmigen Regex kompiliert. Ein Durchlauf über den Text liefert
+pro Position den längsten dort beginnenden Schlüssel; gewonnen hat – wie
+bisher – der insgesamt längste, bei gleicher Länge der frühere im Dict.
+Die Kosten pro Position hängen damit von der Schlüssellänge ab, nicht von der
+Anzahl der Schlüssel.
+"""
+import re
+from functools import lru_cache
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _trie_pattern(keys) -> str:
+    trie = {}
+    for k in keys:
+        node = trie
+        for ch in k:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # Schlüsselende
+
+    def emit(node) -> str:
+        alts = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            # greedy: erst die längere Fortsetzung, sonst hier enden
+            return "(?:" + body + ")?"
+        return body
+
+    return emit(trie)
+
+
+class CanonMatcher:
+    """
+    matcher = CanonMatcher(VACCINE_CANON)
+    matcher.lookup(norm(line))  -> kanonischer Name oder None
+
+    lookup ist mit einem begrenzten LRU-Cache auf den normalisierten Text
+    memoisiert (cache_info() für Trefferstatistik).
+    """
+
+    def __init__(self, canon: dict, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.canon = dict(canon)
+        keys = sorted((k for k in self.canon if k), key=len, reverse=True)
+        self._rank = {k: r for r, k in enumerate(keys)}
+        self._scan = re.compile("(?=(" + _trie_pattern(keys) + "))") if keys else None
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def _lookup(self, normalized: str):
+        if self._scan is None:
+            return None
+        best = None
+        for m in self._scan.finditer(normalized):
+            k = m.group(1)
+            if best is None or self._rank[k] < self._rank[best]:
+                best = k
+        return self.canon[best] if best is not None else None
+
+    def cache_info(self):
+        return self.lookup.cache_info()
+
+    def cache_clear(self):
+        self.lookup.cache_clear()
@@ -0,0 +1,327 @@
+"""
+Stufen-Checkpoints: Zwischenergebnisse der Pipeline als gecachte Artefakte.
+
+  output = extract("EB-14-2025.pdf", ExtractOptions(checkpoints=True))
+
+Die Pipeline als DAG (jede Stufe hängt nur von der vorherigen ab):
+
+  land_text   Text der Tabellen-Seiten        <- PDF (SHA-256), Backend samt
+                                                 Einstellungen und Versionen
+  lines       bereinigte Zeilen               <- land_text
+  segments    Länderblöcke + PDF-Aliase       <- lines, config.py
+  parsed      Records + PDF-Aliase            <- segments, config.py
+  output      Aliase aufgelöst, Cleanup       <- parsed, manual_aliases
+
+Der Key eines Artefakts ist ein Hash über den Stufennamen, die Keys seiner
+Eingaben, die Parameter (PDF-Hash, Backend, manuelle Aliase, ...) und den
+Code, der es erzeugt: Quelltext der beteiligten Funktionen bzw. Module und
+alle Werte aus config.py (Kanonisierung, Alias-Pfeile, ...) außer den
+manuellen Aliasen. MANUAL_ALIAS_MAP geht nur über options.manual_aliases in
+"output" ein – eine Alias-Änderung lädt also "parsed" aus dem Cache und
+rechnet nur Alias-Merge, Auflösung und Cleanup.
+
+Ausgewertet wird vom Ende her: ist "output" im Cache, wird nichts davor
+geladen. [WARN]-Ausgaben einer Stufe (samt denen ihrer Eingaben) werden mit
+dem Artefakt gespeichert und bei einem Treffer erneut ausgegeben. Artefakte
+liegen als JSON neben dem Seiten-Cache (LRU über mtime wie dort).
+"""
+import contextlib
+import hashlib
+import inspect
+import io
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import aliases, backends, canon, config, helpers, pdftext, prefilter
+from .page_cache import DEFAULT_CACHE_DIR, evict_lru, file_sha256
+from .pipeline import (
+    BAD_KEYS,
+    LAND_MARKERS,
+    build_blocks,
+    build_record,
+    candidate_pages,
+    classify_heading,
+    clean_lines_from_text,
+    final_cleanup,
+    find_headings,
+    find_land_pages,
+    heading_ranges,
+    iter_alias_records,
+    load_land_pages,
+    load_land_text,
+    merge_aliases,
+    parse_blocks,
+    parse_country,
+    parse_country_raw,
+    resolve_aliases,
+    stage_metrics,
+)
+
+CHECKPOINT_VERSION = 1
+DEFAULT_STAGE_DIR = DEFAULT_CACHE_DIR.parent / "stages"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# kommen über options.manual_aliases bzw. die Profile, nicht über die Konfiguration
+_CONFIG_ALIASES = {"MANUAL_ALIAS_MAP", "MANUAL_ALIASES"}
+
+
+def fingerprint(*parts) -> str:
+    """Hash über Module (Dateiinhalt), Funktionen (Quelltext) und Daten (JSON)."""
+    h = hashlib.sha256()
+    for part in parts:
+        if inspect.ismodule(part):
+            data = Path(part.__file__).read_bytes()
+        elif inspect.isfunction(part) or inspect.isclass(part):
+            data = inspect.getsource(part).encode("utf-8")
+        else:
+            data = json.dumps(part, sort_keys=True, ensure_ascii=False, default=sorted).encode("utf-8")
+        h.update(data)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def config_values() -> dict:
+    """Werte aus config.py ohne manuelle Aliase; dicts als Item-Listen (Reihenfolge zählt)."""
+    return {
+        name: list(value.items()) if isinstance(value, dict) else value
+        for name, value in vars(config).items()
+        if name.isupper() and name not in _CONFIG_ALIASES
+    }
+
+
+class StageCache:
+    """On-Disk-Cache: Artefakt-Key -> (Wert, Warnungen)."""
+
+    def __init__(self, cache_dir=DEFAULT_STAGE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, pdf_sha: str, stage: str, key: str) -> Path:
+        return self.cache_dir / f"{pdf_sha[:16]}-{stage}-{key[:24]}.json"
+
+    def _entries(self):
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob("*.json"))
+
+    def load(self, pdf_sha: str, stage: str, key: str):
+        """(value, warnings) oder None."""
+        path = self._entry_path(pdf_sha, stage, key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("key") != key:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data["value"], data.get("warnings", "")
+
+    def store(self, pdf_sha: str, stage: str, key: str, value, warnings: str = ""):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(pdf_sha, stage, key)
+        data = {"stage": stage, "key": key, "warnings": warnings, "value": value}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        evict_lru(self._entries(), self.max_bytes)
+
+    def invalidate(self, pdf_sha: str = None) -> int:
+        removed = 0
+        for p in self._entries():
+            if pdf_sha is None or p.name.startswith(f"{pdf_sha[:16]}-"):
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        return {
+            "cacheDir": str(self.cache_dir),
+            "entries": len(entries),
+            "bytes": sum(p.stat().st_size for p in entries),
+            "maxBytes": self.max_bytes,
+        }
+
+
+class _Tee(io.TextIOBase):
+    """stderr durchreichen und mitschreiben (Warnungen einer Stufe)."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buf = io.StringIO()
+
+    def write(self, s):
+        self.stream.write(s)
+        self.buf.write(s)
+        return len(s)
+
+    def flush(self):
+        self.stream.flush()
+
+
+@dataclass
+class Stage:
+    name: str
+    run: object  # (ctx, *dep_values) -> JSON-fähiger Wert
+    deps: tuple = ()
+    params: tuple = ()  # Namen aus Checkpoints.params
+    code: tuple = ()
+
+
+def _land_text(ctx):
+    return load_land_text(ctx.pdf_path, ctx.options)
+
+
+def _lines(ctx, land_text):
+    with ctx.metrics.stage("clean_lines"):
+        return clean_lines_from_text(land_text)
+
+
+def _segments(ctx, lines):
+    with ctx.metrics.stage("headings"):
+        headings, alias_map = find_headings(lines)
+    with ctx.metrics.stage("blocks"):
+        blocks = build_blocks(lines, headings)
+    return {"blocks": blocks, "pdfAliases": alias_map}
+
+
+def _parsed(ctx, segments):
+    with ctx.metrics.stage("parse"):
+        records = parse_blocks(segments["blocks"], ctx.metrics)
+    return {"records": records, "pdfAliases": segments["pdfAliases"]}
+
+
+def _output(ctx, parsed):
+    m = ctx.metrics
+    output = dict(parsed["records"])
+    with m.stage("aliases"):
+        alias_map = merge_aliases(parsed["pdfAliases"], ctx.options.manual_aliases)
+        unresolved = {}
+        resolve_aliases(output, alias_map, unresolved)
+    m.count("unresolvedAliases", len(unresolved))
+    with m.stage("cleanup"):
+        return final_cleanup(output)
+
+
+STAGES = {
+    s.name: s
+    for s in [
+        Stage(
+            "land_text",
+            _land_text,
+            params=("pdf", "backend", "extractor"),
+            code=(backends, pdftext, prefilter, LAND_MARKERS, find_land_pages, candidate_pages,
+                  load_land_pages, load_land_text),
+        ),
+        Stage("lines", _lines, ("land_text",), code=(clean_lines_from_text,)),
+        Stage(
+            "segments",
+            _segments,
+            ("lines",),
+            params=("config",),
+            code=(helpers, classify_heading, find_headings, heading_ranges, build_blocks),
+        ),
+        Stage(
+            "parsed",
+            _parsed,
+            ("segments",),
+            params=("config",),
+            code=(helpers, canon, parse_country_raw, build_record, parse_country,
+                  parse_blocks),
+        ),
+        Stage(
+            "output",
+            _output,
+            ("parsed",),
+            params=("manualAliases",),
+            code=(aliases, merge_aliases, iter_alias_records, resolve_aliases, final_cleanup,
+                  BAD_KEYS),
+        ),
+    ]
+}
+
+
+class Checkpoints:
+    """Wertet STAGES vom Ziel her aus; jede Stufe höchstens einmal pro Lauf."""
+
+    def __init__(self, pdf_path, options, cache: StageCache = None, stages: dict = None):
+        self.pdf_path = Path(pdf_path)
+        if not self.pdf_path.exists():
+            raise FileNotFoundError(f"PDF nicht gefunden: {self.pdf_path}")
+        self.options = options
+        self.metrics = stage_metrics(options)
+        self.cache = cache or StageCache(options.checkpoint_dir or DEFAULT_STAGE_DIR)
+        self.stages = stages or STAGES
+        self.pdf_sha = file_sha256(self.pdf_path)
+        self.params = {
+            "pdf": self.pdf_sha,
+            "backend": options.backend,
+            # Einstellungen + Versionen: ein Bibliotheks-Update ändert den Text;
+            # alle Pakete, weil "auto" auf die Referenz zurückfallen kann
+            "extractor": {
+                "settings": backends.get_backend(options.backend).settings(),
+                "versions": backends.library_versions(),
+            },
+            # Reihenfolge zählt (spätere Einträge überschreiben frühere): als Liste
+            "manualAliases": list(options.manual_aliases.items()),
+            "config": config_values(),
+        }
+        self.status = {}  # Stufe -> "hit" | "miss"
+        self._keys = {}
+        self._values = {}
+        self._warnings = {}
+
+    def key(self, name: str) -> str:
+        if name not in self._keys:
+            stage = self.stages[name]
+            self._keys[name] = fingerprint(
+                CHECKPOINT_VERSION,
+                name,
+                [self.key(d) for d in stage.deps],
+                {p: self.params[p] for p in stage.params},
+                fingerprint(stage.run, *stage.code),
+            )
+        return self._keys[name]
+
+    def get(self, name: str):
+        if name in self._values:
+            return self._values[name]
+        key = self.key(name)
+        hit = self.cache.load(self.pdf_sha, name, key)
+        if hit is not None:
+            value, warnings = hit
+            sys.stderr.write(warnings)
+            self.status[name] = "hit"
+            self.metrics.count("checkpointHits")
+        else:
+            stage = self.stages[name]
+            inputs = [self.get(d) for d in stage.deps]
+            tee = _Tee(sys.stderr)
+            with contextlib.redirect_stderr(tee):
+                value = stage.run(self, *inputs)
+            # inkl. der Warnungen der Eingaben: ein Treffer ersetzt den ganzen Vorlauf
+            warnings = "".join(self._warnings[d] for d in stage.deps) + tee.buf.getvalue()
+            self.cache.store(self.pdf_sha, name, key, value, warnings)
+            # wie ein Treffer weiterreichen: JSON-Rundreise, keine geteilten Objekte
+            value = json.loads(json.dumps(value, ensure_ascii=False))
+            self.status[name] = "miss"
+            self.metrics.count("checkpointMisses")
+        self._values[name] = value
+        self._warnings[name] = warnings
+        return value
+
+
+def extract_checkpointed(pdf_path, options) -> dict:
+    cp = Checkpoints(pdf_path, options)
+    output = cp.get("output")
+    cp.metrics.set("checkpoints", dict(cp.status))
+    cp.metrics.set("records", len(output))
+    return output
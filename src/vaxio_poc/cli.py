@@ -0,0 +1,441 @@
+"""
+Kommandozeile:
+
+  vaxio-poc extract EB-14-2025.pdf [-o stiko_all_final.json] [--workers 4] [--stdout]
+  vaxio-poc extract EB-14-2025.pdf --format ndjson --stream -o - | jq -c .countryName
+  vaxio-poc extract EB-14-2026.pdf --state stiko_state.json --report diff.json
+  vaxio-poc extract EB-14-2025.pdf --metrics metrics.json --profile parse
+  vaxio-poc extract EB-14-2025.pdf --compact stiko_compact.json --indexes stiko_indexes.json
+  vaxio-poc extract EB-14-2025.pdf --names stiko_names.json
+  vaxio-poc extract EB-14-2025.pdf --checkpoints
+  vaxio-poc extract EB-14-2025.pdf --sqlite stiko.sqlite --npz stiko_tensor.npz
+  vaxio-poc extract EB-14-2025.pdf --manifest stiko_manifest.json --shards public/stiko
+  vaxio-poc manifest src/data/stiko_all_final.json --check
+  vaxio-poc plans src/data/stiko_all_final.json buchungen.ndjson -o plaene.ndjson
+  vaxio-poc extract Jahresband.pdf --recycle-pages 200 --memory-limit 800 --workers 4
+  vaxio-poc variants EB-14-2025.pdf -d src/data [--only final,plusalias]
+  vaxio-poc batch archiv/ "entwurf/EB-*.pdf" -d out/ --jobs 4
+  vaxio-poc cache info
+  vaxio-poc cache clear [--pdf EB-14-2025.pdf] [--stages]
+
+Schwere Module (pdfplumber, Pipeline) werden erst im jeweiligen Befehl
+importiert, damit z.B. Cache-Befehle in Millisekunden starten.
+"""
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+
+def memory_options(args) -> dict:
+    return {"recycle_pages": args.recycle_pages, "memory_limit_mb": args.memory_limit}
+
+
+def format_memory(values: dict) -> str:
+    peak = values.get("peakRssBytes")
+    peak = f"{peak / 2**20:.0f} MB" if peak else "unbekannt"
+    return (
+        f"Speicher: Peak-RSS {peak}, PDF {values.get('docRecycles', 0)}x neu geöffnet "
+        f"(davon {values.get('limitRecycles', 0)}x wegen Limit)"
+    )
+
+
+def default_output(pdf_path: Path, fmt: str) -> Path:
+    return pdf_path.with_name("stiko_all_final" + (".ndjson" if fmt == "ndjson" else ".json"))
+
+
+def cmd_extract(args) -> int:
+    from .memory import MemoryLimitExceeded
+    from .pipeline import ExtractOptions, extract, write_json
+    from .writer import dump_records
+
+    pdf_path = Path(args.pdf)
+    extras = ("state", "compact", "indexes", "names", "manifest", "shards", "sqlite", "npz")
+    if args.stream and any(getattr(args, name) for name in extras):
+        args.parser.error("--stream geht nur ohne " + "/".join(f"--{name}" for name in extras))
+    if args.stream and args.format != "ndjson":
+        # ein Name kann im Stream mehrfach kommen (späterer gewinnt) – geht nur zeilenweise
+        args.parser.error("--stream geht nur mit --format ndjson")
+    if args.report and not args.state:
+        args.parser.error("--report geht nur mit --state")
+    if args.checkpoints and (args.state or args.stream):
+        # beide Wege laufen an extract() und damit an den Checkpoints vorbei
+        args.parser.error("--checkpoints geht nicht mit --state oder --stream")
+    to_stdout = args.output == "-"
+    # bei -o - gehört stdout allein dem Datensatz
+    status = sys.stderr if to_stdout else sys.stdout
+    budgeted = bool(args.recycle_pages or args.memory_limit)
+    metrics = None
+    if args.metrics or args.profile or budgeted:
+        from .metrics import Metrics
+
+        metrics = Metrics(
+            track_memory=bool(args.metrics),
+            profile=[s for p in args.profile for s in p.split(",")],
+            profile_dir=args.profile_dir,
+        )
+    options = ExtractOptions(
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        workers=args.workers,
+        backend=args.backend,
+        prefilter=not args.no_prefilter,
+        checkpoints=args.checkpoints,
+        metrics=metrics,
+        **memory_options(args),
+    )
+    try:
+        if args.stream:
+            from .stream import stream_extract
+
+            output = stream_extract(pdf_path, options)
+        elif args.state:
+            from .incremental import extract_incremental, format_report
+
+            output, report = extract_incremental(pdf_path, args.state, options)
+            print(format_report(report), file=sys.stderr)
+            if args.report:
+                Path(args.report).write_text(
+                    json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+                )
+        else:
+            output = extract(pdf_path, options)
+        if args.compact or args.npz:
+            from .compact import check_risk_tags
+
+            # vor dem Haupt-JSON: ein Tag ohne Bit soll nicht erst beim Export auffallen
+            try:
+                check_risk_tags(output)
+            except ValueError as e:
+                print(f"❌ Abbruch: {e}", file=sys.stderr)
+                return 2
+
+        # mit --stream laufen Extraktion und Schreiben hier verschränkt
+        out_path = None if to_stdout else Path(args.output or default_output(pdf_path, args.format))
+        with (metrics.stage("write") if metrics else contextlib.nullcontext()):
+            if to_stdout:
+                dump_records(output, sys.stdout, args.format)
+            else:
+                write_json(output, out_path, args.format)
+    except MemoryLimitExceeded as e:
+        print(f"❌ Abbruch: {e}", file=sys.stderr)
+        if metrics:
+            metrics.set("aborted", str(e))
+        return 2
+    finally:
+        # auch beim Abbruch: gerade dann werden die Messwerte gebraucht
+        if budgeted:
+            print(format_memory(metrics.values), file=sys.stderr)
+        if metrics:
+            if args.metrics:
+                metrics.write(args.metrics)
+            metrics.close()
+
+    if out_path is not None:
+        if args.stdout:
+            # Datei zurücklesen statt ein zweites Mal zu serialisieren
+            with open(out_path, encoding="utf-8") as fp:
+                shutil.copyfileobj(fp, sys.stdout)
+            if args.format != "ndjson":
+                print()
+        print(f"\n✅ Gesamt-JSON gespeichert unter: {out_path}", file=status)
+
+    if args.compact:
+        from .compact import write_compact
+
+        print(f"✅ Kompakt-JSON gespeichert unter: {write_compact(output, args.compact)}", file=status)
+    if args.indexes:
+        from .indexes import write_indexes
+
+        print(f"✅ Indizes gespeichert unter: {write_indexes(output, args.indexes)}", file=status)
+    if args.names:
+        from .names import write_name_index
+
+        print(f"✅ Namensindex gespeichert unter: {write_name_index(output, args.names)}", file=status)
+    if args.shards:
+        from .shards import write_shards
+
+        stats = write_shards(output, args.shards)
+        print(
+            f"✅ Shards unter {args.shards}: {stats['written']} geschrieben, "
+            f"{stats['unchanged']} unverändert, {stats['removed']} entfernt",
+            file=status,
+        )
+    if args.sqlite:
+        from .sqlite_export import write_sqlite
+
+        print(f"✅ SQLite gespeichert unter: {write_sqlite(output, args.sqlite)}", file=status)
+    if args.npz:
+        from .tensor import write_tensor
+
+        print(f"✅ Tensor gespeichert unter: {write_tensor(output, args.npz)}", file=status)
+    if args.manifest:
+        from .manifest import build_manifest, format_manifest_diff, load_manifest, write_manifest
+
+        old = load_manifest(args.manifest)
+        print(format_manifest_diff(old, build_manifest(output)), file=status)
+        print(f"✅ Manifest gespeichert unter: {write_manifest(output, args.manifest)}", file=status)
+    return 0
+
+
+def cmd_variants(args) -> int:
+    from .pipeline import ExtractOptions
+    from .profiles import PROFILES, extract_profiles, write_profiles
+
+    pdf_path = Path(args.pdf)
+    names = args.only.split(",") if args.only else list(PROFILES)
+    options = ExtractOptions(
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        workers=args.workers,
+        backend=args.backend,
+        **memory_options(args),
+    )
+    outputs = extract_profiles(pdf_path, names, options)
+    for name, path in write_profiles(outputs, args.out_dir or pdf_path.parent).items():
+        print(f"✅ {name}: {len(outputs[name])} Einträge -> {path}")
+    return 0
+
+
+def cmd_batch(args) -> int:
+    import time
+
+    from .batch import find_inputs, format_summary, run_batch
+    from .pipeline import ExtractOptions
+
+    pdf_paths = find_inputs(args.inputs)
+    if not pdf_paths:
+        print("Keine PDFs gefunden.", file=sys.stderr)
+        return 1
+    options = ExtractOptions(
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        backend=args.backend,
+        **memory_options(args),
+    )
+
+    t0 = time.perf_counter()
+    results = run_batch(pdf_paths, args.out_dir, options, jobs=args.jobs)
+    print(format_summary(results, time.perf_counter() - t0))
+    if args.summary:
+        Path(args.summary).write_text(
+            json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+def load_dataset(path: Path) -> dict:
+    if path.suffix == ".ndjson":
+        from .writer import read_ndjson
+
+        return read_ndjson(path)
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def cmd_manifest(args) -> int:
+    from .manifest import build_manifest, format_manifest_diff, load_manifest, write_manifest
+
+    path = Path(args.dataset)
+    output = load_dataset(path)
+    out_path = Path(args.output) if args.output else path.with_name(path.stem + ".manifest.json")
+    old = load_manifest(out_path)
+    new = build_manifest(output)
+    print(format_manifest_diff(old, new))
+    if args.check:
+        return 0 if old is not None and old["datasetHash"] == new["datasetHash"] else 1
+    print(f"✅ Manifest gespeichert unter: {write_manifest(output, out_path)}")
+    return 0
+
+
+def cmd_plans(args) -> int:
+    import time
+
+    from .plans import PlanMatrix, traveller_inputs
+    from .writer import atomic_write
+
+    path = Path(args.travellers)
+    if path.suffix == ".ndjson":
+        with open(path, encoding="utf-8") as fp:
+            travellers = [json.loads(line) for line in fp if line.strip()]
+    else:
+        travellers = json.loads(path.read_text(encoding="utf-8"))
+
+    t0 = time.perf_counter()
+    batch = PlanMatrix(load_dataset(Path(args.dataset))).evaluate(*traveller_inputs(travellers))
+    elapsed = time.perf_counter() - t0
+
+    with atomic_write(Path(args.output)) if args.output else contextlib.nullcontext(sys.stdout) as fp:
+        for traveller, plan in zip(travellers, batch.plans()):
+            if "id" in traveller:
+                plan = {"id": traveller["id"], **plan}
+            fp.write(json.dumps(plan, ensure_ascii=False, separators=(",", ":")) + "\n")
+    unmatched = sum(m["matchedKey"] is None for plan in batch.matched for m in plan)
+    if unmatched:
+        print(f"[WARN] {unmatched} Reiseziele ohne passendes Land im Datensatz", file=sys.stderr)
+    print(f"✅ {len(batch)} Impfpläne berechnet ({elapsed * 1000:.0f} ms)", file=sys.stderr)
+    return 0
+
+
+def cmd_cache(args) -> int:
+    from .page_cache import DEFAULT_CACHE_DIR, PageTextCache, file_sha256
+
+    if args.stages:
+        from .checkpoints import DEFAULT_STAGE_DIR, StageCache
+
+        cache = StageCache(args.cache_dir or DEFAULT_STAGE_DIR)
+    else:
+        cache = PageTextCache(args.cache_dir or DEFAULT_CACHE_DIR)
+    if args.action == "info":
+        print(json.dumps(cache.stats(), indent=2))
+    else:
+        sha = file_sha256(args.pdf) if args.pdf else None
+        n = cache.invalidate(sha)
+        print(f"{n} Cache-Einträge gelöscht.")
+    return 0
+
+
+def add_memory_arguments(p):
+    p.add_argument(
+        "--recycle-pages",
+        type=int,
+        metavar="N",
+        help="PDF bzw. Worker-Prozess nach N Seiten erneuern (begrenzt den Speicher)",
+    )
+    p.add_argument(
+        "--memory-limit",
+        type=float,
+        metavar="MB",
+        help="RSS-Limit pro Prozess: darüber wird das PDF neu geöffnet, sonst abgebrochen",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="vaxio-poc", description="STIKO-Ländertabelle extrahieren")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("extract", help="PDF -> Länder-JSON")
+    p.add_argument("pdf", help="Epidemiologisches Bulletin (PDF)")
+    p.add_argument(
+        "-o", "--output", help="Zieldatei (Default: stiko_all_final.json neben dem PDF; - = stdout)"
+    )
+    p.add_argument(
+        "--format",
+        default="json",
+        choices=["json", "compact", "ndjson"],
+        help="json (indent=2), compact (ohne Einrückung) oder ndjson (ein Land pro Zeile)",
+    )
+    p.add_argument("--stdout", action="store_true", help="Datensatz zusätzlich auf stdout ausgeben")
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help="Länder schreiben, sobald sie geparst sind (nur --format ndjson, ohne Zusatzausgaben)",
+    )
+    p.add_argument("--workers", type=int, default=1, help="Prozesse für die Seitenextraktion")
+    p.add_argument("--no-cache", action="store_true", help="Seitentext-Cache nicht benutzen")
+    p.add_argument("--cache-dir", help="Cache-Verzeichnis")
+    p.add_argument(
+        "--backend",
+        default="auto",
+        choices=["auto", "pdfplumber", "pdfium", "pdfminer"],
+        help="Text-Backend (auto: schnellstes, gegen pdfplumber geprüft)",
+    )
+    add_memory_arguments(p)
+    p.add_argument(
+        "--no-prefilter", action="store_true", help="alle Seiten extrahieren statt Vorfilter (prefilter.py)"
+    )
+    p.add_argument(
+        "--checkpoints",
+        action="store_true",
+        help="Zwischenergebnisse pro Stufe cachen: Alias-Änderungen parsen das PDF nicht neu "
+        "(nicht mit --state/--stream)",
+    )
+    p.add_argument("--state", help="State-Datei: nur geänderte Länderblöcke neu parsen")
+    p.add_argument("--report", help="Änderungsreport (JSON) schreiben, nur mit --state")
+    p.add_argument("--compact", help="zusätzlich kompaktes Spaltenformat (compact.py) schreiben")
+    p.add_argument("--indexes", help="zusätzlich invertierte Indizes (Impfstoff/Risiko-Tag) schreiben")
+    p.add_argument("--names", help="zusätzlich Namensindex (exakt/Präfix/Trigramm) schreiben")
+    p.add_argument("--shards", help="zusätzlich eine Datei pro Land + index.json in dieses Verzeichnis")
+    p.add_argument("--sqlite", help="zusätzlich SQLite-Datenbank (normalisierte Tabellen) schreiben")
+    p.add_argument("--npz", help="zusätzlich Tensor Land × Impfstoff × Ebene als .npz (numpy)")
+    p.add_argument("--manifest", help="Manifest mit Content-Hash pro Land schreiben (und Änderungen melden)")
+    p.add_argument("--metrics", help="Zeit/CPU/Speicher/Zähler pro Stufe als JSON schreiben")
+    p.add_argument(
+        "--profile",
+        action="append",
+        default=[],
+        metavar="STUFE",
+        help="Stufe unter cProfile laufen lassen (mehrfach oder kommagetrennt), "
+        "z.B. extract_pages, parse, aliases",
+    )
+    p.add_argument("--profile-dir", help="cProfile-Dumps (.prof/.txt) hierhin statt auf stderr")
+    p.set_defaults(func=cmd_extract, parser=p)
+
+    p = sub.add_parser("variants", help="PDF einmal parsen -> alle Datensatz-Varianten")
+    p.add_argument("pdf", help="Epidemiologisches Bulletin (PDF)")
+    p.add_argument("-d", "--out-dir", help="Zielverzeichnis (Default: neben dem PDF)")
+    p.add_argument("--only", help="kommagetrennte Profile (Default: alle aus profiles.PROFILES)")
+    p.add_argument("--workers", type=int, default=1, help="Prozesse für die Seitenextraktion")
+    p.add_argument("--no-cache", action="store_true", help="Seitentext-Cache nicht benutzen")
+    p.add_argument("--cache-dir", help="Cache-Verzeichnis")
+    p.add_argument(
+        "--backend",
+        default="auto",
+        choices=["auto", "pdfplumber", "pdfium", "pdfminer"],
+        help="Text-Backend (auto: schnellstes, gegen pdfplumber geprüft)",
+    )
+    add_memory_arguments(p)
+    p.set_defaults(func=cmd_variants)
+
+    p = sub.add_parser("batch", help="viele PDFs parallel -> je ein Länder-JSON")
+    p.add_argument("inputs", nargs="+", help="PDF-Dateien, Verzeichnisse oder Globs")
+    p.add_argument("-d", "--out-dir", default=".", help="Zielverzeichnis")
+    p.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="parallele Prozesse")
+    p.add_argument("--no-cache", action="store_true", help="Seitentext-Cache nicht benutzen")
+    p.add_argument("--cache-dir", help="Cache-Verzeichnis")
+    p.add_argument(
+        "--backend",
+        default="auto",
+        choices=["auto", "pdfplumber", "pdfium", "pdfminer"],
+        help="Text-Backend (auto: schnellstes, gegen pdfplumber geprüft)",
+    )
+    add_memory_arguments(p)
+    p.add_argument("--summary", help="Übersicht zusätzlich als JSON schreiben")
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser("manifest", help="Content-Hashes pro Land für einen fertigen Datensatz")
+    p.add_argument("dataset", help="Datensatz (.json oder .ndjson)")
+    p.add_argument("-o", "--output", help="Manifest (Default: <datensatz>.manifest.json daneben)")
+    p.add_argument(
+        "--check", action="store_true", help="nur vergleichen; Exit-Code 1, wenn sich etwas geändert hat"
+    )
+    p.set_defaults(func=cmd_manifest)
+
+    p = sub.add_parser("plans", help="Impfpläne für viele Reisende auf einmal (numpy)")
+    p.add_argument("dataset", help="Datensatz (.json oder .ndjson)")
+    p.add_argument(
+        "travellers",
+        help='Reisende (.json-Liste oder .ndjson): {"countries", "riskTags"} oder {"questionnaire"}',
+    )
+    p.add_argument("-o", "--output", help="Pläne als NDJSON (Default: stdout)")
+    p.set_defaults(func=cmd_plans)
+
+    p = sub.add_parser("cache", help="Seitentext-Cache verwalten")
+    p.add_argument("action", choices=["info", "clear"])
+    p.add_argument("--pdf", help="nur Einträge dieses PDFs löschen")
+    p.add_argument("--stages", action="store_true", help="Stufen-Checkpoints statt Seitentexte")
+    p.add_argument("--cache-dir", help="Cache-Verzeichnis")
+    p.set_defaults(func=cmd_cache)
+
+    return ap
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Kompaktes, spaltenorientiertes Ausgabeformat.
+
+  data = to_compact(output)             # dict, json.dumps-fähig
+  output == from_compact(data)          # verlustfrei
+
+Aufbau (alle Listen parallel zu "countries"):
+
+  vaccines            Impfstoff-Namen, jeder genau einmal
+  countries           Länder-Keys in Ausgabereihenfolge
+  aliasOf             Index des Ziellandes oder -1
+  entryAlways         [[vaccine_id, ...], ...]
+  entryConditional    [[vaccine_id, ...], ...]
+  forAll              [[vaccine_id, ...], ...]
+  ifRiskVaccine       [[vaccine_id, ...], ...]
+  ifRiskMask          [[bitmaske, ...], ...]   Bit (tag - 1) für riskTag 1–9
+
+Aliase, deren Daten exakt denen des Ziellandes entsprechen, haben leere
+Spalten und werden beim Expandieren aus dem Zielland befüllt. Das Legacy-Feld
+entryRequirements wird nicht gespeichert, sondern aus Always + Conditional
+abgeleitet (wie in parse_country). Ein Abgleich gegen aktive Risiko-Tags ist
+damit ein einziges (mask & aktiv) statt eines includes()-Scans.
+"""
+import json
+from pathlib import Path
+
+from .helpers import dedup_keep_order
+from .writer import write_text_atomic
+
+COMPACT_FORMAT = "vaxio-compact"
+COMPACT_VERSION = 1
+RISK_TAGS = range(1, 10)
+_COLUMNS = ["entryAlways", "entryConditional", "forAll", "ifRiskVaccine", "ifRiskMask"]
+
+
+def risk_mask(tags) -> int:
+    """[1, 3, 8] -> 0b010000101"""
+    mask = 0
+    for t in tags:
+        if t not in RISK_TAGS:
+            raise ValueError(f"riskTag außerhalb 1–9: {t}")
+        mask |= 1 << (t - 1)
+    return mask
+
+
+def check_risk_tags(output: dict):
+    """
+    ValueError, wenn ein riskTag keine Bitposition hat. Vor dem Schreiben
+    prüfen: Kompaktformat und Tensor können solche Tags nicht abbilden.
+    """
+    for name, rec in output.items():
+        for item in rec.get("recommendedIfRisk") or []:
+            unknown = [t for t in item["riskTags"] if t not in RISK_TAGS]
+            if unknown:
+                raise ValueError(
+                    f"riskTag außerhalb 1–9: {name} -> {item['vaccine']}: {unknown}"
+                )
+
+
+def mask_tags(mask: int) -> list:
+    return [t for t in RISK_TAGS if mask & (1 << (t - 1))]
+
+
+def record_payload(record: dict) -> dict:
+    """Record ohne countryName/aliasOf – die eigentlichen Impfdaten."""
+    return {k: v for k, v in record.items() if k not in ("countryName", "aliasOf")}
+
+
+def to_compact(output: dict) -> dict:
+    check_risk_tags(output)
+    vaccines, vaccine_ids = [], {}
+
+    def vid(name):
+        i = vaccine_ids.get(name)
+        if i is None:
+            i = vaccine_ids[name] = len(vaccines)
+            vaccines.append(name)
+        return i
+
+    countries = list(output)
+    index = {name: i for i, name in enumerate(countries)}
+    data = {"format": COMPACT_FORMAT, "version": COMPACT_VERSION, "vaccines": vaccines,
+            "countries": countries, "aliasOf": []}
+    for col in _COLUMNS:
+        data[col] = []
+
+    for name, rec in output.items():
+        target = rec.get("aliasOf")
+        target_i = index.get(target, -1) if target is not None else -1
+        data["aliasOf"].append(target_i)
+        if target_i >= 0 and record_payload(rec) == record_payload(output[target]):
+            for col in _COLUMNS:
+                data[col].append([])
+            continue
+        if target is not None and target_i < 0:
+            raise ValueError(f"aliasOf zeigt auf fehlendes Land: {name} -> {target}")
+
+        data["entryAlways"].append([vid(v) for v in rec["entryRequirementsAlways"]])
+        data["entryConditional"].append([vid(v) for v in rec["entryRequirementsConditional"]])
+        data["forAll"].append([vid(v) for v in rec["recommendedForAll"]])
+        data["ifRiskVaccine"].append([vid(x["vaccine"]) for x in rec["recommendedIfRisk"]])
+        data["ifRiskMask"].append([risk_mask(x["riskTags"]) for x in rec["recommendedIfRisk"]])
+    return data
+
+
+def _expand_row(data: dict, i: int) -> dict:
+    vaccines = data["vaccines"]
+    always = [vaccines[v] for v in data["entryAlways"][i]]
+    conditional = [vaccines[v] for v in data["entryConditional"][i]]
+    return {
+        "entryRequirementsAlways": always,
+        "entryRequirementsConditional": conditional,
+        "entryRequirements": dedup_keep_order(always + conditional),
+        "recommendedForAll": [vaccines[v] for v in data["forAll"][i]],
+        "recommendedIfRisk": [
+            {"vaccine": vaccines[v], "riskTags": mask_tags(m)}
+            for v, m in zip(data["ifRiskVaccine"][i], data["ifRiskMask"][i])
+        ],
+    }
+
+
+def from_compact(data: dict) -> dict:
+    """Kompaktformat -> {Landname: Datensatz} wie extract()."""
+    if data.get("format") != COMPACT_FORMAT or data.get("version") != COMPACT_VERSION:
+        raise ValueError("kein vaxio-compact v1")
+    countries = data["countries"]
+    output = {}
+    for i, name in enumerate(countries):
+        target_i = data["aliasOf"][i]
+        src, seen = i, {i}
+        # Referenz-Zeilen (leere Spalten) bis zu einer Zeile mit Daten folgen
+        while not any(data[col][src] for col in _COLUMNS) and data["aliasOf"][src] not in seen | {-1}:
+            src = data["aliasOf"][src]
+            seen.add(src)
+        row = _expand_row(data, src)
+        record = {"countryName": name}
+        record.update(row)
+        if target_i >= 0:
+            record["aliasOf"] = countries[target_i]
+        output[name] = record
+    return output
+
+
+def write_compact(output: dict, out_path) -> Path:
+    out_path = Path(out_path)
+    write_text_atomic(
+        json.dumps(to_compact(output), ensure_ascii=False, separators=(",", ":")),
+        out_path,
+    )
+    return out_path
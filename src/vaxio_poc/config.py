@@ -0,0 +1,162 @@
+"""
+Konfiguration der Extraktion: Impfstoff-Kanonisierung und manuelle Aliase.
+"""
+
+# ======================
+# STIKO-Reiseimpf-Set + Varianten zum "Sauberziehen" der Bullet-Zeilen
+# ======================
+VACCINE_CANON = {
+    "altersentsprechende grundimmunisierung gemäß aktueller stiko":
+        "Altersentsprechende Grundimmunisierung gemäß aktueller STIKO",
+    "mmr/mmr-v": "MMR/MMR-V",
+    "mmr": "MMR/MMR-V",
+    "poliomyelitis": "Poliomyelitis",
+    "tdap": "TDaP/Tdap",
+    "tdap/tdap": "TDaP/Tdap",
+    "tdap/tdap (tdap)": "TDaP/Tdap",
+    "tda p/tdap": "TDaP/Tdap",
+    "tda p": "TDaP/Tdap",
+    "t dap/tdap": "TDaP/Tdap",
+    "tollwut": "Tollwut",
+    "typhus": "Typhus",
+    "hepatitis a": "Hepatitis A",
+    "hepatitis b": "Hepatitis B",
+    "gelbfieber": "Gelbfieber",
+    "cholera": "Cholera",
+    "influenza": "Influenza",
+    "tbe (fsme-impfung)": "TBE (FSME-Impfung)",
+    "fsme": "TBE (FSME-Impfung)",
+    "tbe": "TBE (FSME-Impfung)",
+    "meningokokken-acwy": "Meningokokken-ACWY",
+    "meningokokken acwy": "Meningokokken-ACWY",
+    "japanische enzephalitis": "Japanische Enzephalitis",
+    "japan. enzephalitis": "Japanische Enzephalitis",
+    "dengue": "Dengue",
+    "covid-19": "COVID-19",
+    "sars-cov-2": "COVID-19",
+}
+
+# Pfeile vor "s." in Alias-Zeilen ("Bali ► s. Indonesien"), werden zu Leerzeichen
+ALIAS_MARKERS = ("→", "", "⇨", "►")
+
+# ======================
+# MANUELLE ALIASE (aus NL-Webseitenliste / Kombi-Keys)
+# ======================
+# Format: "Alias-Seitentitel": "STIKO-Target-Key"
+MANUAL_ALIAS_MAP = {
+    # Kombi-Keys aus STIKO
+    "Chile": "Chile – inkl. Osterinsel",
+    "Osterinsel": "Chile – inkl. Osterinsel",
+    "Paaseiland": "Chile – inkl. Osterinsel",
+
+    "Ecuador": "Ecuador – inkl. Galapagos",
+    "Galapagos": "Ecuador – inkl. Galapagos",
+    "Galapagosinseln": "Ecuador – inkl. Galapagos",
+    "Galapagoseilanden": "Ecuador – inkl. Galapagos",
+
+    "Portugal": "Portugal inkl. Azoren und Madeira",
+
+    # Kurznamen ohne Klammer-Qualifier
+    "Tonga": "Tonga (Polynesien)",
+    "Tokelau": "Tokelau (NZL)",
+    "Ost-Timor": "Timor-Leste (Ost-Timor)",
+
+    # USA-Shortcuts
+    "USA": "Vereinigte Staaten von Amerika (USA)",
+    "Vereinigte Staaten": "Vereinigte Staaten von Amerika (USA)",
+    "United States": "Vereinigte Staaten von Amerika (USA)",
+
+    # Optional – falls ihr diese Seitennamen verwendet
+    "Tasmanien": "Australien",
+    "Korallensee-Inseln": "Australien",
+}
+
+
+# ======================
+# VARIANTEN DER ALTEN SKRIPTE (stiko_poc.py / stiko_poc_mitalias.py)
+# ======================
+# Kanonisierung wie in den alten Skripten: Tdap statt TDaP/Tdap
+VACCINE_CANON_LEGACY = {
+    "altersentsprechende grundimmunisierung gemäß aktueller stiko":
+        "Altersentsprechende Grundimmunisierung gemäß aktueller STIKO",
+    "mmr/mmr-v": "MMR/MMR-V",
+    "mmr": "MMR/MMR-V",
+    "poliomyelitis": "Poliomyelitis",
+    "tdap": "Tdap",
+    "tdap/tdap": "Tdap",
+    "tdap/tdap (tdap)": "Tdap",
+    "tdap/tdap (tdap/t).": "Tdap",
+    "tda p/tdap": "TDaP/Tdap",
+    "tda p": "TDaP/Tdap",
+    "t dap/tdap": "TDaP/Tdap",
+    "tollwut": "Tollwut",
+    "typhus": "Typhus",
+    "hepatitis a": "Hepatitis A",
+    "hepatitis b": "Hepatitis B",
+    "gelbfieber": "Gelbfieber",
+    "cholera": "Cholera",
+    "influenza": "Influenza",
+    "tbe (fsme-impfung)": "TBE (FSME-Impfung)",
+    "fsme": "TBE (FSME-Impfung)",
+    "tbe": "TBE (FSME-Impfung)",
+    "meningokokken-acwy": "Meningokokken-ACWY",
+    "meningokokken acwy": "Meningokokken-ACWY",
+    "japanische enzephalitis": "Japanische Enzephalitis",
+    "japan. enzephalitis": "Japanische Enzephalitis",
+    "dengue": "Dengue",
+    "covid-19": "COVID-19",
+    "sars-cov-2": "COVID-19",
+}
+
+# die alten Skripte kannten "►" nicht
+ALIAS_MARKERS_LEGACY = ("→", "", "⇨")
+
+# Manuelle Aliase für eure extra Regions-/Insel-Seiten (stiko_poc_mitalias.py).
+# Diese werden zusätzlich zu STIKO-"siehe"-Aliasen übernommen und überschreiben sie.
+MANUAL_ALIASES = {
+    # UAE Emirate -> VAE
+    "Abu Dhabi": "Vereinigte Arabische Emirate",
+    "Dubai": "Vereinigte Arabische Emirate",
+    "Fujairah": "Vereinigte Arabische Emirate",
+    "Ras al-Khaimah": "Vereinigte Arabische Emirate",
+    "Sharjah": "Vereinigte Arabische Emirate",
+    "Umm al Qawain": "Vereinigte Arabische Emirate",
+
+    # Portugal-Inseln -> Portugal inkl. Azoren/Madeira
+    "Madeira": "Portugal inkl. Azoren und Madeira",
+    "Azoren": "Portugal inkl. Azoren und Madeira",
+
+    # Indonesien-Regionen
+    "Kalimantan": "Indonesien",
+
+    # NL Karibik einzeln -> STIKO-Kombi-Key
+    "Aruba": "Aruba, Bonaire (besondere Gemeinde der NLD), Curacao",
+    "Bonaire": "Aruba, Bonaire (besondere Gemeinde der NLD), Curacao",
+    "Curaçao": "Aruba, Bonaire (besondere Gemeinde der NLD), Curacao",
+
+    # Sint Eustatius / Sint Maarten einzeln -> STIKO-Kombi-Key
+    "Sint Eustatius": "Sint Eustatius (bes. Gemeinde der NLD), Sint Maarten (NLD)",
+    "Sint Maarten": "Sint Eustatius (bes. Gemeinde der NLD), Sint Maarten (NLD)",
+
+    # UK Crown Dependencies -> UK
+    "Guernsey": "Großbritannien (GBR) und Nordirland",
+    "Jersey": "Großbritannien (GBR) und Nordirland",
+    "Isle of Man": "Großbritannien (GBR) und Nordirland",
+
+    # China Sonderregionen
+    "Hongkong": "China",
+    "Macau": "China",
+    "Tibet": "China",
+
+    # USA Unterregionen
+    "Hawaï": "Vereinigte Staaten von Amerika (USA)",
+    "Wake Island": "Vereinigte Staaten von Amerika (USA)",
+
+    # Australien Unterregionen
+    "Tasmanië": "Australien",
+    "Koraalzee-eilanden": "Australien",
+
+    # optional/klein
+    "Aland": "Finnland",
+    "Faeröer": "Färöer-Inseln (Dänemark)",
+}
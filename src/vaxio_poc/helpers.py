@@ -0,0 +1,251 @@
+"""
+Reine Text-Helfer der STIKO-Extraktion (ohne PDF-Abhängigkeit).
+"""
+import re
+import unicodedata
+
+from .canon import CanonMatcher
+from .config import ALIAS_MARKERS, VACCINE_CANON
+
+VACCINE_MATCHER = CanonMatcher(VACCINE_CANON)
+
+# ======================
+# HELPERS
+# ======================
+
+def norm(s: str) -> str:
+    """ASCII-normalisiert, lowercased – gut für Vergleiche."""
+    return (
+        unicodedata.normalize("NFKD", s)
+        .encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+    )
+
+
+_ALPHA_SEP_NON_LETTERS = re.compile(r"[^A-Za-zÄÖÜäöüß]")
+
+HEADING_BAD_MARKERS = [
+    "Nachweispflicht",
+    "Impfungen bei",
+    "Impfungen für alle",
+    "Reisenden",
+    "Risiken",
+    "Tabelle",
+    "Aufbau",
+    "Disclaimer",
+    "Name des Landes",
+]
+_HEADING_BAD_RE = re.compile("|".join(re.escape(m) for m in HEADING_BAD_MARKERS))
+_DIGIT_RE = re.compile(r"\d")
+_HEADING_START_RE = re.compile(r"[A-ZÄÖÜ]")
+
+
+def looks_like_alpha_separator(line: str) -> bool:
+    """Filtert PDF-Layout-Alpha-Trenner wie 'B · C'."""
+    letters_only = _ALPHA_SEP_NON_LETTERS.sub("", line)
+    if 1 <= len(letters_only) <= 3 and letters_only.upper() == letters_only:
+        return True
+    return False
+
+
+def is_heading_candidate(line: str) -> bool:
+    """Heuristik: ist diese Zeile wahrscheinlich ein Ländername?"""
+    # Reine Ausschluss-Kriterien: billige Checks zuerst, das Ergebnis hängt
+    # nicht von der Reihenfolge ab.
+    if len(line) <= 2 or len(line) > 60:
+        return False
+    if not _HEADING_START_RE.match(line):
+        return False
+    if _DIGIT_RE.search(line):
+        return False
+    if line.isupper() and len(line) > 10:  # z.B. ELLEBATREDNÄL
+        return False
+    if _HEADING_BAD_RE.search(line):
+        return False
+    if looks_like_alpha_separator(line):
+        return False
+    return True
+
+
+def extract_alias(line: str, markers=ALIAS_MARKERS):
+    """
+    Erfasst Zeilen wie:
+      'Bali  s. Indonesien'
+      'Kanarische Inseln (Spanien) s. Spanien'
+    Gibt (alias, target) oder None zurück.
+    """
+    cleaned = line
+    for marker in markers:
+        cleaned = cleaned.replace(marker, " ")
+    m = re.search(
+        r"^(.*?)\s+(?:s\.|siehe)\s+(.*)$", cleaned, flags=re.IGNORECASE
+    )
+    if not m:
+        return None
+    alias = m.group(1).strip()
+    target = m.group(2).strip()
+    if alias and target:
+        return alias, target
+    return None
+
+
+def canonical_vaccine_from_line(line: str, matcher: CanonMatcher = VACCINE_MATCHER):
+    return matcher.lookup(norm(line))
+
+
+def cleanup_vaccine(raw: str, matcher: CanonMatcher = VACCINE_MATCHER) -> str:
+    """Rohtext → kanonisierter Impfstoffname."""
+    raw = raw.strip().replace("*", "")
+    canon = canonical_vaccine_from_line(raw, matcher)
+    if canon:
+        return canon
+
+    # Inhalte nach typischen Trennern kappen
+    cut_markers = [" Nicht ", " nur ", " außer ", "inkl.", " inkl.", " > ", " – "]
+    for cm in cut_markers:
+        idx = raw.find(cm)
+        if idx > 0:
+            raw = raw[:idx].strip()
+
+    # Auch hinter Punkt/Strichpunkt nur den ersten Teil
+    raw = re.split(r"[.;]", raw)[0].strip()
+    return raw
+
+
+def dedup_keep_order(items):
+    seen = set()
+    out = []
+    for it in items:
+        k = norm(it)
+        if k not in seen:
+            seen.add(k)
+            out.append(it)
+    return out
+
+
+def extract_bullets_raw(section_text: str):
+    """
+    Holt alle ▶-Bullets und extrahiert:
+      - Impfstoff-Rohtext (noch nicht kanonisiert)
+      - Risk-Tags (Liste von ints)
+    Gibt [(roh, riskTags)] zurück.
+    """
+    items = []
+    parts = section_text.split("▶")[1:]  # vor dem ersten ▶ steht Überschrift etc.
+
+    for part in parts:
+        first_line = part.strip().splitlines()[0].strip().replace("*", "")
+
+        if not re.search(r"\d", first_line):
+            # Kein Risikotag in der Zeile
+            vaccine_raw = first_line.split("  ")[0].split(":")[0].strip()
+            risk_tags = []
+        else:
+            first_digit_idx = re.search(r"\d", first_line).start()
+            vaccine_raw = first_line[:first_digit_idx].strip()
+
+            rest = first_line[first_digit_idx:]
+            m = re.match(r"^(\d[\d,\s]*)", rest)
+            risk_cluster = m.group(1) if m else ""
+            risk_cluster = re.sub(r"\s+", "", risk_cluster)
+            risk_tags = sorted(set(int(x) for x in re.findall(r"\d", risk_cluster)))
+
+        items.append((vaccine_raw, risk_tags))
+    return items
+
+
+def extract_bullets(section_text: str, matcher: CanonMatcher = VACCINE_MATCHER):
+    """[{vaccine, riskTags}] mit kanonisierten Impfstoffnamen."""
+    return [
+        {"vaccine": cleanup_vaccine(raw, matcher), "riskTags": tags}
+        for raw, tags in extract_bullets_raw(section_text)
+    ]
+
+
+# Typische Phrasen für bedingte Nachweispflicht
+CONDITIONAL_ENTRY_MARKERS = [
+    "bei einreise aus",
+    "bei einreisen aus",
+    "bei einreise aus einem",
+    "bei einreise aus bestimmten",
+    "bei einreise aus landern",
+    "bei einreise aus einem land",
+    "bei transit uber",
+    "bei transit über",
+]
+
+
+def extract_entry_requirements_raw(section_text: str):
+    """
+    Nachweispflichten in Textreihenfolge als [(roh, bedingt)]; bedingt =
+    nur 'bei Einreise aus ...' / Transit etc.
+    """
+    entries = []
+
+    for line in section_text.splitlines():
+        if "Nachweispflicht" not in line:
+            continue
+
+        ln_norm = norm(line)
+        is_conditional = any(mark in ln_norm for mark in CONDITIONAL_ENTRY_MARKERS)
+
+        # Impfstoff vor dem ':' vor 'Nachweispflicht' herausziehen
+        for m in re.finditer(
+            r"([A-Za-zÄÖÜäöüß\-\.\s()/]+?):\s*Nachweispflicht", line
+        ):
+            entries.append((m.group(1).strip(), is_conditional))
+
+    return entries
+
+
+def extract_entry_requirements(section_text: str, matcher: CanonMatcher = VACCINE_MATCHER):
+    """
+    Unterscheidet:
+      - always: Nachweispflicht generell
+      - conditional: Nachweispflicht nur 'bei Einreise aus ...' / Transit etc.
+    """
+    always = []
+    conditional = []
+
+    for raw, is_conditional in extract_entry_requirements_raw(section_text):
+        canon = cleanup_vaccine(raw, matcher)
+        if not canon:
+            continue
+        if is_conditional:
+            conditional.append(canon)
+        else:
+            always.append(canon)
+
+    return {
+        "always": dedup_keep_order(always),
+        "conditional": dedup_keep_order(conditional),
+    }
+
+
+def split_into_sections(block_text: str):
+    """
+    Teilt einen Länder-Block in:
+      - entryRequirements
+      - ifRisk
+      - forAll
+    anhand der Marker 'Nachweispflicht', 'Impfungen bei', 'Impfungen für alle'.
+    """
+    markers = [
+        ("entryRequirements", "Nachweispflicht"),
+        ("ifRisk", "Impfungen bei"),
+        ("forAll", "Impfungen für alle"),
+    ]
+
+    spans = []
+    for key, mark in markers:
+        m = re.search(mark, block_text)
+        if m:
+            spans.append((m.start(), key))
+
+    spans.sort()
+    sections = {}
+    for i, (start, key) in enumerate(spans):
+        end = spans[i + 1][0] if i + 1 < len(spans) else len(block_text)
+        sections[key] = block_text[start:end]
+    return sections
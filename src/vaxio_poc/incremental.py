@@ -0,0 +1,158 @@
+"""
+Inkrementelle Extraktion über Bulletin-Ausgaben hinweg.
+
+  output, report = extract_incremental("EB-14-2026.pdf", "stiko_state.json")
+
+Jeder Länderblock bekommt einen Fingerprint (SHA-256 des Blocktexts plus die
+Seiten, über die er sich erstreckt). Nur Blöcke, deren Text sich gegenüber
+dem letzten Lauf geändert hat, werden neu geparst; für alle anderen wird der
+gespeicherte Record übernommen. Aliase und Cleanup laufen danach wie immer.
+
+Der State enthält außerdem einen Hash des Parser-Codes und der Kanonisierung
+– ändert sich der, wird alles neu geparst.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .helpers import VACCINE_MATCHER
+from .metrics import NULL_METRICS
+from .pipeline import (
+    ExtractOptions,
+    clean_lines_with_pages,
+    count_canon_cache,
+    final_cleanup,
+    find_headings,
+    heading_ranges,
+    load_land_pages,
+    merge_aliases,
+    parse_country,
+    resolve_aliases,
+    stage_metrics,
+)
+
+STATE_VERSION = 1
+_PARSER_SOURCES = ["helpers.py", "canon.py", "config.py", "pipeline.py"]
+
+
+def parser_fingerprint() -> str:
+    """Hash über den Quelltext, der parse_country bestimmt."""
+    h = hashlib.sha256()
+    here = Path(__file__).parent
+    for name in _PARSER_SOURCES:
+        h.update((here / name).read_bytes())
+    return h.hexdigest()
+
+
+def block_fingerprint(block_text: str) -> str:
+    return hashlib.sha256(block_text.encode("utf-8")).hexdigest()
+
+
+def load_state(state_path) -> dict:
+    try:
+        state = json.loads(Path(state_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if state.get("version") != STATE_VERSION or state.get("parser") != parser_fingerprint():
+        return {}
+    return state
+
+
+def save_state(state_path, state: dict):
+    state_path = Path(state_path)
+    tmp = state_path.with_name(state_path.name + ".tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, state_path)
+
+
+def segment_with_pages(clean_lines: list, line_pages: list):
+    """Gibt (blocks, pages, alias_map) zurück; pages[name] = [erste, letzte Seite]."""
+    headings, alias_map = find_headings(clean_lines)
+    blocks, pages = {}, {}
+    for start, end, name in heading_ranges(headings, len(clean_lines)):
+        blocks[name] = "\n".join(clean_lines[start:end])
+        pages[name] = [line_pages[start], line_pages[end - 1]]
+    return blocks, pages, alias_map
+
+
+def parse_blocks_incremental(blocks: dict, pages: dict, previous: dict, metrics=NULL_METRICS):
+    """
+    Parst nur geänderte/neue Blöcke.
+    Rückgabe: (output, neue State-Blöcke, report)
+    """
+    old_blocks = previous.get("blocks", {})
+    output, state_blocks = {}, {}
+    report = {"added": [], "changed": [], "removed": [], "moved": [], "unchanged": 0}
+    before = VACCINE_MATCHER.cache_info()
+
+    for name, text in blocks.items():
+        fp = block_fingerprint(text)
+        old = old_blocks.get(name)
+        if old is not None and old["sha256"] == fp:
+            record = old["record"]
+            report["unchanged"] += 1
+            if old["pages"] != pages[name]:
+                report["moved"].append(name)
+        else:
+            record = parse_country(name, text, metrics)
+            report["added" if old is None else "changed"].append(name)
+        output[name] = record
+        state_blocks[name] = {"sha256": fp, "pages": pages[name], "record": record}
+
+    report["removed"] = [name for name in old_blocks if name not in blocks]
+    report["reparsed"] = len(report["added"]) + len(report["changed"])
+    count_canon_cache(metrics, before)
+    return output, state_blocks, report
+
+
+def extract_incremental(pdf_path, state_path, options: ExtractOptions = None):
+    """
+    Wie extract(), aber mit Wiederverwendung unveränderter Blöcke aus
+    state_path. Der State wird danach aktualisiert.
+    Rückgabe: (output, report)
+    """
+    options = options or ExtractOptions()
+    m = stage_metrics(options)
+    previous = load_state(state_path)
+
+    land_pages = load_land_pages(pdf_path, options)
+    with m.stage("clean_lines"):
+        clean_lines, line_pages = clean_lines_with_pages(land_pages)
+    with m.stage("segment"):
+        blocks, pages, alias_map = segment_with_pages(clean_lines, line_pages)
+    with m.stage("parse"):
+        output, state_blocks, report = parse_blocks_incremental(blocks, pages, previous, m)
+    m.set("lines", len(clean_lines))
+    m.set("countries", len(blocks))
+    m.set("reparsed", report["reparsed"])
+
+    # gespeichert werden die geparsten Records vor Alias-Kopien und Cleanup
+    save_state(
+        state_path,
+        {
+            "version": STATE_VERSION,
+            "parser": parser_fingerprint(),
+            "pdf": Path(pdf_path).name,
+            "blocks": state_blocks,
+        },
+    )
+
+    with m.stage("aliases"):
+        alias_map = merge_aliases(alias_map, options.manual_aliases)
+        unresolved = {}
+        resolve_aliases(output, alias_map, unresolved)
+    m.count("unresolvedAliases", len(unresolved))
+    with m.stage("cleanup"):
+        output = final_cleanup(output)
+    return output, report
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"neu geparst: {report['reparsed']}, übernommen: {report['unchanged']}",
+    ]
+    for key, label in [("added", "neu"), ("changed", "geändert"), ("removed", "entfallen")]:
+        if report[key]:
+            lines.append(f"  {label} ({len(report[key])}): " + ", ".join(report[key]))
+    return "\n".join(lines)
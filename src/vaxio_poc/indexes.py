@@ -0,0 +1,58 @@
+"""
+Invertierte Indizes über den Länder-Datensatz.
+
+  idx = build_indexes(output)
+  idx["vaccines"]["Gelbfieber"]["always"]   -> Länder mit Nachweispflicht
+  idx["riskTags"]["6"]                      -> [[Land, Impfstoff], ...]
+
+vaccines: Impfstoff -> {always, conditional, forAll, ifRisk} mit Länder-Keys
+(inkl. Aliase, da Konsumenten auch über Alias-Namen nachschlagen).
+riskTags: Tag (als String, JSON-Key) -> (Land, Impfstoff)-Paare aus
+recommendedIfRisk. Reihenfolge jeweils wie im Datensatz.
+"""
+import json
+from pathlib import Path
+
+from .writer import write_text_atomic
+
+VACCINE_CATEGORIES = {
+    "always": "entryRequirementsAlways",
+    "conditional": "entryRequirementsConditional",
+    "forAll": "recommendedForAll",
+}
+
+
+def build_indexes(output: dict) -> dict:
+    vaccines = {}
+    risk_tags = {}
+
+    def bucket(vaccine):
+        b = vaccines.get(vaccine)
+        if b is None:
+            b = vaccines[vaccine] = {"always": [], "conditional": [], "forAll": [], "ifRisk": []}
+        return b
+
+    for country, rec in output.items():
+        for category, field in VACCINE_CATEGORIES.items():
+            for v in rec.get(field, []):
+                bucket(v)[category].append(country)
+
+        seen = set()
+        for item in rec.get("recommendedIfRisk", []):
+            v = item["vaccine"]
+            if v not in seen:
+                seen.add(v)
+                bucket(v)["ifRisk"].append(country)
+            for t in item["riskTags"]:
+                risk_tags.setdefault(str(t), []).append([country, v])
+
+    return {
+        "vaccines": vaccines,
+        "riskTags": dict(sorted(risk_tags.items(), key=lambda kv: int(kv[0]))),
+    }
+
+
+def write_indexes(output: dict, out_path) -> Path:
+    out_path = Path(out_path)
+    write_text_atomic(json.dumps(build_indexes(output), ensure_ascii=False, indent=2), out_path)
+    return out_path
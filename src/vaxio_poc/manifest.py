@@ -0,0 +1,93 @@
+"""
+Content-Hashes pro Land und Manifest des Datensatzes.
+
+  manifest = build_manifest(output)
+  manifest["records"]["Indonesien"]   -> "3f1c…"  (SHA-256, z.B. als ETag)
+  manifest["datasetHash"]             -> ändert sich genau dann, wenn
+                                         sich irgendein Record ändert
+  diff_manifests(alt, neu)            -> {"added", "removed", "changed"}
+
+Gehasht wird kanonisches JSON: sortierte Keys, keine Leerzeichen, UTF-8
+ohne Escapes. Reihenfolge der Keys im Record oder der Länder im Datensatz,
+Einrückung und Ausgabeformat (json/compact/ndjson) ändern die Hashes also
+nicht; Reihenfolgen *innerhalb* von Listen (Impfstoffe, riskTags) schon.
+
+datasetHash ist der SHA-256 über die nach Ländernamen sortierten Zeilen
+"name\\thash\\n". Das Manifest enthält bewusst keinen Zeitstempel – zwei Läufe
+mit gleichem Ergebnis erzeugen ein byte-identisches Manifest.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from .writer import write_text_atomic
+
+MANIFEST_VERSION = 1
+
+
+def canonical_json(record) -> str:
+    return json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def record_hash(record) -> str:
+    return hashlib.sha256(canonical_json(record).encode("utf-8")).hexdigest()
+
+
+def dataset_hash(record_hashes: dict) -> str:
+    h = hashlib.sha256()
+    for name in sorted(record_hashes):
+        h.update(f"{name}\t{record_hashes[name]}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def build_manifest(output: dict) -> dict:
+    records = {name: record_hash(record) for name, record in sorted(output.items())}
+    return {
+        "version": MANIFEST_VERSION,
+        "algorithm": "sha256",
+        "datasetHash": dataset_hash(records),
+        "countries": len(records),
+        "records": records,
+    }
+
+
+def load_manifest(path):
+    """Manifest oder None, wenn nicht vorhanden/lesbar."""
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def diff_manifests(old: dict, new: dict) -> dict:
+    old_records = (old or {}).get("records", {})
+    new_records = new["records"]
+    return {
+        "added": [n for n in new_records if n not in old_records],
+        "removed": [n for n in old_records if n not in new_records],
+        "changed": [
+            n for n in new_records if n in old_records and old_records[n] != new_records[n]
+        ],
+    }
+
+
+def format_manifest_diff(old: dict, new: dict) -> str:
+    if old is None:
+        return f"Manifest neu: {new['countries']} Länder, Datensatz {new['datasetHash'][:12]}"
+    if old.get("datasetHash") == new["datasetHash"]:
+        return f"Datensatz unverändert ({new['datasetHash'][:12]})"
+    diff = diff_manifests(old, new)
+    lines = [
+        f"Datensatz geändert: {old.get('datasetHash', '?')[:12]} -> {new['datasetHash'][:12]} "
+        f"(+{len(diff['added'])} -{len(diff['removed'])} ~{len(diff['changed'])})"
+    ]
+    for key, sign in (("added", "+"), ("removed", "-"), ("changed", "~")):
+        lines.extend(f"  {sign} {name}" for name in diff[key])
+    return "\n".join(lines)
+
+
+def write_manifest(output: dict, out_path) -> Path:
+    out_path = Path(out_path)
+    write_text_atomic(json.dumps(build_manifest(output), ensure_ascii=False, indent=2), out_path)
+    return out_path
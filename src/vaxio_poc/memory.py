@@ -0,0 +1,116 @@
+"""
+Speicher-Budget für die Seitenextraktion großer PDFs.
+
+  budget = MemoryBudget(limit_mb=800, recycle_pages=200)
+  PdfPageTexts(pdf_path, budget=budget)
+
+pdfplumber/pdfminer halten pro offenem Dokument Seitenobjekte, aufgelöste
+PDF-Objekte und Font-Caches bis zum close() – der Speicher wächst mit der
+Seitenzahl. Das Budget begrenzt das auf zwei Arten:
+
+  recycle_pages  nach N extrahierten Seiten wird das Dokument geschlossen
+                 und beim nächsten Zugriff neu geöffnet; im Prozess-Pool
+                 bekommt jeder Worker höchstens N Seiten, dann einen
+                 frischen Prozess
+  limit_mb       liegt der RSS nach einer Seite darüber, wird sofort
+                 recycelt; liegt er auch danach noch darüber, bricht die
+                 Extraktion mit MemoryLimitExceeded ab
+
+Gemessen wird der aktuelle RSS (/proc/self/statm, sonst psutil). Ohne beides
+ist limit_mb nicht durchsetzbar; es gibt dann einmal eine Warnung. Nach dem
+Schließen gibt malloc_trim (glibc) freigewordenen Heap an das System zurück,
+sonst bliebe der RSS trotz freigegebener Objekte oben.
+"""
+import ctypes
+import gc
+import os
+import sys
+
+
+class MemoryLimitExceeded(MemoryError):
+    pass
+
+
+def release_heap():
+    gc.collect()
+    if sys.platform.startswith("linux"):
+        try:
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+        except (OSError, AttributeError):  # kein glibc (musl, ...)
+            pass
+
+
+def current_rss_bytes():
+    """Aktueller RSS des Prozesses oder None, wenn nicht messbar."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+class MemoryBudget:
+    def __init__(self, limit_mb: float = None, recycle_pages: int = None):
+        self.limit_mb = limit_mb
+        self.recycle_pages = recycle_pages or None
+        self.limit_bytes = int(limit_mb * 2**20) if limit_mb else None
+        self.peak_rss = 0
+        self.recycles = 0
+        self.limit_recycles = 0  # davon durch limit_mb ausgelöst
+        self._warned = False
+
+    def params(self) -> dict:
+        """Für Worker-Prozesse: MemoryBudget(**budget.params())."""
+        return {"limit_mb": self.limit_mb, "recycle_pages": self.recycle_pages}
+
+    def sample(self):
+        rss = current_rss_bytes()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+        return rss
+
+    def should_recycle(self, pages_since_open: int) -> bool:
+        """Nach jeder extrahierten Seite: Dokument jetzt schließen?"""
+        rss = self.sample()
+        if self.limit_bytes and rss is None and not self._warned:
+            self._warned = True
+            print(
+                "[WARN] RSS nicht messbar (weder /proc noch psutil) – Speicherlimit wird ignoriert.",
+                file=sys.stderr,
+            )
+        if self.limit_bytes and rss is not None and rss > self.limit_bytes:
+            self.limit_recycles += 1
+            return True
+        return bool(self.recycle_pages) and pages_since_open >= self.recycle_pages
+
+    def after_recycle(self):
+        """Nach dem Schließen: ist der Speicher wieder unter dem Limit?"""
+        self.recycles += 1
+        release_heap()
+        rss = self.sample()
+        if self.limit_bytes and rss is not None and rss > self.limit_bytes:
+            raise MemoryLimitExceeded(
+                f"RSS {rss / 2**20:.0f} MB liegt auch nach dem Schließen des PDFs "
+                f"über dem Limit von {self.limit_mb:g} MB"
+            )
+
+    def merge(self, peak_rss: int, recycles: int, limit_recycles: int):
+        """Zahlen eines Worker-Prozesses übernehmen."""
+        self.peak_rss = max(self.peak_rss, peak_rss)
+        self.recycles += recycles
+        self.limit_recycles += limit_recycles
+
+    def report(self) -> dict:
+        self.sample()
+        return {
+            "memoryLimitMb": self.limit_mb,
+            "recyclePages": self.recycle_pages,
+            "peakRssBytes": self.peak_rss or None,
+            "docRecycles": self.recycles,
+            "limitRecycles": self.limit_recycles,
+        }
@@ -0,0 +1,141 @@
+"""
+Messpunkte der Pipeline: Zeit, CPU, Speicher und Zähler pro Stufe.
+
+  metrics = Metrics(profile={"parse"})
+  extract(pdf, ExtractOptions(metrics=metrics))
+  metrics.write("metrics.json")
+
+Pro Stufe werden Wall-Zeit, CPU-Zeit und (mit track_memory) der Peak der
+Python-Allokationen via tracemalloc erfasst. Stufen aus profile laufen unter
+cProfile; die Stats landen sortiert in profile_dir bzw. auf stderr.
+Ohne Metrics-Objekt nutzt die Pipeline NULL_METRICS, das nichts misst.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class NullMetrics:
+    """Tut nichts – Default, wenn nicht gemessen wird."""
+
+    @contextmanager
+    def stage(self, name: str):
+        yield
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    def set(self, name: str, value):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+def _max_rss_bytes():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class Metrics(NullMetrics):
+    def __init__(self, track_memory: bool = True, profile=(), profile_dir=None, profile_limit: int = 30):
+        self.track_memory = track_memory
+        self.profile = set(profile or ())
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.profile_limit = profile_limit
+
+        self.stages = {}
+        self.counters = {}
+        self.values = {}
+        self._open = []  # offene Stufen (für verschachtelte Peaks)
+        self._started_tracing = False
+        self._t0 = time.perf_counter()
+
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def _bubble_peak(self):
+        """Aktuellen tracemalloc-Peak an alle offenen Stufen weitergeben."""
+        peak = tracemalloc.get_traced_memory()[1]
+        for st in self._open:
+            st["peak"] = max(st["peak"], peak)
+
+    @contextmanager
+    def stage(self, name: str):
+        st = {"peak": 0}
+        if self.track_memory:
+            self._bubble_peak()
+            tracemalloc.reset_peak()
+        self._open.append(st)
+
+        prof = cProfile.Profile() if name in self.profile else None
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        if prof:
+            prof.enable()
+        try:
+            yield
+        finally:
+            if prof:
+                prof.disable()
+            wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+            if self.track_memory:
+                self._bubble_peak()
+            self._open.pop()
+
+            entry = self.stages.setdefault(name, {"calls": 0, "wallSeconds": 0.0, "cpuSeconds": 0.0})
+            entry["calls"] += 1
+            entry["wallSeconds"] += wall
+            entry["cpuSeconds"] += cpu
+            if self.track_memory:
+                entry["peakPythonBytes"] = max(entry.get("peakPythonBytes", 0), st["peak"])
+            if prof:
+                self._dump_profile(name, prof)
+
+    def _dump_profile(self, name: str, prof):
+        if self.profile_dir:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            prof.dump_stats(str(self.profile_dir / f"{name}.prof"))
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(self.profile_limit)
+        if self.profile_dir:
+            (self.profile_dir / f"{name}.txt").write_text(buf.getvalue(), encoding="utf-8")
+        else:
+            print(f"===== cProfile: {name} =====\n{buf.getvalue()}", file=sys.stderr)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def set(self, name: str, value):
+        self.values[name] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "totalWallSeconds": time.perf_counter() - self._t0,
+            "maxRssBytes": _max_rss_bytes(),
+            "pid": os.getpid(),
+            "stages": self.stages,
+            "counters": self.counters,
+            "values": self.values,
+        }
+
+    def write(self, path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return path
+
+    def close(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
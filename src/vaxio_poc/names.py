@@ -0,0 +1,143 @@
+"""
+Namensindex für die Länder-Suche (exakt, Präfix, unscharf).
+
+  index = build_name_index(output)
+  lookup_name(index, "weissrussland")   -> ["Belarus (Weißrussland)"]
+
+Für jeden Länder- und Alias-Key werden Suchformen erzeugt:
+  - norm(key) wie in der Alias-Auflösung,
+  - ASCII-Faltung zweimal: ä -> a und ä -> ae (ß -> ss in beiden),
+    Satzzeichen zu einzelnen Leerzeichen,
+  - dieselben Formen für die Namensteile ("Belarus (Weißrussland)" ->
+    "belarus", "weissrussland"; "Chile – inkl. Osterinsel" -> "chile", ...).
+Alle Formen landen in "exact", ihre Präfixe (2..PREFIX_MAX Zeichen) in
+"prefix" und die Trigramme in "trigram"; Werte sind Indizes in "names".
+Englische/niederländische Namen sind abgedeckt, soweit sie als Alias im
+Datensatz stehen (MANUAL_ALIAS_MAP: "United States", "Paaseiland", ...).
+"""
+import json
+import re
+from pathlib import Path
+
+from .helpers import norm
+from .writer import write_text_atomic
+
+NAME_INDEX_VERSION = 1
+PREFIX_MIN = 2
+PREFIX_MAX = 12
+
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "Ä": "Ae", "Ö": "Oe", "Ü": "Ue"})
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_PARTS_SPLIT = re.compile(r"[()/,;–—]|\binkl\.|\bund\b", re.IGNORECASE)
+
+
+def search_key(s: str) -> str:
+    """norm() ohne Satzzeichen: 'Côte d’Ivoire' -> 'cote d ivoire'."""
+    return _NON_ALNUM.sub(" ", norm(s.replace("ß", "ss"))).strip()
+
+
+def slug(s: str) -> str:
+    """Für Dateinamen/URLs: 'Belarus (Weißrussland)' -> 'belarus-weissrussland'."""
+    return search_key(s.translate(_UMLAUTS)).replace(" ", "-")
+
+
+def search_forms(s: str) -> list:
+    """Alle Suchformen eines Namens (ohne Namensteile), Reihenfolge stabil."""
+    forms = [norm(s).strip(), search_key(s), search_key(s.translate(_UMLAUTS))]
+    return [f for i, f in enumerate(forms) if f and f not in forms[:i]]
+
+
+def name_parts(name: str) -> list:
+    parts = [p.strip() for p in _PARTS_SPLIT.split(name)]
+    return [p for p in parts if len(p) >= 3 and p != name]
+
+
+def index_forms(name: str) -> list:
+    """Suchformen des Namens und seiner Namensteile."""
+    forms = search_forms(name)
+    for part in name_parts(name):
+        forms.extend(f for f in search_forms(part) if f not in forms)
+    return forms
+
+
+def trigrams(key: str) -> set:
+    padded = f" {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def build_name_index(output: dict) -> dict:
+    names = list(output)
+    ids = {name: i for i, name in enumerate(names)}
+    exact, prefix, trigram = {}, {}, {}
+
+    def add(table, key, i):
+        lst = table.setdefault(key, [])
+        if not lst or lst[-1] != i:
+            lst.append(i)
+
+    for i, name in enumerate(names):
+        for f in index_forms(name):
+            add(exact, f, i)
+            for n in range(PREFIX_MIN, min(len(f), PREFIX_MAX) + 1):
+                add(prefix, f[:n], i)
+            for tri in sorted(trigrams(f)):
+                add(trigram, tri, i)
+
+    target = [ids.get(output[n].get("aliasOf"), i) for i, n in enumerate(names)]
+    return {
+        "version": NAME_INDEX_VERSION,
+        "prefixMin": PREFIX_MIN,
+        "prefixMax": PREFIX_MAX,
+        "names": names,
+        "target": target,
+        "exact": exact,
+        "prefix": prefix,
+        "trigram": trigram,
+    }
+
+
+def lookup_name(index: dict, query: str, limit: int = 5, min_similarity: float = 0.3) -> list:
+    """
+    Kandidaten für eine Nutzereingabe: exakte Treffer, sonst Präfix-Treffer,
+    sonst die ähnlichsten per Trigramm-Überlappung (Jaccard-Näherung
+    gegen die kürzeste Form des Kandidaten).
+    """
+    names = index["names"]
+    forms = search_forms(query)
+    for f in forms:
+        hit = index["exact"].get(f)
+        if hit:
+            return [names[i] for i in hit[:limit]]
+
+    for f in forms:
+        if len(f) < index["prefixMin"]:
+            continue
+        hit = index["prefix"].get(f[: index["prefixMax"]])
+        if hit:
+            # über prefixMax hinaus wird gegen die Suchformen nachgeprüft
+            if len(f) > index["prefixMax"]:
+                hit = [i for i in hit if any(g.startswith(f) for g in index_forms(names[i]))]
+            if hit:
+                return [names[i] for i in hit[:limit]]
+
+    q = trigrams(forms[-1]) if forms else set()
+    counts = {}
+    for tri in q:
+        for i in index["trigram"].get(tri, ()):
+            counts[i] = counts.get(i, 0) + 1
+    scored = []
+    for i, shared in counts.items():
+        best = min(len(trigrams(f)) for f in index_forms(names[i]))
+        score = shared / (len(q) + best - shared)
+        if score >= min_similarity:
+            scored.append((-score, i))
+    return [names[i] for _, i in sorted(scored)[:limit]]
+
+
+def write_name_index(output: dict, out_path) -> Path:
+    out_path = Path(out_path)
+    write_text_atomic(
+        json.dumps(build_name_index(output), ensure_ascii=False, separators=(",", ":")),
+        out_path,
+    )
+    return out_path
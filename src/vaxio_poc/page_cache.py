@@ -0,0 +1,143 @@
+"""
+Persistenter Cache für extrahierte PDF-Seitentexte.
+
+Ein Eintrag = ein PDF (SHA-256 des Inhalts) + Extractor-Settings und enthält
+die Texte der bereits extrahierten Seiten (Seitenindex -> Text). "complete"
+listet die Seiten, die ein vollständig durchgelaufener Lauf als Kandidaten
+für Tabellen-Seiten geprüft hat; nur dann darf ein späterer Lauf sich auf die
+gecachten Seiten beschränken (fehlt das Feld, wird normal gesucht). Einträge
+liegen als JSON-Dateien im Cache-Verzeichnis; wird max_bytes überschritten,
+fliegen die am längsten nicht benutzten Einträge raus (LRU über mtime).
+
+Verwaltung über die CLI:
+  vaxio-poc cache info
+  vaxio-poc cache clear [--pdf EB-14-2025.pdf]
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("VAXIO_CACHE_DIR") or Path.home() / ".cache" / "vaxio_poc")
+    / "pages"
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def file_sha256(path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 über den Dateiinhalt (nicht Pfad/mtime)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def settings_key(settings: dict) -> str:
+    """Stabiler Kurz-Hash der Extractor-Settings."""
+    raw = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def evict_lru(paths, max_bytes: int) -> int:
+    """Löscht die ältesten Dateien (mtime), bis die Gesamtgröße <= max_bytes ist."""
+    entries = []
+    for p in paths:
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            p.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+class PageTextCache:
+    """On-Disk-Cache: (PDF-SHA-256, Settings) -> {Seitenindex: Text}."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, pdf_sha: str, settings: dict) -> Path:
+        return self.cache_dir / f"{pdf_sha}-{settings_key(settings)}.json"
+
+    def _entries(self):
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob("*.json"))
+
+    def load(self, pdf_sha: str, settings: dict):
+        """
+        Gibt (page_count, {index: text}, complete) zurück oder None;
+        complete ist die Liste der vollständig geprüften Seiten oder None.
+        Ein Treffer frischt die mtime auf (LRU).
+        """
+        path = self._entry_path(pdf_sha, settings)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        pages = {int(k): v for k, v in data.get("pages", {}).items()}
+        complete = data.get("complete")
+        if complete is not None and not set(complete) <= pages.keys():
+            complete = None
+        return data.get("pageCount"), pages, complete
+
+    def store(self, pdf_sha: str, settings: dict, page_count: int, pages: dict, complete=None):
+        """Schreibt einen Eintrag atomar (tmp + rename) und evicted danach."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(pdf_sha, settings)
+        data = {
+            "pdfSha256": pdf_sha,
+            "settings": settings,
+            "pageCount": page_count,
+            "pages": {str(k): v for k, v in sorted(pages.items())},
+        }
+        if complete is not None:
+            data["complete"] = sorted(complete)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self) -> int:
+        return evict_lru(self._entries(), self.max_bytes)
+
+    def invalidate(self, pdf_sha: str = None) -> int:
+        """Entfernt alle Einträge eines PDFs (oder alle, wenn pdf_sha=None)."""
+        removed = 0
+        for p in self._entries():
+            if pdf_sha is None or p.name.startswith(f"{pdf_sha}-"):
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        return {
+            "cacheDir": str(self.cache_dir),
+            "entries": len(entries),
+            "bytes": sum(p.stat().st_size for p in entries),
+            "maxBytes": self.max_bytes,
+        }
+
@@ -0,0 +1,311 @@
+"""
+Seitentexte eines PDFs – jede Seite wird höchstens einmal extrahiert.
+
+Treffer kommen aus dem PageTextCache; das PDF wird erst geöffnet, wenn
+wirklich eine Seite fehlt. Neu extrahierte Seiten werden beim Schließen in
+den Cache zurückgeschrieben – nur wenn der Lauf ohne Ausnahme endet (auch
+GeneratorExit bei abgebrochenem Streaming zählt als Ausnahme).
+mark_complete() vermerkt, welche Seiten ein fertiger Lauf vollständig geprüft
+hat; nur darauf verlässt sich pipeline.candidate_pages bei einem Treffer.
+
+Extrahiert wird über ein Backend aus backends.py (Default pdfplumber). Mit
+verify=True wird vor der ersten Nutzung eine Tabellen-Seite gegen pdfplumber
+abgeglichen; weicht das schnelle Backend ab, wird auf pdfplumber umgeschaltet.
+Gesucht wird die erste Seite mit SAMPLE_MIN_MARKERS Länder-Markern; dabei
+gelesene Texte bleiben nur mit Cache im Speicher.
+
+prefetch(..., workers=N) verteilt fehlende Seiten in zusammenhängenden
+Slices auf N Prozesse; jeder Worker öffnet das PDF selbst. Das Ergebnis ist
+pro Seitenindex abgelegt, die Reihenfolge also identisch zum seriellen Pfad.
+
+Mit budget (memory.MemoryBudget) wird das Dokument nach recycle_pages Seiten
+bzw. beim Überschreiten des Speicherlimits geschlossen und neu geöffnet; im
+Prozess-Pool bekommt jeder Worker dann höchstens recycle_pages Seiten
+(max_tasks_per_child=1, vor Python 3.11 ein eigener Pool pro Slice).
+"""
+import math
+import sys
+from pathlib import Path
+
+from .backends import (
+    REFERENCE,
+    SAMPLE_MARKER,
+    SAMPLE_MIN_MARKERS,
+    backend_from_settings,
+    get_backend,
+    sample_score,
+    text_lines,
+)
+from .memory import MemoryBudget
+from .page_cache import PageTextCache, file_sha256
+
+# ProcessPoolExecutor(max_tasks_per_child=...) gibt es erst ab Python 3.11
+POOL_MAX_TASKS = sys.version_info >= (3, 11)
+
+EXTRACTOR_SETTINGS = {
+    "extractor": "pdfplumber",
+    "x_tolerance": 3,
+    "y_tolerance": 3,
+}
+
+
+def _extract_slice(pdf_path: str, indices, settings: dict, budget_params: dict = None):
+    """
+    Worker: öffnet das PDF selbst und extrahiert die Seiten aus indices.
+    Rückgabe: ([(index, text)], budget-Zahlen oder None)
+    """
+    budget = MemoryBudget(**budget_params) if budget_params else None
+    with PdfPageTexts(pdf_path, settings=settings, budget=budget) as src:
+        texts = [(i, src.text(i)) for i in indices]
+    if budget is None:
+        return texts, None
+    return texts, (budget.peak_rss, budget.recycles, budget.limit_recycles)
+
+
+def split_slices(indices, workers: int, max_size: int = None):
+    """
+    Teilt indices in <= workers zusammenhängende, gleich große Slices;
+    mit max_size in entsprechend mehr Slices zu höchstens max_size Seiten.
+    """
+    indices = list(indices)
+    if not indices:
+        return []
+    size = math.ceil(len(indices) / max(1, workers))
+    if max_size:
+        size = min(size, max_size)
+    return [indices[k : k + size] for k in range(0, len(indices), size)]
+
+
+def extract_pages_parallel(
+    pdf_path, indices, settings: dict, workers: int, budget: MemoryBudget = None
+) -> dict:
+    """
+    Extrahiert indices mit einem Prozess-Pool; Rückgabe {index: text}.
+    Mit budget.recycle_pages läuft jeder Slice in einem frischen Prozess.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    recycle = budget.recycle_pages if budget else None
+    slices = split_slices(indices, workers, recycle)
+    budget_params = budget.params() if budget else None
+    texts = {}
+
+    def collect(futures):
+        for fut in futures:
+            pairs, stats = fut.result()
+            texts.update(pairs)
+            if stats:
+                budget.merge(*stats)
+
+    def submit(pool, sl):
+        return pool.submit(_extract_slice, str(pdf_path), sl, settings, budget_params)
+
+    if recycle and not POOL_MAX_TASKS:
+        # je Slice ein frischer Ein-Prozess-Pool, höchstens workers gleichzeitig
+        for k in range(0, len(slices), workers):
+            pools = [ProcessPoolExecutor(max_workers=1) for _ in slices[k : k + workers]]
+            try:
+                collect([submit(pool, sl) for pool, sl in zip(pools, slices[k : k + workers])])
+            finally:
+                for pool in pools:
+                    pool.shutdown()
+        return texts
+
+    pool_args = {"max_tasks_per_child": 1} if recycle else {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(slices)), **pool_args) as pool:
+        collect([submit(pool, sl) for sl in slices])
+    return texts
+
+
+class PdfPageTexts:
+    """
+    Lazy Zugriff auf Seitentexte:
+      with PdfPageTexts(pdf_path, cache=PageTextCache()) as src:
+          src.text(0), len(src)
+      PdfPageTexts(pdf_path, backend=get_backend("auto"), verify=True)
+    """
+
+    def __init__(
+        self,
+        pdf_path,
+        cache: PageTextCache = None,
+        settings: dict = None,
+        backend=None,
+        verify: bool = False,
+        budget: MemoryBudget = None,
+    ):
+        self.pdf_path = Path(pdf_path)
+        self.cache = cache
+        self.pdf_sha = file_sha256(self.pdf_path) if cache is not None else None
+        self.extracted = 0  # in diesem Lauf neu extrahierte Seiten
+        self.cache_hit = False
+        self.complete_pages = None  # laut Cache vollständig geprüfte Seiten
+        self.fallback = False  # True, wenn verify auf pdfplumber umgeschaltet hat
+        self.budget = budget
+        self._since_open = 0  # extrahierte Seiten seit dem letzten Öffnen
+
+        if backend is None:
+            backend = backend_from_settings(settings or EXTRACTOR_SETTINGS)
+        self._verified = not verify or backend.name == REFERENCE
+        self._use_backend(backend)
+
+    def _use_backend(self, backend):
+        self.backend = backend
+        self.settings = backend.settings()
+        if not self._verified:
+            # eigener Cache-Key: Treffer sind bereits gegen die Referenz geprüft
+            self.settings["verifiedAgainst"] = REFERENCE
+        self._doc = None
+        self._texts = {}
+        self._dirty = False
+        self._page_count = None
+
+        if self.cache is not None:
+            hit = self.cache.load(self.pdf_sha, self.settings)
+            if hit:
+                self._page_count, self._texts, self.complete_pages = hit
+                self.cache_hit = True
+                self._verified = True
+
+    def _open(self):
+        if self._doc is None:
+            self._doc = self.backend.open(self.pdf_path)
+            self._page_count = len(self._doc)
+            self._since_open = 0
+        return self._doc
+
+    def _recycle(self):
+        """Dokument schließen (gibt Seiten-/Objekt-Caches frei); öffnet lazy neu."""
+        self._doc.close()
+        self._doc = None
+        self.budget.after_recycle()
+
+    def __len__(self) -> int:
+        if self._page_count is None:
+            self._open()
+        return self._page_count
+
+    def _extract(self, i: int) -> str:
+        t = self._open().text(i)
+        self.extracted += 1
+        self._since_open += 1
+        if self.budget is not None and self.budget.should_recycle(self._since_open):
+            self._recycle()
+        return t
+
+    def ensure_verified(self):
+        """Mit verify=True: einmalig eine Tabellen-Seite gegen die Referenz prüfen."""
+        if not self._verified:
+            self._verify()
+
+    def _sample(self):
+        """(index, text) der ersten Seite mit genug Markern, sonst der besten."""
+        best = None
+        for i in range(len(self)):
+            t = self._texts.get(i)
+            if t is None:
+                # behalten, auch ohne Cache: jede Seite nur einmal pro Lauf extrahieren
+                t = self._texts[i] = self._extract(i)
+                self._dirty = self._dirty or self.cache is not None
+            if best is None or sample_score(t) > sample_score(best[1]):
+                best = (i, t)
+            if t.count(SAMPLE_MARKER) >= SAMPLE_MIN_MARKERS:
+                break
+        return best
+
+    def _verify(self):
+        """Eine Tabellen-Seite gegen die Referenz prüfen, bei Abweichung umschalten."""
+        self._verified = True
+        sample = self._sample()
+        if sample is None:
+            return
+        i, text = sample
+        reference = get_backend(REFERENCE)
+        with reference.open(self.pdf_path) as doc:
+            ref_text = doc.text(i)
+        if text_lines(ref_text) == text_lines(text):
+            return
+
+        print(
+            f"[WARN] Backend {self.backend.name} weicht auf Seite {i + 1} von "
+            f"{REFERENCE} ab – nutze {REFERENCE}.",
+            file=sys.stderr,
+        )
+        if self._doc is not None:
+            self._doc.close()
+        self._use_backend(reference)
+        self.fallback = True
+        if i not in self._texts:
+            self._texts[i] = ref_text
+            self._dirty = self._dirty or self.cache is not None
+
+    def text(self, i: int) -> str:
+        self.ensure_verified()
+        t = self._texts.get(i)
+        if t is None:
+            t = self._extract(i)
+            self._texts[i] = t
+            self._dirty = True
+        return t
+
+    def iter_texts(self, indices=None):
+        """
+        Liefert (index, text) Seite für Seite.
+        Ohne Cache werden neu extrahierte Texte nicht behalten (Streaming) und
+        schon vorhandene (Stichprobe der Prüfung) nach der Ausgabe freigegeben.
+        """
+        self.ensure_verified()
+        if indices is None:
+            indices = range(len(self))
+        for i in indices:
+            t = self._texts.get(i) if self.cache is not None else self._texts.pop(i, None)
+            if t is None:
+                t = self._extract(i)
+                if self.cache is not None:
+                    self._texts[i] = t
+                    self._dirty = True
+            yield i, t
+
+    def prefetch(self, indices=None, workers: int = 1):
+        """
+        Extrahiert alle noch fehlenden Seiten vorab.
+        workers > 1: Prozess-Pool, sonst seriell über text().
+        """
+        self.ensure_verified()
+        if indices is None:
+            indices = range(len(self))
+        missing = [i for i in indices if i not in self._texts]
+        if not missing:
+            return
+        if workers <= 1 or len(missing) < 2:
+            for i in missing:
+                self.text(i)
+            return
+        self._texts.update(
+            extract_pages_parallel(self.pdf_path, missing, self.settings, workers, self.budget)
+        )
+        self.extracted += len(missing)
+        self._dirty = True
+
+    def mark_complete(self, indices):
+        """indices wurden in diesem Lauf vollständig auf Tabellen-Seiten geprüft."""
+        self.complete_pages = sorted(indices)
+        self._dirty = True
+
+    def close(self, store: bool = True):
+        """Dokument schließen; mit store neue Seiten in den Cache schreiben."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        if store and self.cache is not None and self._dirty:
+            self.cache.store(
+                self.pdf_sha, self.settings, len(self), self._texts, self.complete_pages
+            )
+            self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # halbe Läufe (Fehler, Ctrl-C, abgebrochener Stream) nicht cachen
+        self.close(store=exc_type is None)
@@ -0,0 +1,420 @@
+"""
+STIKO-Ländertabelle: PDF -> Länder-Datensatz.
+
+  from vaxio_poc import extract, ExtractOptions
+  dataset = extract("EB-14-2025.pdf", ExtractOptions(workers=4))
+
+Die Stufen 1–9 der ursprünglichen Skripte sind einzelne Funktionen, damit
+sie auch ohne PDF (z.B. auf bereits extrahiertem Text) nutzbar sind.
+"""
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .aliases import copy_record, format_unresolved, resolve_alias_targets
+from .config import ALIAS_MARKERS, MANUAL_ALIAS_MAP
+from .helpers import (
+    VACCINE_MATCHER,
+    cleanup_vaccine,
+    dedup_keep_order,
+    extract_alias,
+    extract_bullets_raw,
+    extract_entry_requirements_raw,
+    is_heading_candidate,
+    norm,
+    split_into_sections,
+)
+from .metrics import NULL_METRICS
+from .writer import write_records
+
+LAND_MARKERS = ["Nachweispflicht", "Impfungen bei", "Impfungen für alle"]
+BAD_KEYS = {"name des landes", "b c", "b·c", "b  c"}
+
+
+@dataclass
+class ExtractOptions:
+    """Einstellungen für extract()."""
+
+    use_cache: bool = True
+    cache_dir: str = None  # None = page_cache.DEFAULT_CACHE_DIR
+    workers: int = 1
+    # Text-Backend (backends.py); "auto" = schnellstes, gegen pdfplumber geprüft
+    backend: str = "auto"
+    # Seiten ohne Tabellen-Marker vorab per Content-Stream-Scan aussortieren
+    # (nur bei langsamen Backends; prefilter.py)
+    prefilter: bool = True
+    # Speicher-Budget der Extraktion (memory.py): Dokument bzw. Worker nach
+    # recycle_pages Seiten erneuern, RSS-Limit in MB durchsetzen
+    recycle_pages: int = None
+    memory_limit_mb: float = None
+    # Zwischenergebnisse pro Stufe cachen (checkpoints.py); None = Default-Verzeichnis
+    checkpoints: bool = False
+    checkpoint_dir: str = None
+    manual_aliases: dict = field(default_factory=lambda: dict(MANUAL_ALIAS_MAP))
+    metrics: object = None  # metrics.Metrics; None = nicht messen
+
+
+def stage_metrics(options: ExtractOptions):
+    return options.metrics if options is not None and options.metrics is not None else NULL_METRICS
+
+
+def warn(msg: str):
+    print(f"[WARN] {msg}", file=sys.stderr)
+
+
+# ======================
+# 1)–3) PDF LADEN, LÄNDERTABELLE-SEITEN FINDEN, TEXT EXTRAHIEREN
+# ======================
+def find_land_pages(src, candidates=None) -> list:
+    """
+    Seiten mit mindestens zwei der drei Tabellen-Marker. candidates schränkt
+    die geprüften Seiten ein (Vorfilter); der Fallback nutzt immer alle.
+    """
+    land_pages = []
+    for i in range(len(src)) if candidates is None else candidates:
+        t = src.text(i)
+        score = sum(m in t for m in LAND_MARKERS)
+        if score >= 2:
+            land_pages.append(i)
+
+    if not land_pages:
+        warn("Marker-Seiten nicht gefunden – nutze alle Seiten als Fallback.")
+        land_pages = list(range(len(src)))
+    return land_pages
+
+
+def clean_lines_from_text(land_text: str) -> list:
+    lines = [ln.strip() for ln in land_text.splitlines() if ln.strip()]
+    return [ln for ln in lines if not ln.startswith("Epidemiologisches Bulletin")]
+
+
+def open_page_texts(pdf_path, options: ExtractOptions):
+    """PdfPageTexts für pdf_path mit dem in options konfigurierten Cache."""
+    from .backends import get_backend
+    from .page_cache import PageTextCache
+    from .pdftext import PdfPageTexts
+
+    pdf_path = Path(pdf_path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF nicht gefunden: {pdf_path}")
+
+    cache = None
+    if options.use_cache:
+        cache = PageTextCache(options.cache_dir) if options.cache_dir else PageTextCache()
+    budget = None
+    if options.recycle_pages or options.memory_limit_mb:
+        from .memory import MemoryBudget
+
+        budget = MemoryBudget(options.memory_limit_mb, options.recycle_pages)
+    return PdfPageTexts(
+        pdf_path,
+        cache=cache,
+        backend=get_backend(options.backend),
+        verify=options.backend == "auto",
+        budget=budget,
+    )
+
+
+# Backends, bei denen der Vorfilter nichts spart (Extraktion billiger als der Scan)
+FAST_BACKENDS = {"pdfium"}
+
+
+def candidate_pages(src, options: ExtractOptions):
+    """
+    Seiten, die Tabellen-Seiten sein können, oder None (= alle). Hat ein
+    früherer, vollständiger Lauf seine Kandidaten im Cache vermerkt
+    (PdfPageTexts.mark_complete), sind es genau diese.
+    """
+    if not options.prefilter:
+        return None
+    src.ensure_verified()
+    if src.complete_pages is not None:
+        return src.complete_pages
+    if src.backend.name in FAST_BACKENDS:
+        return None
+    from .prefilter import prefilter_pages
+
+    return prefilter_pages(src.pdf_path)
+
+
+def load_land_pages(pdf_path, options: ExtractOptions) -> list:
+    """[(seitenindex, text)] der Tabellen-Seiten."""
+    m = stage_metrics(options)
+    with open_page_texts(pdf_path, options) as src:
+        with m.stage("prefilter"):
+            candidates = candidate_pages(src, options)
+        with m.stage("extract_pages"):
+            src.prefetch(candidates, workers=options.workers)
+        with m.stage("land_pages"):
+            land_pages = [(i, src.text(i)) for i in find_land_pages(src, candidates)]
+        src.mark_complete(range(len(src)) if candidates is None else candidates)
+        m.set("candidatePages", len(src) if candidates is None else len(candidates))
+        m.set("backend", src.backend.name)
+        m.set("pages", len(src))
+        m.set("pagesExtracted", src.extracted)
+        m.set("pageCacheHit", src.cache_hit)
+        m.set("landPages", len(land_pages))
+        if src.budget is not None:
+            for name, value in src.budget.report().items():
+                m.set(name, value)
+        return land_pages
+
+
+def load_land_text(pdf_path, options: ExtractOptions) -> str:
+    return "\n".join(t for _, t in load_land_pages(pdf_path, options))
+
+
+def clean_lines_with_pages(land_pages: list):
+    """
+    Wie clean_lines_from_text, aber seitenweise: gibt (clean_lines, line_pages)
+    zurück, line_pages[i] = Seitenindex der Zeile i.
+    """
+    clean_lines, line_pages = [], []
+    for page_index, text in land_pages:
+        for ln in clean_lines_from_text(text):
+            clean_lines.append(ln)
+            line_pages.append(page_index)
+    return clean_lines, line_pages
+
+
+# ======================
+# 4) HEADINGS + PDF-ALIASE
+# ======================
+def classify_heading(
+    ln: str, nxt1: str, nxt2: str, alias_map: dict, alias_markers=ALIAS_MARKERS
+) -> bool:
+    """
+    True, wenn ln ein Länder-Heading ist. PDF-Alias-Zeilen ("Bali s. Indonesien")
+    landen in alias_map und zählen nicht als Heading.
+    """
+    if not is_heading_candidate(ln):
+        return False
+
+    alias = extract_alias(ln, alias_markers)
+    if alias:
+        alias_name, target = alias
+        alias_map[alias_name] = target
+        return False
+
+    return ("Nachweispflicht" in nxt1) or ("Nachweispflicht" in nxt2)
+
+
+def find_headings(clean_lines: list, alias_markers=ALIAS_MARKERS):
+    """Gibt (headings, alias_map) zurück; headings = [(zeilenindex, name)]."""
+    headings = []
+    alias_map = {}  # aus PDF "s. Land"
+
+    for i, ln in enumerate(clean_lines[:-2]):
+        if classify_heading(ln, clean_lines[i + 1], clean_lines[i + 2], alias_map, alias_markers):
+            headings.append((i, ln))
+
+    return headings, alias_map
+
+
+def heading_ranges(headings: list, n_lines: int) -> list:
+    """
+    [(start, end, name)]: jeder Block reicht bis zum nächsten Heading.
+    Ein Durchlauf über die (nach Position sortierten) Headings.
+    """
+    headings = sorted(headings)
+    ranges = []
+    for k, (pos, name) in enumerate(headings):
+        end = headings[k + 1][0] if k + 1 < len(headings) else n_lines
+        ranges.append((pos, end, name))
+    return ranges
+
+
+def build_blocks(clean_lines: list, headings: list) -> dict:
+    blocks = {}
+    for start, end, name in heading_ranges(headings, len(clean_lines)):
+        blocks[name] = "\n".join(clean_lines[start:end])
+    return blocks
+
+
+# ======================
+# 5) PARSEN ECHTER LÄNDER
+# ======================
+def parse_country_raw(block_text: str) -> dict:
+    """
+    Profilunabhängiger Teil von Stufe 5: Abschnitte mit Impfstoff-Rohtexten.
+    {"entry": [(roh, bedingt)], "ifRisk": [(roh, riskTags)], "forAll": [(roh, riskTags)]}
+    """
+    sections = split_into_sections(block_text)
+    return {
+        "entry": extract_entry_requirements_raw(sections.get("entryRequirements", "")),
+        "ifRisk": extract_bullets_raw(sections.get("ifRisk", "")),
+        "forAll": extract_bullets_raw(sections.get("forAll", "")),
+    }
+
+
+def build_record(
+    country: str,
+    raw: dict,
+    matcher=VACCINE_MATCHER,
+    split_conditional: bool = True,
+    drop_untagged_if_risk: bool = True,
+    metrics=NULL_METRICS,
+) -> dict:
+    """
+    Länder-Record aus parse_country_raw(). Die Defaults ergeben das Format von
+    stiko_all_final.json; split_conditional=False / drop_untagged_if_risk=False
+    das der alten Skripte (nur entryRequirements, IfRisk ungefiltert).
+    """
+    entries = [(cleanup_vaccine(r, matcher), cond) for r, cond in raw["entry"]]
+    entries = [(v, cond) for v, cond in entries if v]
+    if_risk_items = [
+        {"vaccine": cleanup_vaccine(r, matcher), "riskTags": list(tags)} for r, tags in raw["ifRisk"]
+    ]
+    rec_for_all = dedup_keep_order([cleanup_vaccine(r, matcher) for r, _ in raw["forAll"]])
+
+    if not split_conditional:
+        return {
+            "countryName": country,
+            "entryRequirements": dedup_keep_order([v for v, _ in entries]),
+            "recommendedForAll": rec_for_all,
+            "recommendedIfRisk": if_risk_items,
+        }
+
+    entry_req_always = dedup_keep_order([v for v, cond in entries if not cond])
+    entry_req_conditional = dedup_keep_order([v for v, cond in entries if cond])
+
+    # IfRisk-Items ohne riskTags rauswerfen (da sonst spätere Logik schwer)
+    cleaned_if_risk = []
+    for item in if_risk_items:
+        if drop_untagged_if_risk and not item["riskTags"]:
+            warn(f"Entferne IfRisk ohne riskTags: {country} -> {item['vaccine']}")
+            metrics.count("droppedIfRisk")
+            continue
+        cleaned_if_risk.append(item)
+
+    # Für Rückwärtskompatibilität: altes Feld 'entryRequirements' = beides zusammen
+    legacy_entry_req = dedup_keep_order(entry_req_always + entry_req_conditional)
+
+    return {
+        "countryName": country,
+        # neu und sauber getrennt:
+        "entryRequirementsAlways": entry_req_always,
+        "entryRequirementsConditional": entry_req_conditional,
+        # legacy-Feld (falls du es schon anderswo nutzt)
+        "entryRequirements": legacy_entry_req,
+        "recommendedForAll": rec_for_all,
+        "recommendedIfRisk": cleaned_if_risk,
+    }
+
+
+def parse_country(country: str, block_text: str, metrics=NULL_METRICS) -> dict:
+    return build_record(country, parse_country_raw(block_text), metrics=metrics)
+
+
+def parse_blocks(blocks: dict, metrics=NULL_METRICS) -> dict:
+    before = VACCINE_MATCHER.cache_info()
+    output = {country: parse_country(country, text, metrics) for country, text in blocks.items()}
+    count_canon_cache(metrics, before)
+    return output
+
+
+def count_canon_cache(metrics, before):
+    """Treffer/Fehlschläge des Kanonisierungs-Caches seit before zählen."""
+    after = VACCINE_MATCHER.cache_info()
+    metrics.count("canonCacheHits", after.hits - before.hits)
+    metrics.count("canonCacheMisses", after.misses - before.misses)
+
+
+# ======================
+# 6) ALIASE MERGEN (PDF + MANUAL)
+# ======================
+def merge_aliases(alias_map: dict, manual_aliases: dict) -> dict:
+    """Manual ergänzt alias_map, überschreibt nicht."""
+    merged = dict(alias_map)
+    for a, t in manual_aliases.items():
+        if a not in merged:
+            merged[a] = t
+    return merged
+
+
+# ======================
+# 7) ALIASE AUFLÖSEN (kopieren)
+# ======================
+def resolve_aliases(output: dict, alias_map: dict, unresolved: dict = None) -> dict:
+    for _ in iter_alias_records(output, alias_map, unresolved):
+        pass
+    return output
+
+
+def iter_alias_records(output: dict, alias_map: dict, unresolved: dict = None):
+    """
+    Legt Alias-Kopien in output an und liefert jede als (alias, record).
+    aliasOf zeigt immer auf das Land am Ende einer Alias-Kette. Nicht
+    auflösbare Aliase werden gesammelt gemeldet (und in unresolved abgelegt).
+    """
+    resolved, missing = resolve_alias_targets(output, alias_map)
+    if missing:
+        warn(format_unresolved(missing))
+        if unresolved is not None:
+            unresolved.update(missing)
+
+    for alias_name, target_key in resolved.items():
+        # Falls der Alias schon einen eigenen Eintrag mit Empfehlungen hat, nicht überschreiben
+        if alias_name in output and output[alias_name].get("recommendedForAll"):
+            continue
+
+        copied = copy_record(output[target_key])
+        copied["countryName"] = alias_name
+        copied["aliasOf"] = target_key
+        output[alias_name] = copied
+        yield alias_name, copied
+
+
+# ======================
+# 8) FINAL CLEANUP
+# ======================
+def final_cleanup(output: dict) -> dict:
+    bad_keys = [k for k in output.keys() if norm(k) in BAD_KEYS]
+    for bk in bad_keys:
+        output.pop(bk, None)
+    return output
+
+
+def extract_from_text(land_text: str, options: ExtractOptions = None) -> dict:
+    """Stufen 3–8 auf bereits extrahiertem Text der Tabellen-Seiten."""
+    options = options or ExtractOptions()
+    m = stage_metrics(options)
+    with m.stage("clean_lines"):
+        clean_lines = clean_lines_from_text(land_text)
+    with m.stage("headings"):
+        headings, alias_map = find_headings(clean_lines)
+    with m.stage("blocks"):
+        blocks = build_blocks(clean_lines, headings)
+    with m.stage("parse"):
+        output = parse_blocks(blocks, m)
+    m.set("lines", len(clean_lines))
+    m.set("countries", len(blocks))
+    m.set("pdfAliases", len(alias_map))
+
+    with m.stage("aliases"):
+        alias_map = merge_aliases(alias_map, options.manual_aliases)
+        unresolved = {}
+        resolve_aliases(output, alias_map, unresolved)
+    m.count("unresolvedAliases", len(unresolved))
+    with m.stage("cleanup"):
+        output = final_cleanup(output)
+    m.set("records", len(output))
+    return output
+
+
+def extract(pdf_path, options: ExtractOptions = None) -> dict:
+    """Komplette Pipeline: PDF -> {Landname: Datensatz}."""
+    options = options or ExtractOptions()
+    if options.checkpoints:
+        from .checkpoints import extract_checkpointed
+
+        return extract_checkpointed(pdf_path, options)
+    return extract_from_text(load_land_text(pdf_path, options), options)
+
+
+# ======================
+# 9) JSON SPEICHERN
+# ======================
+def write_json(output: dict, out_path, fmt: str = "json", ensure_ascii: bool = False) -> Path:
+    """Atomar und Land für Land (writer.py); fmt: json | compact | ndjson."""
+    return write_records(output, out_path, fmt, ensure_ascii)
@@ -0,0 +1,235 @@
+"""
+Impfplan-Auswertung für viele Reisende auf einmal (NumPy).
+
+  matrix = PlanMatrix(output)
+  batch = matrix.evaluate([["Indonesien", "Thailand"], ["Kenia"]],
+                          [risk_mask([1, 6]), risk_mask([8])])
+  batch.plan(0)   -> {"entryRequired": [...], "entryConditional": [...],
+                      "recommendedForAll": [...], "riskBased": [{"vaccine", "riskTags"}]}
+
+Gleiche Regeln wie buildVaccinationPlan in server/immunizationEngine.ts:
+
+  entryRequired       entryRequirementsAlways (Fallback entryRequirements)
+  entryConditional    entryRequirementsConditional
+  recommendedForAll   recommendedForAll
+  riskBased           recommendedIfRisk, wenn sich riskTags und aktive Tags
+                      schneiden; riskTags = Vereinigung der Schnittmengen
+
+jeweils vereinigt über alle Länder der Reise. Tag 5 (ärztliche
+Einzelfallentscheidung) ist nie aktiv, auch wenn er übergeben wird.
+Ländernamen werden wie matchCountryName zugeordnet (exakt, sonst erster Key,
+der den Namen enthält; beides ohne Groß-/Kleinschreibung).
+
+Der Datensatz liegt als Matrizen Länder × Impfstoffe vor (bool je Kategorie,
+uint16-Bitmaske je riskTag wie im Kompaktformat), die Reisen als Matrix
+Reisende × Länder. Eine Auswertung sind damit zwei Matrixprodukte statt
+verschachtelter Schleifen pro Reisendem. Reihenfolge der Impfstoffe in den
+Ergebnissen: erstes Vorkommen im Datensatz.
+"""
+from .compact import RISK_TAGS, mask_tags, risk_mask
+
+# wie VACCINE_CANONICAL_MAP im Server
+PLAN_VACCINE_CANON = {"Meningokokken- ACWY": "Meningokokken-ACWY"}
+MANUAL_TAG = 5  # nie automatisiert
+AUTOMATED_MASK = risk_mask(RISK_TAGS) & ~risk_mask([MANUAL_TAG])
+_CATEGORIES = ("entryAlways", "entryConditional", "forAll")
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('Impfplan-Auswertung braucht numpy (pip install "vaxio-poc[numpy]")') from None
+    return numpy
+
+
+def _normalise(name: str) -> str:
+    return name.strip().lower()
+
+
+def canonical_vaccine(name: str) -> str:
+    name = name.strip()
+    return PLAN_VACCINE_CANON.get(name, name)
+
+
+def risk_mask_from_questionnaire(answers: dict) -> int:
+    """Wie deriveRiskProfileServer, als Bitmaske (Bit tag - 1)."""
+    travel, health = answers["travel"], answers["health"]
+    rural = travel.get("ruralExposure")
+    activities = set(travel.get("activities") or [])
+    age = health.get("age")
+
+    tags = {
+        1: travel.get("travelCondition") == 1
+        or rural in ("also_rural", "mostly_rural")
+        or bool(activities & {"backpacking", "camping", "trekking", "homestay", "vfr"}),
+        2: travel.get("organisation") == "individual"
+        or bool(activities & {"backpacking", "vfr", "homestay", "volunteering", "healthcare_work",
+                              "medical_internship", "disaster_relief"}),
+        3: bool(activities & {"healthcare_work", "medical_internship"}),
+        4: "disaster_relief" in activities,
+        6: bool(activities & {"animal_contact", "animal_projects", "camping", "trekking"}),
+        7: rural in ("also_rural", "mostly_rural") or bool(activities & {"trekking", "camping"}),
+        8: (age is not None and age >= 60)
+        or bool(health.get("chronicDiseases"))
+        or health.get("immunosuppression") is True
+        or health.get("knownImmunodeficiency") is True
+        or health.get("pregnancyStatus") == "pregnant",
+        9: health.get("dengueLabConfirmed") is True and age is not None and age >= 4,
+    }
+    return risk_mask(t for t, active in tags.items() if active)
+
+
+class PlanMatrix:
+    """Datensatz als Matrizen Länder × Impfstoffe."""
+
+    def __init__(self, output: dict):
+        np = _numpy()
+        self.countries = list(output)
+        self._norm = [_normalise(k) for k in self.countries]
+        self._exact = {}
+        for i, n in enumerate(self._norm):
+            self._exact.setdefault(n, i)
+        self._matches = {}
+
+        vaccine_ids, cells, risk = {}, {c: [] for c in _CATEGORIES}, {}
+
+        def vid(name):
+            return vaccine_ids.setdefault(canonical_vaccine(name), len(vaccine_ids))
+
+        for c, rec in enumerate(output.values()):
+            always = rec.get("entryRequirementsAlways")
+            if always is None:
+                always = rec.get("entryRequirements") or []
+            lists = (always, rec.get("entryRequirementsConditional") or [],
+                     rec.get("recommendedForAll") or [])
+            for category, names in zip(_CATEGORIES, lists):
+                cells[category].extend((c, vid(v)) for v in names)
+            for item in rec.get("recommendedIfRisk") or []:
+                key = (c, vid(item["vaccine"]))
+                risk[key] = risk.get(key, 0) | risk_mask(item["riskTags"])
+
+        self.vaccines = list(vaccine_ids)
+        shape = (len(self.countries), len(self.vaccines))
+        self.entry_always, self.entry_conditional, self.for_all = (
+            self._bool_matrix(np, shape, cells[c]) for c in _CATEGORIES
+        )
+        self.if_risk = np.zeros(shape, dtype=np.uint16)
+        for (c, v), mask in risk.items():
+            self.if_risk[c, v] = mask
+        # [Land, Impfstoff * 9]: Bit b des Tags als eigene Spalte, für ein Matrixprodukt
+        bits = (self.if_risk[:, :, None] >> np.arange(len(RISK_TAGS), dtype=np.uint16)) & 1
+        self._risk_bits = bits.reshape(shape[0], -1).astype(np.float32)
+        self._categories = np.concatenate(
+            [self.entry_always, self.entry_conditional, self.for_all], axis=1
+        ).astype(np.float32)
+
+    @staticmethod
+    def _bool_matrix(np, shape, cells):
+        m = np.zeros(shape, dtype=bool)
+        if cells:
+            rows, cols = zip(*cells)
+            m[list(rows), list(cols)] = True
+        return m
+
+    def match_country(self, requested: str):
+        """Key im Datensatz oder None (wie matchCountryName)."""
+        i = self._country_index(requested)
+        return None if i is None else self.countries[i]
+
+    def _country_index(self, requested: str):
+        if not requested:
+            return None
+        wanted = _normalise(requested)
+        if wanted not in self._matches:
+            i = self._exact.get(wanted)
+            if i is None:
+                i = next((i for i, n in enumerate(self._norm) if wanted in n), None)
+            self._matches[wanted] = i
+        return self._matches[wanted]
+
+    def evaluate(self, itineraries, masks) -> "PlanBatch":
+        """itineraries: Ländernamen pro Reisendem; masks: riskTag-Bitmasken (parallel)."""
+        np = _numpy()
+        itineraries = [list(countries) for countries in itineraries]
+        masks = np.asarray(list(masks), dtype=np.uint16).reshape(-1)
+        if len(masks) != len(itineraries):
+            raise ValueError(f"{len(itineraries)} Reisen, aber {len(masks)} Risikomasken")
+        masks = masks & np.uint16(AUTOMATED_MASK)
+
+        n, n_vaccines = len(itineraries), len(self.vaccines)
+        travel = np.zeros((n, len(self.countries)), dtype=np.float32)
+        matched = []
+        for t, countries in enumerate(itineraries):
+            idx = [self._country_index(c) for c in countries]
+            matched.append(
+                [{"requestedName": c, "matchedKey": None if i is None else self.countries[i]}
+                 for c, i in zip(countries, idx)]
+            )
+            hits = [i for i in idx if i is not None]
+            travel[t, hits] = 1
+
+        cat = (travel @ self._categories).reshape(n, 3, n_vaccines) > 0
+        tag_bits = np.arange(len(RISK_TAGS), dtype=np.uint16)
+        offered = (travel @ self._risk_bits).reshape(n, n_vaccines, len(tag_bits)) > 0
+        active = ((masks[:, None] >> tag_bits) & 1).astype(bool)
+        weights = (1 << tag_bits).astype(np.uint16)
+        risk_tags = ((offered & active[:, None, :]) * weights).sum(axis=2, dtype=np.uint16)
+        return PlanBatch(self, matched, masks, cat[:, 0], cat[:, 1], cat[:, 2], risk_tags)
+
+
+class PlanBatch:
+    """Ergebnis von PlanMatrix.evaluate: Arrays Reisende × Impfstoffe."""
+
+    def __init__(self, matrix, matched, masks, entry_required, entry_conditional, for_all,
+                 risk_tags):
+        self.matrix = matrix
+        self.matched = matched
+        self.masks = masks
+        self.entry_required = entry_required
+        self.entry_conditional = entry_conditional
+        self.for_all = for_all
+        self.risk_tags = risk_tags  # uint16-Bitmaske der passenden Tags, 0 = keine Indikation
+
+    def __len__(self):
+        return len(self.matched)
+
+    def _names(self, row):
+        vaccines = self.matrix.vaccines
+        return [vaccines[v] for v in row.nonzero()[0]]
+
+    def plan(self, t: int) -> dict:
+        vaccines = self.matrix.vaccines
+        risk = self.risk_tags[t]
+        return {
+            "countriesMatched": self.matched[t],
+            "riskTags": mask_tags(int(self.masks[t])),
+            "entryRequired": self._names(self.entry_required[t]),
+            "entryConditional": self._names(self.entry_conditional[t]),
+            "recommendedForAll": self._names(self.for_all[t]),
+            "riskBased": [
+                {"vaccine": vaccines[v], "riskTags": mask_tags(int(risk[v]))}
+                for v in risk.nonzero()[0]
+            ],
+        }
+
+    def plans(self):
+        return (self.plan(t) for t in range(len(self)))
+
+
+def traveller_inputs(travellers):
+    """Reisende -> (itineraries, masks).
+
+    Je Reisendem entweder {"questionnaire": QuestionnaireAnswers} oder
+    {"countries": [...], "riskTags": [...]}.
+    """
+    itineraries, masks = [], []
+    for t in travellers:
+        q = t.get("questionnaire")
+        if q is not None:
+            itineraries.append(q["travel"]["countries"])
+            masks.append(risk_mask_from_questionnaire(q))
+        else:
+            itineraries.append(t.get("countries") or [])
+            masks.append(risk_mask(t.get("riskTags") or []))
+    return itineraries, masks
@@ -0,0 +1,91 @@
+"""
+Billiger Vorfilter für Stufe 2: welche Seiten können Tabellen-Seiten sein?
+
+  candidates = prefilter_pages("EB-14-2025.pdf")   # [Seitenindex] oder None
+
+Statt extract_text() mit Layout läuft pdfminers Content-Stream-Interpreter
+mit einem Device, das nur die Text-Operatoren über die Font-Encodings
+(ToUnicode) dekodiert – ohne Zeichen-Objekte, Positionen oder Zeilenbildung.
+Eine Seite ist Kandidat, wenn im dekodierten Text (ohne Leerraum, klein)
+mindestens EIN Tabellen-Marker vorkommt; die eigentliche Regel (>= 2 Marker
+auf dem extrahierten Text) bleibt in find_land_pages.
+
+Im Zweifel zählt eine Seite als Kandidat: nicht dekodierbare Zeichen oder
+Fehler beim Interpretieren. Schlägt das ganze PDF fehl, ist das Ergebnis
+None (= alle Seiten prüfen).
+"""
+import re
+
+PREFILTER_MARKERS = ["nachweispflicht", "impfungenbei", "impfungenfüralle"]
+_WS = re.compile(r"\s+")
+
+
+def squeeze(text: str) -> str:
+    return _WS.sub("", text).lower()
+
+
+def _device_class():
+    from pdfminer.pdfdevice import PDFDevice
+    from pdfminer.pdffont import PDFUnicodeNotDefined
+
+    class TextOpDevice(PDFDevice):
+        """Sammelt nur die dekodierten Zeichen der Text-Operatoren."""
+
+        def __init__(self, rsrcmgr):
+            super().__init__(rsrcmgr)
+            self.chunks = []
+            self.unsure = False
+
+        def reset(self):
+            self.chunks = []
+            self.unsure = False
+
+        def render_string(self, textstate, seq, ncs, graphicstate):
+            font = textstate.font
+            if font is None:
+                self.unsure = True
+                return
+            for obj in seq:
+                if not isinstance(obj, bytes):
+                    continue
+                for cid in font.decode(obj):
+                    try:
+                        self.chunks.append(font.to_unichr(cid))
+                    except PDFUnicodeNotDefined:
+                        self.unsure = True
+
+    return TextOpDevice
+
+
+def page_is_candidate(text: str, unsure: bool) -> bool:
+    if unsure:
+        return True
+    s = squeeze(text)
+    return any(m in s for m in PREFILTER_MARKERS)
+
+
+def prefilter_pages(pdf_path):
+    """Kandidaten-Seiten (aufsteigend) oder None, wenn das PDF nicht lesbar ist."""
+    try:
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+    except ImportError:
+        return None
+
+    try:
+        with open(pdf_path, "rb") as fp:
+            rsrc = PDFResourceManager(caching=True)
+            device = _device_class()(rsrc)
+            interpreter = PDFPageInterpreter(rsrc, device)
+            candidates = []
+            for i, page in enumerate(PDFPage.get_pages(fp)):
+                device.reset()
+                try:
+                    interpreter.process_page(page)
+                except Exception:
+                    device.unsure = True
+                if page_is_candidate("".join(device.chunks), device.unsure):
+                    candidates.append(i)
+            return candidates
+    except Exception:
+        return None
@@ -0,0 +1,193 @@
+"""
+Ausgabeprofile: ein PDF, ein Parse, alle Datensatz-Varianten.
+
+  outputs = extract_profiles("EB-14-2025.pdf", ["final", "clean", "plusalias"])
+  write_profiles(outputs, "src/data")
+
+Bisher lief für jede Variante ein eigenes Skript mit eigener PDF-Extraktion:
+
+  final      stiko_all.py              stiko_all_final.json
+  clean      stiko_poc.py              stiko_all_countries_clean.json
+  plusalias  stiko_poc_mitalias.py     stiko_all_countries_plusalias.json
+
+Seitentext und Zeilen laufen jetzt einmal; segmentiert wird einmal pro
+Satz Alias-Marker (die alten Skripte kannten "►" nicht), der Rohparse eines
+Länderblocks (parse_country_raw) läuft pro Blocktext einmal. Pro Profil werden
+nur Kanonisierung, Record-Form und Aliase angewendet; geschrieben wird mit
+dem ensure_ascii des Profils.
+
+manual_aliases=None heißt: options.manual_aliases (wie extract()); "final"
+entspricht damit immer extract() mit denselben Optionen.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .canon import CanonMatcher
+from .config import (
+    ALIAS_MARKERS,
+    ALIAS_MARKERS_LEGACY,
+    MANUAL_ALIAS_MAP,
+    MANUAL_ALIASES,
+    VACCINE_CANON,
+    VACCINE_CANON_LEGACY,
+)
+from .helpers import VACCINE_MATCHER
+from .metrics import NULL_METRICS
+from .pipeline import (
+    ExtractOptions,
+    build_blocks,
+    build_record,
+    clean_lines_from_text,
+    count_canon_cache,
+    final_cleanup,
+    find_headings,
+    load_land_text,
+    merge_aliases,
+    parse_country_raw,
+    resolve_aliases,
+    stage_metrics,
+    write_json,
+)
+
+
+@dataclass
+class OutputProfile:
+    """Form einer Datensatz-Variante."""
+
+    filename: str
+    manual_aliases: dict = None  # None = options.manual_aliases
+    # "merge": PDF-Aliase haben Vorrang (merge_aliases), "update": manuelle überschreiben
+    alias_policy: str = "merge"
+    # entryRequirementsAlways/-Conditional + Legacy-Feld statt nur entryRequirements
+    split_conditional: bool = True
+    drop_untagged_if_risk: bool = True
+    vaccine_canon: dict = field(default_factory=lambda: VACCINE_CANON)
+    # Pfeile, die in Alias-Zeilen vor "s." entfernt werden (Segmentierung)
+    alias_markers: tuple = ALIAS_MARKERS
+    ensure_ascii: bool = False  # wie json.dumps beim Schreiben
+
+
+PROFILES = {
+    "final": OutputProfile("stiko_all_final.json"),
+    "clean": OutputProfile(
+        "stiko_all_countries_clean.json",
+        {},
+        split_conditional=False,
+        drop_untagged_if_risk=False,
+        vaccine_canon=VACCINE_CANON_LEGACY,
+        alias_markers=ALIAS_MARKERS_LEGACY,
+    ),
+    "plusalias": OutputProfile(
+        "stiko_all_countries_plusalias.json",
+        MANUAL_ALIASES,
+        alias_policy="update",
+        split_conditional=False,
+        drop_untagged_if_risk=False,
+        vaccine_canon=VACCINE_CANON_LEGACY,
+        alias_markers=ALIAS_MARKERS_LEGACY,
+    ),
+}
+
+
+def apply_alias_policy(alias_map: dict, profile: OutputProfile, default_aliases: dict) -> dict:
+    manual = default_aliases if profile.manual_aliases is None else profile.manual_aliases
+    if profile.alias_policy == "update":
+        merged = dict(alias_map)
+        merged.update(manual)
+        return merged
+    if profile.alias_policy == "merge":
+        return merge_aliases(alias_map, manual)
+    raise ValueError(f"Unbekannte Alias-Policy: {profile.alias_policy}")
+
+
+def resolve_profiles(names) -> dict:
+    """Profilnamen (oder OutputProfile-Objekte im dict) -> {name: OutputProfile}."""
+    if isinstance(names, dict):
+        return dict(names)
+    unknown = [n for n in names if n not in PROFILES]
+    if unknown:
+        raise ValueError(f"Unbekannte Profile: {', '.join(unknown)} (bekannt: {', '.join(PROFILES)})")
+    return {n: PROFILES[n] for n in names}
+
+
+def render_profiles(
+    segments: dict, profiles: dict, metrics=None, manual_aliases: dict = None
+) -> dict:
+    """
+    {profil: output} aus den Rohparses; segments: {alias_markers: (raw, alias_map)}.
+    manual_aliases gilt für Profile ohne eigene (None: MANUAL_ALIAS_MAP).
+    """
+    m = metrics or NULL_METRICS
+    if manual_aliases is None:
+        manual_aliases = MANUAL_ALIAS_MAP
+    matchers = {}
+    outputs = {}
+    for name, profile in profiles.items():
+        key = id(profile.vaccine_canon)
+        if key not in matchers:
+            matchers[key] = (
+                VACCINE_MATCHER
+                if profile.vaccine_canon is VACCINE_CANON
+                else CanonMatcher(profile.vaccine_canon)
+            )
+        raw, alias_map = segments[profile.alias_markers]
+        with m.stage(f"render:{name}"):
+            output = {
+                country: build_record(
+                    country,
+                    r,
+                    matchers[key],
+                    profile.split_conditional,
+                    profile.drop_untagged_if_risk,
+                    m,
+                )
+                for country, r in raw.items()
+            }
+            resolve_aliases(output, apply_alias_policy(alias_map, profile, manual_aliases))
+            outputs[name] = final_cleanup(output)
+    return outputs
+
+
+def extract_profiles_from_text(land_text: str, profiles=("final",), options: ExtractOptions = None) -> dict:
+    options = options or ExtractOptions()
+    m = stage_metrics(options)
+    profiles = resolve_profiles(profiles)
+
+    with m.stage("clean_lines"):
+        clean_lines = clean_lines_from_text(land_text)
+    segments, parsed = {}, {}  # parsed: Blocktext -> Rohparse, über Marker-Sätze geteilt
+    for markers in dict.fromkeys(p.alias_markers for p in profiles.values()):
+        with m.stage("headings"):
+            headings, alias_map = find_headings(clean_lines, markers)
+        with m.stage("blocks"):
+            blocks = build_blocks(clean_lines, headings)
+        with m.stage("parse"):
+            raw = {}
+            for country, text in blocks.items():
+                if text not in parsed:
+                    parsed[text] = parse_country_raw(text)
+                raw[country] = parsed[text]
+        segments[markers] = (raw, alias_map)
+
+    before = VACCINE_MATCHER.cache_info()
+    outputs = render_profiles(segments, profiles, m, options.manual_aliases)
+    count_canon_cache(m, before)
+    return outputs
+
+
+def extract_profiles(pdf_path, profiles=("final",), options: ExtractOptions = None) -> dict:
+    """PDF einmal lesen und parsen -> {profil: {Landname: Datensatz}}."""
+    options = options or ExtractOptions()
+    return extract_profiles_from_text(load_land_text(pdf_path, options), profiles, options)
+
+
+def write_profiles(outputs: dict, out_dir, profiles=None) -> dict:
+    """Schreibt jede Variante unter ihrem Profil-Dateinamen; {profil: Pfad}."""
+    profiles = resolve_profiles(profiles or list(outputs))
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return {
+        name: write_json(output, out_dir / profiles[name].filename,
+                         ensure_ascii=profiles[name].ensure_ascii)
+        for name, output in outputs.items()
+    }
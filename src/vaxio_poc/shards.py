@@ -0,0 +1,147 @@
+"""
+Sharded Ausgabe: eine kleine Datei pro Land, für Lazy Loading.
+
+  write_shards(output, "public/stiko")
+  load_shard("public/stiko", "Bali")      -> Record wie in extract()
+
+Layout:
+
+  index.json                  {"format", "version", "datasetHash",
+                               "countries": {name: {"file", "hash"[, "aliasOf", "stub", "ref"]}}}
+  countries/<slug>.json       Record (kompaktes JSON)
+  countries/<alias>.json      Stub {"countryName", "aliasOf", "ref"}, wenn die
+                              Daten des Alias exakt denen des Ziellandes entsprechen
+
+"hash" sind die ersten SHARD_HASH_LEN Hex-Zeichen des Content-Hashes aus
+manifest.py (für Stubs der des expandierten Records) und taugt als ETag;
+datasetHash ist der volle Hash des Manifests. Die Reihenfolge in "countries"
+ist die des Datensatzes.
+
+Shards, deren Hash sich gegenüber dem vorhandenen index.json nicht geändert
+hat, werden nicht neu geschrieben. index.json kommt zuletzt (atomar), danach
+werden Dateien gelöscht, die der neue Index nicht mehr referenziert.
+"""
+import json
+from pathlib import Path
+
+from .compact import record_payload
+from .manifest import dataset_hash, record_hash
+from .names import slug
+from .writer import write_text_atomic
+
+SHARD_FORMAT = "vaxio-shards"
+SHARD_VERSION = 1
+SHARD_DIR = "countries"
+SHARD_HASH_LEN = 16  # 64 Bit reichen als ETag und halten index.json klein
+
+
+def shard_files(names) -> dict:
+    """{name: "countries/<slug>.json"}; Kollisionen bekommen -2, -3, ..."""
+    files, used = {}, set()
+    for name in names:
+        base = slug(name) or "land"
+        stem, k = base, 1
+        while stem in used:
+            k += 1
+            stem = f"{base}-{k}"
+        used.add(stem)
+        files[name] = f"{SHARD_DIR}/{stem}.json"
+    return files
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _read_index(out_dir: Path):
+    try:
+        index = json.loads((out_dir / "index.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if index.get("format") != SHARD_FORMAT or index.get("version") != SHARD_VERSION:
+        return None
+    return index
+
+
+def write_shards(output: dict, out_dir) -> dict:
+    """Schreibt Shards + index.json; Rückgabe {"written", "unchanged", "removed"}."""
+    out_dir = Path(out_dir)
+    (out_dir / SHARD_DIR).mkdir(parents=True, exist_ok=True)
+    old = (_read_index(out_dir) or {}).get("countries", {})
+    files = shard_files(output)
+    hashes = {name: record_hash(record) for name, record in output.items()}
+
+    entries = {}
+    stats = {"written": 0, "unchanged": 0, "removed": 0}
+    for name, record in output.items():
+        entry = {"file": files[name], "hash": hashes[name][:SHARD_HASH_LEN]}
+        target = record.get("aliasOf")
+        if target is not None:
+            entry["aliasOf"] = target
+        stub = target in output and record_payload(record) == record_payload(output[target])
+        if stub:
+            entry["stub"] = True
+            # gehört zum Inhalt des Stubs: bekommt das Ziel eine neue Datei
+            # (Slug-Kollision), muss der Stub neu geschrieben werden
+            entry["ref"] = files[target]
+        entries[name] = entry
+
+        prev = old.get(name)
+        if prev == entry and (out_dir / entry["file"]).exists():
+            stats["unchanged"] += 1
+            continue
+        if stub:
+            content = {"countryName": name, "aliasOf": target, "ref": entry["ref"]}
+        else:
+            content = record
+        write_text_atomic(_dumps(content), out_dir / entry["file"])
+        stats["written"] += 1
+
+    index = {
+        "format": SHARD_FORMAT,
+        "version": SHARD_VERSION,
+        "datasetHash": dataset_hash(hashes),
+        "countries": entries,
+    }
+    write_text_atomic(_dumps(index), out_dir / "index.json")
+
+    keep = {entry["file"] for entry in entries.values()}
+    for path in (out_dir / SHARD_DIR).glob("*.json"):
+        if f"{SHARD_DIR}/{path.name}" not in keep:
+            path.unlink()
+            stats["removed"] += 1
+    return stats
+
+
+def _load_file(out_dir: Path, rel: str) -> dict:
+    return json.loads((out_dir / rel).read_text(encoding="utf-8"))
+
+
+def load_shard(out_dir, name: str, index: dict = None) -> dict:
+    """Record eines Landes; Stubs werden über "ref" aufgelöst."""
+    out_dir = Path(out_dir)
+    index = index or _read_index(out_dir)
+    if index is None:
+        raise ValueError(f"kein {SHARD_FORMAT} v{SHARD_VERSION} in {out_dir}")
+    record = _load_file(out_dir, index["countries"][name]["file"])
+    if "ref" not in record:
+        return record
+    alias_of, seen = record["aliasOf"], {name}
+    while "ref" in record:
+        record = _load_file(out_dir, record["ref"])
+        if record["countryName"] in seen:
+            raise ValueError(f"Alias-Zyklus bei {name}")
+        seen.add(record["countryName"])
+    expanded = {"countryName": name}
+    expanded.update(record_payload(record))
+    expanded["aliasOf"] = alias_of
+    return expanded
+
+
+def load_shards(out_dir) -> dict:
+    """Alle Shards -> {Landname: Datensatz} in Index-Reihenfolge."""
+    out_dir = Path(out_dir)
+    index = _read_index(out_dir)
+    if index is None:
+        raise ValueError(f"kein {SHARD_FORMAT} v{SHARD_VERSION} in {out_dir}")
+    return {name: load_shard(out_dir, name, index) for name in index["countries"]}
@@ -0,0 +1,223 @@
+"""
+SQLite-Export des Datensatzes mit normalisierten Tabellen und Indizes.
+
+  write_sqlite(output, "stiko.sqlite")
+  output == read_sqlite("stiko.sqlite")         # verlustfrei
+
+Tabellen:
+
+  countries     id, name, name_norm, position, alias_of (nur bei Aliasen mit
+                eigenen, abweichenden Daten; sonst NULL)
+  aliases       id, name, name_norm, position, country_id – Aliase, deren Daten
+                exakt denen des Ziellandes entsprechen (der Normalfall)
+  vaccines      id, name
+  requirements  id, country_id, vaccine_id, category, position
+                category: entryAlways | entryConditional | forAll | ifRisk
+  risk_tags     requirement_id, tag (nur für category = 'ifRisk')
+  meta          key, value (format, version, datasetHash aus manifest.py)
+
+Views: country_names (Länder + Aliase -> country_id) und requirement_list
+(Land, Impfstoff, Kategorie, Tags als Text) für Ad-hoc-Abfragen, z.B.
+
+  SELECT DISTINCT n.name FROM country_names n
+    JOIN requirements r ON r.country_id = n.country_id
+    JOIN vaccines v ON v.id = r.vaccine_id
+   WHERE v.name = 'Gelbfieber' AND r.category = 'entryConditional';
+
+name_norm ist norm() wie in der Alias-Auflösung. Geschrieben wird in eine
+temporäre Datei in einer einzigen Transaktion; erst danach ersetzt sie das
+Ziel (os.replace).
+"""
+import os
+import sqlite3
+from pathlib import Path
+
+from .compact import record_payload
+from .helpers import dedup_keep_order, norm
+from .manifest import build_manifest
+
+SQLITE_FORMAT = "vaxio-sqlite"
+SQLITE_VERSION = 1
+
+CATEGORIES = {
+    "entryAlways": "entryRequirementsAlways",
+    "entryConditional": "entryRequirementsConditional",
+    "forAll": "recommendedForAll",
+}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE countries (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_norm TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    alias_of TEXT
+);
+CREATE TABLE aliases (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_norm TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    country_id INTEGER NOT NULL REFERENCES countries(id)
+);
+CREATE TABLE vaccines (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE requirements (
+    id INTEGER PRIMARY KEY,
+    country_id INTEGER NOT NULL REFERENCES countries(id),
+    vaccine_id INTEGER NOT NULL REFERENCES vaccines(id),
+    category TEXT NOT NULL
+        CHECK (category IN ('entryAlways', 'entryConditional', 'forAll', 'ifRisk')),
+    position INTEGER NOT NULL
+);
+CREATE TABLE risk_tags (
+    requirement_id INTEGER NOT NULL REFERENCES requirements(id),
+    tag INTEGER NOT NULL
+);
+
+CREATE INDEX countries_name_norm ON countries (name_norm);
+CREATE INDEX aliases_name_norm ON aliases (name_norm);
+CREATE INDEX aliases_country ON aliases (country_id);
+CREATE INDEX requirements_vaccine ON requirements (vaccine_id, category);
+CREATE INDEX requirements_country ON requirements (country_id, category, position);
+CREATE INDEX risk_tags_tag ON risk_tags (tag);
+CREATE INDEX risk_tags_requirement ON risk_tags (requirement_id);
+
+CREATE VIEW country_names AS
+    SELECT name, name_norm, id AS country_id, 0 AS is_alias FROM countries
+    UNION ALL
+    SELECT name, name_norm, country_id, 1 AS is_alias FROM aliases;
+CREATE VIEW requirement_list AS
+    SELECT c.name AS country, v.name AS vaccine, r.category,
+           (SELECT group_concat(t.tag, ',') FROM risk_tags t WHERE t.requirement_id = r.id) AS risk_tags
+      FROM requirements r
+      JOIN countries c ON c.id = r.country_id
+      JOIN vaccines v ON v.id = r.vaccine_id;
+"""
+
+
+def _rows(output: dict):
+    """Zerlegt output in die Zeilen aller Tabellen (ohne DB)."""
+    countries, aliases, vaccines, requirements, risk_tags = [], [], {}, [], []
+    country_ids = {}
+
+    def vid(name):
+        return vaccines.setdefault(name, len(vaccines) + 1)
+
+    stubs = {}
+    for position, (name, rec) in enumerate(output.items()):
+        target = rec.get("aliasOf")
+        if target in output and record_payload(rec) == record_payload(output[target]):
+            stubs[name] = (position, target)
+            continue
+        if "entryRequirementsAlways" not in rec:
+            raise ValueError(
+                f"{name}: SQLite-Export braucht das Format von stiko_all_final.json "
+                "(entryRequirementsAlways/-Conditional)"
+            )
+        cid = len(countries) + 1
+        country_ids[name] = cid
+        countries.append((cid, name, norm(name).strip(), position, target))
+        for category, key in CATEGORIES.items():
+            for i, v in enumerate(rec.get(key, [])):
+                requirements.append((len(requirements) + 1, cid, vid(v), category, i))
+        for i, item in enumerate(rec.get("recommendedIfRisk", [])):
+            rid = len(requirements) + 1
+            requirements.append((rid, cid, vid(item["vaccine"]), "ifRisk", i))
+            risk_tags.extend((rid, t) for t in item["riskTags"])
+
+    for name, (position, target) in stubs.items():
+        # aliasOf zeigt immer auf das Land am Ende der Alias-Kette (iter_alias_records)
+        if target not in country_ids:
+            raise ValueError(f"aliasOf zeigt nicht auf ein Land mit Daten: {name} -> {target}")
+        aliases.append((len(aliases) + 1, name, norm(name).strip(), position, country_ids[target]))
+
+    vaccine_rows = [(i, name) for name, i in vaccines.items()]
+    return countries, aliases, vaccine_rows, requirements, risk_tags
+
+
+def write_sqlite(output: dict, out_path) -> Path:
+    out_path = Path(out_path)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    countries, aliases, vaccines, requirements, risk_tags = _rows(output)
+    meta = [
+        ("format", SQLITE_FORMAT),
+        ("version", str(SQLITE_VERSION)),
+        ("datasetHash", build_manifest(output)["datasetHash"]),
+    ]
+
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        with conn:  # eine Transaktion für alle Zeilen
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", meta)
+            conn.executemany("INSERT INTO countries VALUES (?, ?, ?, ?, ?)", countries)
+            conn.executemany("INSERT INTO aliases VALUES (?, ?, ?, ?, ?)", aliases)
+            conn.executemany("INSERT INTO vaccines VALUES (?, ?)", vaccines)
+            conn.executemany("INSERT INTO requirements VALUES (?, ?, ?, ?, ?)", requirements)
+            conn.executemany("INSERT INTO risk_tags VALUES (?, ?)", risk_tags)
+        conn.execute("ANALYZE")
+        conn.close()
+        os.replace(tmp, out_path)
+    except BaseException:
+        conn.close()
+        tmp.unlink(missing_ok=True)
+        raise
+    return out_path
+
+
+def read_sqlite(path) -> dict:
+    """SQLite-Export -> {Landname: Datensatz} wie extract()."""
+    conn = sqlite3.connect(f"file:{Path(path)}?mode=ro", uri=True)
+    try:
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        if meta.get("format") != SQLITE_FORMAT or meta.get("version") != str(SQLITE_VERSION):
+            raise ValueError(f"kein {SQLITE_FORMAT} v{SQLITE_VERSION}")
+
+        countries = {}  # id -> (name, alias_of, {category: [...]})
+        for cid, name, alias_of in conn.execute("SELECT id, name, alias_of FROM countries"):
+            countries[cid] = (name, alias_of, {c: [] for c in [*CATEGORIES, "ifRisk"]})
+        tags = {}
+        for rid, tag in conn.execute("SELECT requirement_id, tag FROM risk_tags ORDER BY rowid"):
+            tags.setdefault(rid, []).append(tag)
+        for rid, cid, vaccine, category in conn.execute(
+            "SELECT r.id, r.country_id, v.name, r.category FROM requirements r "
+            "JOIN vaccines v ON v.id = r.vaccine_id ORDER BY r.country_id, r.position"
+        ):
+            item = {"vaccine": vaccine, "riskTags": tags.get(rid, [])} if category == "ifRisk" else vaccine
+            countries[cid][2][category].append(item)
+
+        rows = [(pos, cid, False) for cid, pos in conn.execute("SELECT id, position FROM countries")]
+        alias_names = {}
+        for aid, name, pos, cid in conn.execute("SELECT id, name, position, country_id FROM aliases"):
+            alias_names[aid] = name
+            rows.append((pos, cid, aid))
+    finally:
+        conn.close()
+
+    output = {}
+    for _, cid, aid in sorted(rows):
+        name, alias_of, lists = countries[cid]
+        if aid is not False:
+            # Alias ohne eigene Daten: Daten des Landes, aliasOf = Land
+            name, alias_of = alias_names[aid], name
+        record = {"countryName": name}
+        record.update(_record_fields(lists))
+        if alias_of is not None:
+            record["aliasOf"] = alias_of
+        output[name] = record
+    return output
+
+
+def _record_fields(lists: dict) -> dict:
+    always, conditional = lists["entryAlways"], lists["entryConditional"]
+    return {
+        "entryRequirementsAlways": always,
+        "entryRequirementsConditional": conditional,
+        "entryRequirements": dedup_keep_order(always + conditional),
+        "recommendedForAll": lists["forAll"],
+        "recommendedIfRisk": lists["ifRisk"],
+    }
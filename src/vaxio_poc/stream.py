@@ -0,0 +1,121 @@
+"""
+Streaming-Pipeline: Seiten -> bereinigte Zeilen -> Länder-Records.
+
+  for name, record in stream_extract("EB-14-2025.pdf"):
+      sink.write(name, record)
+
+Jeder Länderblock wird geparst und geliefert, sobald das nächste Heading
+(oder das Dokumentende) ihn abschließt – auch über Seitengrenzen hinweg.
+Im Speicher liegen nur das Drei-Zeilen-Fenster für die Heading-Erkennung,
+der offene Block und die bereits geparsten Records (für die Alias-Auflösung
+am Ende).
+
+Ergebnis ist dieselbe Folge wie extract(): Namen können mehrfach kommen
+(doppelte Headings, Alias über leeren Länder-Eintrag) – der spätere Record
+ersetzt den früheren, genau wie beim Einsammeln in ein dict. Doppelte
+Headings werden mit [WARN] gemeldet. Schreiben lässt sich so ein Stream nur
+zeilenweise (writer: fmt="ndjson"); json/compact lehnen doppelte Namen ab.
+"""
+from collections import deque
+
+from .helpers import norm
+from .pipeline import (
+    BAD_KEYS,
+    LAND_MARKERS,
+    ExtractOptions,
+    classify_heading,
+    iter_alias_records,
+    merge_aliases,
+    open_page_texts,
+    parse_country,
+    stage_metrics,
+    warn,
+)
+
+
+def iter_land_texts(src):
+    """Texte der Tabellen-Seiten in Seitenreihenfolge (Fallback: alle Seiten)."""
+    found = False
+    for _, t in src.iter_texts():
+        if sum(m in t for m in LAND_MARKERS) >= 2:
+            found = True
+            yield t
+
+    if not found:
+        warn("Marker-Seiten nicht gefunden – nutze alle Seiten als Fallback.")
+        for _, t in src.iter_texts():
+            yield t
+
+
+def iter_clean_lines(texts):
+    for t in texts:
+        for ln in t.splitlines():
+            ln = ln.strip()
+            if ln and not ln.startswith("Epidemiologisches Bulletin"):
+                yield ln
+
+
+def iter_blocks(lines, alias_map: dict):
+    """
+    Liefert (name, block_text), sobald ein Block abgeschlossen ist.
+    PDF-Aliase werden nebenbei in alias_map gesammelt.
+    """
+    window = deque()
+    name, block = None, []
+
+    for ln in lines:
+        window.append(ln)
+        if len(window) < 3:
+            continue
+
+        cand = window.popleft()
+        if classify_heading(cand, window[0], window[1], alias_map):
+            if name is not None:
+                yield name, "\n".join(block)
+            name, block = cand, [cand]
+        elif name is not None:
+            block.append(cand)
+
+    # die letzten beiden Zeilen können kein Heading mehr sein
+    if name is not None:
+        block.extend(window)
+        yield name, "\n".join(block)
+
+
+def stream_from_lines(lines, options: ExtractOptions = None):
+    """
+    (name, record) ab bereinigten Zeilen: erst jedes Land beim Blockende,
+    nach dem letzten Block die Alias-Kopien.
+    """
+    options = options or ExtractOptions()
+    m = stage_metrics(options)  # Zähler ja, Stufenzeiten nicht (verzahnt)
+    alias_map = {}
+    output = {}
+
+    for name, text in iter_blocks(lines, alias_map):
+        record = parse_country(name, text, m)
+        if name in output:
+            warn(f"Doppeltes Heading: {name} – der spätere Block ersetzt den früheren")
+            m.count("duplicateHeadings")
+        output[name] = record
+        if norm(name) not in BAD_KEYS:
+            yield name, record
+
+    alias_map = merge_aliases(alias_map, options.manual_aliases)
+    unresolved = {}
+    for name, record in iter_alias_records(output, alias_map, unresolved):
+        if norm(name) not in BAD_KEYS:
+            yield name, record
+    m.count("unresolvedAliases", len(unresolved))
+
+
+def stream_extract(pdf_path, options: ExtractOptions = None):
+    """
+    Wie extract(), aber als Generator über (name, record).
+    Seiten werden einzeln gelesen; options.workers wird hier nicht genutzt.
+    """
+    options = options or ExtractOptions()
+    with open_page_texts(pdf_path, options) as src:
+        lines = iter_clean_lines(iter_land_texts(src))
+        yield from stream_from_lines(lines, options)
+        src.mark_complete(range(len(src)))
@@ -0,0 +1,185 @@
+"""
+Synthetische Bulletins für Benchmarks – ohne externe Abhängigkeiten.
+
+synthetic_country_lines erzeugt Ländertabellen-Zeilen im STIKO-Stil,
+write_text_pdf schreibt pro Seite eine Liste von Textzeilen mit Helvetica
+(WinAnsi). "▶" wird über einen ToUnicode-Eintrag auf Code 0x95 gelegt, damit
+pdfplumber die Bullets wie im echten Bulletin liefert.
+"""
+import random
+from pathlib import Path
+
+_BULLET = "▶"
+_BULLET_CODE = 0x95
+
+_TOUNICODE = (
+    b"/CIDInit /ProcSet findresource begin\n"
+    b"12 dict begin\nbegincmap\n"
+    b"/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n"
+    b"/CMapName /Vaxio-WinAnsi def\n/CMapType 2 def\n"
+    b"1 begincodespacerange\n<00> <FF>\nendcodespacerange\n"
+    b"1 beginbfchar\n<95> <25B6>\nendbfchar\n"
+    b"endcmap\nCMapName currentdict /CMap defineresource pop\nend\nend\n"
+)
+
+_VACCINES = [
+    "Poliomyelitis", "MMR/MMR-V", "TDaP/Tdap", "Hepatitis A", "Hepatitis B",
+    "Typhus", "Tollwut", "Cholera", "Influenza", "Gelbfieber", "Dengue",
+    "Japanische Enzephalitis", "Meningokokken-ACWY", "TBE (FSME-Impfung)",
+]
+
+
+def _letters(n: int, width: int = 4) -> str:
+    """Ziffernfreier, eindeutiger Namensteil (Headings dürfen keine Ziffern haben)."""
+    out = []
+    for _ in range(width):
+        n, r = divmod(n, 26)
+        out.append(chr(ord("a") + r))
+    return "".join(reversed(out))
+
+
+def synthetic_country_lines(n_countries: int, seed: int = 0) -> list:
+    """
+    Bereinigte Zeilen (ohne Seitenköpfe) für n_countries Länderblöcke:
+    Nachweispflicht (generell/bedingt), ▶-Bullets mit Risk-Tag-Ziffern,
+    Fußnoten-Sternchen, gelegentlich IfRisk ohne Tags, "s. Land"-Aliase
+    und Alpha-Trenner.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for c in range(n_countries):
+        name = f"Land {_letters(c).capitalize()}"
+        lines.append(name)
+        if rng.random() < 0.3:
+            lines.append("Gelbfieber: Nachweispflicht bei Einreise aus Endemiegebieten")
+        elif rng.random() < 0.1:
+            lines.append("Poliomyelitis: Nachweispflicht für alle Reisenden")
+        else:
+            lines.append("Keine Nachweispflicht")
+        lines.append("Impfungen bei besonderem Risiko")
+        for v in rng.sample(_VACCINES[4:], 3):
+            tags = sorted(rng.sample(range(1, 10), rng.randint(1, 4)))
+            star = "*" if rng.random() < 0.1 else ""
+            lines.append(f"{_BULLET} {v}{star}{','.join(map(str, tags))}")
+        if rng.random() < 0.05:
+            lines.append(f"{_BULLET} Cholera")
+        lines.append("Impfungen für alle Reisenden")
+        for v in _VACCINES[: rng.randint(3, 5)]:
+            lines.append(f"{_BULLET} {v}")
+        if rng.random() < 0.1:
+            lines.append(f"Insel {_letters(c).capitalize()} s. {name}")
+        if rng.random() < 0.02:
+            lines.append("B · C")
+    return lines
+
+
+def synthetic_bulletin_pages(
+    n_countries: int,
+    seed: int = 0,
+    lines_per_page: int = 60,
+    front_pages: int = 4,
+    back_pages: int = 2,
+) -> list:
+    """
+    Seiten (Listen von Zeilen) eines Bulletins: Fließtext-Seiten vorn und
+    hinten, dazwischen die Ländertabelle mit Seitenkopf auf jeder Seite.
+    """
+    rng = random.Random(seed + 1)
+    header = "Epidemiologisches Bulletin 14 | 2025"
+
+    def prose_page(k):
+        return [header, "Reiseimpfungen – Empfehlungen der STIKO"] + [
+            f"Absatz {k}.{j}: " + " ".join(rng.choice(_VACCINES) for _ in range(6))
+            for j in range(lines_per_page - 2)
+        ]
+
+    table = ["Name des Landes", "Tabelle 1 Aufbau"] + synthetic_country_lines(n_countries, seed)
+    pages = [prose_page(k) for k in range(front_pages)]
+    step = lines_per_page - 1
+    for k in range(0, len(table), step):
+        pages.append([header] + table[k : k + step])
+    pages += [prose_page(front_pages + k) for k in range(back_pages)]
+    return pages
+
+
+def synthetic_bulletin_texts(n_countries: int, seed: int = 0, **kw) -> list:
+    """Text-Layer: ein String pro Seite, wie ihn der Extractor liefern würde."""
+    return ["\n".join(p) for p in synthetic_bulletin_pages(n_countries, seed, **kw)]
+
+
+def write_synthetic_bulletin(path, n_countries: int, seed: int = 0, **kw) -> Path:
+    return write_text_pdf(path, synthetic_bulletin_pages(n_countries, seed, **kw))
+
+
+def _pdf_string(line: str) -> bytes:
+    raw = line.replace(_BULLET, "\x00").encode("cp1252", errors="replace")
+    raw = raw.replace(b"\x00", bytes([_BULLET_CODE]))
+    raw = raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    return b"(" + raw + b")"
+
+
+def _content_stream(lines, font_size: int = 9, leading: int = 11) -> bytes:
+    out = [b"BT", b"/F1 %d Tf" % font_size, b"%d TL" % leading, b"40 800 Td"]
+    for ln in lines:
+        out.append(_pdf_string(ln) + b" Tj T*")
+    out.append(b"ET")
+    return b"\n".join(out)
+
+
+def write_text_pdf(path, pages) -> Path:
+    """pages: Liste von Seiten, jede Seite eine Liste von Zeilen."""
+    path = Path(path)
+    objects = []  # Index i -> Objekt-Nr. i + 1
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")  # wird unten gefüllt
+    pages_obj = add(b"")
+    tounicode = add(
+        b"<< /Length %d >>\nstream\n" % len(_TOUNICODE) + _TOUNICODE + b"\nendstream"
+    )
+    font = add(
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding /ToUnicode %d 0 R >>" % tounicode
+    )
+
+    kids = []
+    for lines in pages:
+        stream = _content_stream(lines)
+        content = add(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+        kids.append(
+            add(
+                b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+                b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+                % (pages_obj, font, content)
+            )
+        )
+
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_obj
+    objects[pages_obj - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids),
+        len(kids),
+    )
+
+    buf = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(buf))
+        buf += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+
+    xref = len(buf)
+    buf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        buf += b"%010d 00000 n \n" % off
+    buf += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        catalog,
+        xref,
+    )
+
+    path.write_bytes(bytes(buf))
+    return path
@@ -0,0 +1,154 @@
+"""
+Datensatz als NumPy-Tensor (.npz) für Auswertungen.
+
+  write_tensor(output, "stiko_tensor.npz")
+  t = load_tensor("stiko_tensor.npz")             # Arrays per mmap (read-only), lädt sofort
+  layer = {name: i for i, name in enumerate(t["layers"])}
+  t["tensor"][:, :, layer["forAll"]].sum(axis=0)  # Länder je Impfstoff "für alle"
+
+Inhalt (np.savez, unkomprimiert):
+
+  tensor      bool [Land, Impfstoff, Ebene]
+  countries   Länder-Keys in Ausgabereihenfolge (inkl. Aliase)
+  vaccines    Impfstoff-Namen, erstes Vorkommen im Datensatz
+  layers      entryAlways, entryConditional, forAll, ifRisk, riskTag1 … riskTag9
+  aliasOf     Index des Ziellandes oder -1 (Aliase ausblenden: aliasOf < 0)
+  meta        [format, version, datasetHash aus manifest.py]
+
+ifRisk ist gesetzt, wenn der Impfstoff in recommendedIfRisk steht,
+riskTag<t>, wenn dort Tag t genannt ist. Labels sind Unicode-Arrays fester
+Breite (kein Pickle), damit alles per mmap lesbar ist. np.load(mmap_mode=...)
+mappt die Einträge einer .npz nicht; load_tensor liest deshalb die Offsets
+der (unkomprimierten) Zip-Einträge und legt np.memmap direkt auf die Datei.
+Für Vergleiche zwischen Ausgaben über die Labels ausrichten, nicht über
+Indizes – Länder und Impfstoffe können hinzukommen oder wegfallen.
+"""
+import os
+import struct
+import zipfile
+from pathlib import Path
+
+from .compact import RISK_TAGS, check_risk_tags
+from .manifest import build_manifest
+
+TENSOR_FORMAT = "vaxio-tensor"
+TENSOR_VERSION = 1
+LAYERS = ["entryAlways", "entryConditional", "forAll", "ifRisk"] + [f"riskTag{t}" for t in RISK_TAGS]
+
+_LIST_LAYERS = {
+    "entryAlways": "entryRequirementsAlways",
+    "entryConditional": "entryRequirementsConditional",
+    "forAll": "recommendedForAll",
+}
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('Tensor-Export braucht numpy (pip install "vaxio-poc[numpy]")') from None
+    return numpy
+
+
+def build_tensor(output: dict) -> dict:
+    np = _numpy()
+    check_risk_tags(output)
+    countries = list(output)
+    index = {name: i for i, name in enumerate(countries)}
+    layer = {name: i for i, name in enumerate(LAYERS)}
+    vaccines, cells = {}, []
+
+    def vid(name):
+        return vaccines.setdefault(name, len(vaccines))
+
+    alias_of = []
+    for c, (name, rec) in enumerate(output.items()):
+        target = rec.get("aliasOf")
+        if target is not None and target not in index:
+            raise ValueError(f"aliasOf zeigt auf fehlendes Land: {name} -> {target}")
+        alias_of.append(index[target] if target is not None else -1)
+        for lname, key in _LIST_LAYERS.items():
+            cells.extend((c, vid(v), layer[lname]) for v in rec.get(key, []))
+        for item in rec.get("recommendedIfRisk", []):
+            v = vid(item["vaccine"])
+            cells.append((c, v, layer["ifRisk"]))
+            cells.extend((c, v, layer[f"riskTag{t}"]) for t in item["riskTags"])
+
+    tensor = np.zeros((len(countries), len(vaccines), len(LAYERS)), dtype=bool)
+    if cells:
+        tensor[tuple(np.array(cells).T)] = True
+    return {
+        "tensor": tensor,
+        "countries": np.array(countries, dtype=str),
+        "vaccines": np.array(list(vaccines), dtype=str),
+        "layers": np.array(LAYERS, dtype=str),
+        "aliasOf": np.array(alias_of, dtype=np.int32),
+        "meta": np.array(
+            [TENSOR_FORMAT, str(TENSOR_VERSION), build_manifest(output)["datasetHash"]], dtype=str
+        ),
+    }
+
+
+def write_tensor(output: dict, out_path) -> Path:
+    np = _numpy()
+    out_path = Path(out_path)
+    arrays = build_tensor(output)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as fp:
+            np.savez(fp, **arrays)  # unkomprimiert: Voraussetzung für mmap
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return out_path
+
+
+def _member_offset(fp, info: zipfile.ZipInfo) -> int:
+    """Beginn der Daten eines Zip-Eintrags (hinter dem Local File Header)."""
+    fp.seek(info.header_offset)
+    header = fp.read(30)
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    return info.header_offset + 30 + name_len + extra_len
+
+
+# "r+"/"w+" schrieben in die (geteilte) .npz bzw. würden sie abschneiden
+MMAP_MODES = ("r", "c", None)
+
+
+def load_tensor(path, mmap_mode: str = "r") -> dict:
+    """
+    {Name: Array}; mmap_mode "r" (nur lesen), "c" (Copy-on-Write, Änderungen
+    bleiben im Speicher) oder None (vollständig in den Speicher).
+    """
+    if mmap_mode not in MMAP_MODES:
+        raise ValueError(f"mmap_mode {mmap_mode!r} nicht erlaubt (erlaubt: 'r', 'c', None)")
+    np = _numpy()
+    path = Path(path)
+    if mmap_mode is None:
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+    else:
+        arrays = {}
+        with zipfile.ZipFile(path) as zf, open(path, "rb") as fp:
+            for info in zf.infolist():
+                name = info.filename[: -len(".npy")]
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(f"{path}: {info.filename} ist komprimiert, mmap nicht möglich")
+                fp.seek(_member_offset(fp, info))
+                version = np.lib.format.read_magic(fp)
+                if version == (1, 0):
+                    shape, fortran, dtype = np.lib.format.read_array_header_1_0(fp)
+                else:
+                    shape, fortran, dtype = np.lib.format.read_array_header_2_0(fp)
+                if 0 in shape:  # leere Arrays lassen sich nicht mappen
+                    arrays[name] = np.zeros(shape, dtype=dtype)
+                    continue
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode=mmap_mode, shape=shape,
+                    order="F" if fortran else "C", offset=fp.tell(),
+                )
+    meta = arrays.get("meta")
+    if meta is None or list(meta[:2]) != [TENSOR_FORMAT, str(TENSOR_VERSION)]:
+        raise ValueError(f"kein {TENSOR_FORMAT} v{TENSOR_VERSION}: {path}")
+    return arrays
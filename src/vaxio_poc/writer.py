@@ -0,0 +1,118 @@
+"""
+Stufe 9: Datensatz schreiben – Land für Land, atomar.
+
+  write_records(output, "stiko_all_final.json")                  # wie bisher, indent=2
+  write_records(output, "stiko.ndjson", fmt="ndjson")            # ein Land pro Zeile
+  write_records(stream_extract(pdf), "stiko.ndjson", fmt="ndjson")  # Streaming
+
+Jeder Datensatz wird genau einmal serialisiert und direkt in die Datei
+geschrieben; das Gesamtdokument entsteht nie als ein String. "json" ist
+byte-identisch zu json.dumps(output, ensure_ascii=ensure_ascii, indent=2)
+(Default ensure_ascii=False).
+Geschrieben wird in eine temporäre Datei im Zielverzeichnis, die erst nach
+vollständigem Schreiben per os.replace an ihren Platz kommt – Leser sehen
+entweder die alte oder die neue Datei, nie eine halbe.
+
+NDJSON-Zeilen sind die Datensätze selbst; der Key steht in "countryName".
+Ein Name kann dort mehrfach vorkommen (stream_extract: der spätere Record
+gewinnt); json/compact lehnen doppelte Namen ab, statt doppelte Keys zu
+schreiben.
+"""
+import json
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+FORMATS = ("json", "compact", "ndjson")
+
+
+def _items(records):
+    """dict oder Iterable von (name, record)."""
+    return records.items() if isinstance(records, dict) else records
+
+
+def iter_chunks(records, fmt: str = "json", ensure_ascii: bool = False):
+    """
+    Serialisiert records stückweise (ein Stück pro Land). ensure_ascii wie
+    bei json.dumps (\\u-Escapes statt UTF-8).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unbekanntes Format: {fmt} (bekannt: {', '.join(FORMATS)})")
+
+    if fmt == "ndjson":
+        for _, record in _items(records):
+            yield json.dumps(record, ensure_ascii=ensure_ascii, separators=(",", ":")) + "\n"
+        return
+
+    first, seen = True, set()
+    for name, record in _items(records):
+        if name in seen:
+            raise ValueError(f"Doppelter Name {name!r} – für Streams fmt='ndjson' nutzen")
+        seen.add(name)
+        key = json.dumps(name, ensure_ascii=ensure_ascii)
+        if fmt == "compact":
+            value = json.dumps(record, ensure_ascii=ensure_ascii, separators=(",", ":"))
+            yield ("{" if first else ",") + key + ":" + value
+        else:
+            value = json.dumps(record, ensure_ascii=ensure_ascii, indent=2).replace("\n", "\n  ")
+            yield ("{\n  " if first else ",\n  ") + key + ": " + value
+        first = False
+    if first:
+        yield "{}"
+    else:
+        yield "}" if fmt == "compact" else "\n}"
+
+
+def dump_records(records, fp, fmt: str = "json", ensure_ascii: bool = False) -> int:
+    """Schreibt records in ein offenes Textfile; Rückgabe: Anzahl Länder."""
+    n = 0
+    for chunk in iter_chunks(records, fmt, ensure_ascii):
+        fp.write(chunk)
+        n += 1
+    return n if fmt == "ndjson" else max(0, n - 1)
+
+
+@contextmanager
+def atomic_write(out_path):
+    """Textfile, das erst beim fehlerfreien Verlassen out_path ersetzt."""
+    out_path = Path(out_path)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="\n") as fp:
+            yield fp
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_records(records, out_path, fmt: str = "json", ensure_ascii: bool = False) -> Path:
+    out_path = Path(out_path)
+    with atomic_write(out_path) as fp:
+        dump_records(records, fp, fmt, ensure_ascii)
+    return out_path
+
+
+def write_text_atomic(text: str, out_path) -> Path:
+    out_path = Path(out_path)
+    with atomic_write(out_path) as fp:
+        fp.write(text)
+    return out_path
+
+
+def print_records(records, fmt: str = "json", ensure_ascii: bool = False):
+    dump_records(records, sys.stdout, fmt, ensure_ascii)
+    if fmt != "ndjson":
+        sys.stdout.write("\n")
+
+
+def read_ndjson(path) -> dict:
+    """Gegenstück zu fmt="ndjson": {countryName: record}."""
+    output = {}
+    with open(path, encoding="utf-8") as fp:
+        for line in fp:
+            if line.strip():
+                record = json.loads(line)
+                output[record["countryName"]] = record
+    return output
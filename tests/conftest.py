@@ -0,0 +1,38 @@
+"""
+Gemeinsame Fixtures: ein synthetisches Bulletin (synthetic.py) pro Testlauf
+und Optionen, deren Caches im tmp-Verzeichnis des Tests liegen.
+"""
+import pytest
+
+from vaxio_poc.pipeline import ExtractOptions, extract
+from vaxio_poc.synthetic import write_synthetic_bulletin
+
+N_COUNTRIES = 60
+
+
+@pytest.fixture(scope="session")
+def n_countries():
+    return N_COUNTRIES
+
+
+@pytest.fixture(scope="session")
+def bulletin(tmp_path_factory, n_countries):
+    return write_synthetic_bulletin(tmp_path_factory.mktemp("pdf") / "EB-synthetic.pdf", n_countries)
+
+
+@pytest.fixture
+def options(tmp_path):
+    """ExtractOptions(**kw) mit eigenem Seiten- und Stufen-Cache."""
+
+    def make(**kw):
+        kw.setdefault("cache_dir", str(tmp_path / "pages"))
+        kw.setdefault("checkpoint_dir", str(tmp_path / "stages"))
+        return ExtractOptions(**kw)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def reference(bulletin):
+    """extract() ohne Cache – Vergleichswert für alle anderen Wege."""
+    return extract(bulletin, ExtractOptions(use_cache=False))
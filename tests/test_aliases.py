@@ -0,0 +1,46 @@
+from vaxio_poc.aliases import resolve_alias_targets
+from vaxio_poc.pipeline import merge_aliases, resolve_aliases
+
+
+def record(name, for_all=("Tollwut",)):
+    return {"countryName": name, "recommendedForAll": list(for_all), "recommendedIfRisk": []}
+
+
+def test_chain_resolves_to_country():
+    output = {"Indonesien": record("Indonesien")}
+    alias_map = {"Bali": "Kleine Sundainseln", "Kleine Sundainseln": "indonesien"}
+    resolved, unresolved = resolve_alias_targets(output, alias_map)
+    assert resolved == {"Bali": "Indonesien", "Kleine Sundainseln": "Indonesien"}
+    assert unresolved == {}
+
+
+def test_cycle_and_missing_target_are_unresolved():
+    output = {"Indonesien": record("Indonesien")}
+    alias_map = {"A": "B", "B": "A", "C": "Atlantis"}
+    resolved, unresolved = resolve_alias_targets(output, alias_map)
+    assert resolved == {}
+    assert unresolved == {"A": ("B", "Zyklus"), "B": ("A", "Zyklus"), "C": ("Atlantis", "nicht gefunden")}
+
+
+def test_empty_country_is_link_in_chain():
+    # "Sansibar" steht leer im PDF und wird vom gleichnamigen Alias ersetzt
+    output = {"Tansania": record("Tansania"), "Sansibar": record("Sansibar", for_all=())}
+    resolved, _ = resolve_alias_targets(output, {"Sansibar": "Tansania", "Pemba": "Sansibar"})
+    assert resolved == {"Sansibar": "Tansania", "Pemba": "Tansania"}
+
+
+def test_cycle_through_empty_country_falls_back_to_it():
+    output = {"Sansibar": record("Sansibar", for_all=())}
+    resolved, unresolved = resolve_alias_targets(output, {"Sansibar": "Pemba", "Pemba": "Sansibar"})
+    assert resolved == {"Sansibar": "Sansibar", "Pemba": "Sansibar"}
+    assert unresolved == {}
+
+
+def test_resolve_copies_records():
+    output = {"Indonesien": record("Indonesien")}
+    unresolved = {}
+    resolve_aliases(output, merge_aliases({"Bali": "Indonesien"}, {"Lombok": "Bali"}), unresolved)
+    assert output["Lombok"]["aliasOf"] == "Indonesien"
+    assert output["Lombok"]["countryName"] == "Lombok"
+    assert output["Lombok"]["recommendedForAll"] is not output["Indonesien"]["recommendedForAll"]
+    assert unresolved == {}
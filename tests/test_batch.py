@@ -0,0 +1,36 @@
+import json
+import shutil
+from pathlib import Path
+
+from vaxio_poc.batch import run_batch
+
+
+def test_batch_writes_outputs_and_warnings(bulletin, reference, options, tmp_path, capsys):
+    copy = shutil.copy(bulletin, tmp_path / "EB-entwurf.pdf")
+    results = run_batch([bulletin, copy], tmp_path / "out", options(), jobs=2)
+
+    assert [r["ok"] for r in results] == [True, True]
+    names = [r["output"] for r in results]
+    assert len(set(names)) == 2
+    for name in names:
+        assert json.loads(open(name, encoding="utf-8").read()) == reference
+
+    err = capsys.readouterr().err
+    for r in results:
+        # [WARN]-Zeilen pro Datei auf stderr, mit Dateinamen davor
+        prefix = f"{Path(r['pdf']).name}: [WARN]"
+        assert r["warnings"] > 0
+        assert sum(ln.startswith(prefix) for ln in err.splitlines()) == r["warnings"]
+
+
+def test_batch_keeps_caller_options(bulletin, options, tmp_path):
+    opts = options(workers=4)
+    run_batch([bulletin], tmp_path / "out", opts)
+    assert opts.workers == 4
+
+
+def test_batch_reports_broken_pdf(options, tmp_path):
+    broken = tmp_path / "kaputt.pdf"
+    broken.write_bytes(b"kein PDF")
+    (result,) = run_batch([broken], tmp_path / "out", options())
+    assert not result["ok"] and result["error"]
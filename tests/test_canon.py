@@ -0,0 +1,43 @@
+import itertools
+
+import pytest
+
+from vaxio_poc.canon import CanonMatcher
+from vaxio_poc.config import VACCINE_CANON, VACCINE_CANON_LEGACY
+from vaxio_poc.helpers import norm
+from vaxio_poc.synthetic import synthetic_bulletin_texts
+
+
+def linear_lookup(canon: dict, normalized: str):
+    """Die alte Schleife aus stiko_all.py: längster enthaltener Schlüssel gewinnt."""
+    for key in sorted(canon, key=len, reverse=True):
+        if key in normalized:
+            return canon[key]
+    return None
+
+
+def sample_lines(canon: dict) -> list:
+    keys = list(canon)
+    lines = [line for text in synthetic_bulletin_texts(40) for line in text.splitlines()]
+    lines += keys
+    lines += [f"{a} {b}" for a, b in itertools.combinations(keys, 2)]
+    lines += [k.upper() + "*1,6" for k in keys]
+    lines += ["", "Keine Nachweispflicht", "TBE (FSME-Impfung) und Tdap/Tdap", "mmr/mmr-v2"]
+    return lines
+
+
+@pytest.mark.parametrize("canon", [VACCINE_CANON, VACCINE_CANON_LEGACY], ids=["final", "legacy"])
+def test_matcher_equals_linear_loop(canon):
+    matcher = CanonMatcher(canon)
+    for line in sample_lines(canon):
+        n = norm(line)
+        assert matcher.lookup(n) == linear_lookup(canon, n), line
+
+
+def test_equal_length_keeps_dict_order():
+    matcher = CanonMatcher({"abc": "first", "bcd": "second"})
+    assert matcher.lookup("abcd") == "first"
+
+
+def test_empty_canon():
+    assert CanonMatcher({}).lookup("tollwut") is None
@@ -0,0 +1,94 @@
+from dataclasses import replace
+
+from vaxio_poc import checkpoints
+from vaxio_poc.checkpoints import STAGES, Checkpoints, StageCache
+from vaxio_poc.pipeline import extract
+
+
+def run(bulletin, opts, stages=None):
+    cp = Checkpoints(bulletin, opts, stages=stages)
+    return cp.get("output"), cp.status
+
+
+def test_checkpointed_equals_extract(bulletin, reference, options):
+    assert extract(bulletin, options(checkpoints=True)) == reference
+    output, status = run(bulletin, options())
+    assert output == reference
+    assert status == {"output": "hit"}
+
+
+def test_warnings_are_replayed(bulletin, options, capsys):
+    run(bulletin, options())
+    first = capsys.readouterr().err
+    run(bulletin, options())
+    assert capsys.readouterr().err == first
+
+
+def test_alias_change_reuses_parsed(bulletin, options):
+    opts = options()
+    run(bulletin, opts)
+    aliases = dict(reversed(list(opts.manual_aliases.items())))
+    _, status = run(bulletin, options(manual_aliases=aliases))
+    assert status == {"parsed": "hit", "output": "miss"}
+
+    output, status = run(bulletin, options(manual_aliases={"Atlantis": "Land Aaab"}))
+    assert status == {"parsed": "hit", "output": "miss"}
+    assert output["Atlantis"]["aliasOf"] == "Land Aaab"
+
+
+def test_backend_change_reextracts(bulletin, reference, options):
+    run(bulletin, options())
+    output, status = run(bulletin, options(backend="pdfplumber"))
+    assert output == reference
+    assert status["land_text"] == "miss"
+
+
+def test_library_version_change_reextracts(bulletin, options, monkeypatch):
+    run(bulletin, options())
+    versions = checkpoints.backends.library_versions()
+    monkeypatch.setattr(
+        checkpoints.backends, "library_versions", lambda: {**versions, "pdfplumber": "0.0"}
+    )
+    _, status = run(bulletin, options())
+    assert status["land_text"] == "miss"
+
+
+def test_code_change_invalidates_downstream(bulletin, options):
+    run(bulletin, options())
+    stages = dict(STAGES)
+    # geänderter Parser: andere Code-Teile der Stufe "parsed"
+    stages["parsed"] = replace(STAGES["parsed"], code=STAGES["parsed"].code + ({"neu": 1},))
+    _, status = run(bulletin, options(), stages)
+    assert status == {"segments": "hit", "parsed": "miss", "output": "miss"}
+
+
+def test_invalidate(bulletin, options):
+    opts = options()
+    cp = Checkpoints(bulletin, opts)
+    cp.get("output")
+    cache = StageCache(opts.checkpoint_dir)
+    assert cache.invalidate(cp.pdf_sha) == len(STAGES)
+    _, status = run(bulletin, opts)
+    assert set(status.values()) == {"miss"}
+
+
+def test_config_change_invalidates_segments(bulletin, options, monkeypatch):
+    run(bulletin, options())
+    monkeypatch.setattr(checkpoints.config, "ALIAS_MARKERS", ("→",))
+    _, status = run(bulletin, options())
+    assert status == {"lines": "hit", "segments": "miss", "parsed": "miss", "output": "miss"}
+
+
+def test_canon_order_invalidates_parsed(bulletin, options, monkeypatch):
+    run(bulletin, options())
+    canon = checkpoints.config.VACCINE_CANON
+    monkeypatch.setattr(checkpoints.config, "VACCINE_CANON", dict(reversed(list(canon.items()))))
+    _, status = run(bulletin, options())
+    assert status["parsed"] == "miss"
+
+
+def test_config_alias_map_keeps_parsed(bulletin, options, monkeypatch):
+    run(bulletin, options())
+    monkeypatch.setattr(checkpoints.config, "MANUAL_ALIAS_MAP", {"Atlantis": "Land Aaab"})
+    _, status = run(bulletin, options())
+    assert status == {"output": "hit"}
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from vaxio_poc.cli import main
+
+
+def test_extract_writes_json(bulletin, reference, tmp_path):
+    out = tmp_path / "out.json"
+    main(["extract", str(bulletin), "-o", str(out), "--cache-dir", str(tmp_path / "pages")])
+    assert json.loads(out.read_text(encoding="utf-8")) == reference
+
+
+def test_extract_to_stdout(bulletin, reference, tmp_path, capsys):
+    main(["extract", str(bulletin), "-o", "-", "--cache-dir", str(tmp_path / "pages")])
+    assert json.loads(capsys.readouterr().out) == reference
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        ["--report", "r.json"],
+        ["--checkpoints", "--state", "s.json"],
+        ["--checkpoints", "--stream", "--format", "ndjson"],
+    ],
+)
+def test_extract_rejects_ignored_flags(bulletin, tmp_path, flags):
+    out = tmp_path / "out.json"
+    with pytest.raises(SystemExit) as exc:
+        main(["extract", str(bulletin), "-o", str(out), "--no-cache"] + flags)
+    assert exc.value.code == 2
+    assert not out.exists()
+
+
+def test_extract_state_writes_report(bulletin, reference, tmp_path):
+    out, report = tmp_path / "out.json", tmp_path / "report.json"
+    args = ["extract", str(bulletin), "-o", str(out), "--no-cache", "--state", str(tmp_path / "state.json")]
+    main(args + ["--report", str(report)])
+    assert json.loads(out.read_text(encoding="utf-8")) == reference
+    assert json.loads(report.read_text(encoding="utf-8"))["unchanged"] == 0
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from vaxio_poc import pipeline
+from vaxio_poc.cli import main
+from vaxio_poc.compact import from_compact, risk_mask, to_compact, write_compact
+
+
+def bad_tag_output():
+    return {
+        "Land Neu": {
+            "countryName": "Land Neu",
+            "entryRequirementsAlways": [],
+            "entryRequirementsConditional": [],
+            "entryRequirements": [],
+            "recommendedForAll": ["Typhus"],
+            "recommendedIfRisk": [{"vaccine": "Tollwut", "riskTags": [0, 1, 6]}],
+        }
+    }
+
+
+def test_compact_roundtrip(reference, tmp_path):
+    path = write_compact(reference, tmp_path / "stiko.compact.json")
+    restored = from_compact(json.loads(path.read_text(encoding="utf-8")))
+    assert restored == reference
+    assert list(restored) == list(reference)
+
+
+def test_risk_mask():
+    assert risk_mask([1, 3, 8]) == 0b010000101
+    with pytest.raises(ValueError):
+        risk_mask([10])
+
+
+def test_unknown_risk_tag_names_country_and_vaccine(tmp_path):
+    with pytest.raises(ValueError, match=r"Land Neu -> Tollwut: \[0\]"):
+        write_compact(bad_tag_output(), tmp_path / "stiko.compact.json")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cli_checks_tags_before_writing(bulletin, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(pipeline, "extract", lambda pdf_path, options: bad_tag_output())
+    out, compact = tmp_path / "out.json", tmp_path / "compact.json"
+    assert main(["extract", str(bulletin), "-o", str(out), "--compact", str(compact)]) == 2
+    assert "Land Neu -> Tollwut" in capsys.readouterr().err
+    assert not out.exists() and not compact.exists()
+
+
+def test_to_compact_shares_alias_rows(reference):
+    data = to_compact(reference)
+    aliases = [i for i, target in enumerate(data["aliasOf"]) if target >= 0]
+    assert aliases
+    assert all(data["forAll"][i] == [] for i in aliases)
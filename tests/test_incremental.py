@@ -0,0 +1,36 @@
+from vaxio_poc import incremental
+from vaxio_poc.incremental import extract_incremental
+from vaxio_poc.pipeline import ExtractOptions, extract
+from vaxio_poc.synthetic import write_synthetic_bulletin
+
+
+def test_incremental_equals_full_extract(bulletin, n_countries, reference, options, tmp_path):
+    state = tmp_path / "stiko_state.json"
+    output, report = extract_incremental(bulletin, state, options())
+    assert output == reference
+    assert report["unchanged"] == 0
+
+    # gleiche Ausgabe nochmal: nichts neu parsen
+    output, report = extract_incremental(bulletin, state, options())
+    assert output == reference
+    assert report["reparsed"] == 0
+
+    # neue Ausgabe mit vier zusätzlichen Ländern am Ende
+    newer = write_synthetic_bulletin(tmp_path / "EB-newer.pdf", n_countries + 4)
+    output, report = extract_incremental(newer, state, options())
+    full = extract(newer, ExtractOptions(use_cache=False))
+    assert output == full
+    assert list(output) == list(full)
+    assert len(report["added"]) == 4
+    assert report["changed"] == [] and report["removed"] == []
+
+
+def test_parser_change_reparses_everything(bulletin, reference, options, tmp_path, monkeypatch):
+    state = tmp_path / "stiko_state.json"
+    extract_incremental(bulletin, state, options())
+
+    monkeypatch.setattr(incremental, "parser_fingerprint", lambda: "anderer Parser")
+    output, report = extract_incremental(bulletin, state, options())
+    assert output == reference
+    assert report["unchanged"] == 0
+    assert len(report["added"]) == report["reparsed"] > 0
@@ -0,0 +1,24 @@
+import json
+import tracemalloc
+
+from vaxio_poc.cli import main
+from vaxio_poc.metrics import Metrics
+from vaxio_poc.pipeline import extract
+
+
+def test_stages_and_counters(bulletin, reference, options):
+    metrics = Metrics(track_memory=False)
+    assert extract(bulletin, options(metrics=metrics)) == reference
+    data = metrics.to_dict()
+    for stage in ("extract_pages", "parse", "aliases", "cleanup"):
+        assert stage in data["stages"]
+    assert data["values"]["records"] == len(reference)
+
+
+def test_metrics_written_on_memory_abort(bulletin, tmp_path):
+    out, path = tmp_path / "out.json", tmp_path / "metrics.json"
+    args = ["extract", str(bulletin), "-o", str(out), "--no-cache", "--memory-limit", "1"]
+    assert main(args + ["--metrics", str(path)]) == 2
+    assert not out.exists()
+    assert "über dem Limit" in json.loads(path.read_text(encoding="utf-8"))["values"]["aborted"]
+    assert not tracemalloc.is_tracing()
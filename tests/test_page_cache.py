@@ -0,0 +1,70 @@
+import pytest
+
+from vaxio_poc.metrics import Metrics
+from vaxio_poc.page_cache import PageTextCache
+from vaxio_poc.pipeline import extract, open_page_texts
+from vaxio_poc.stream import stream_extract
+
+
+def test_store_load_roundtrip(tmp_path):
+    cache = PageTextCache(tmp_path)
+    settings = {"extractor": "pdfium", "version": "1"}
+    cache.store("ab" * 32, settings, 5, {3: "drei", 0: "null"}, complete=[0, 3])
+
+    assert cache.load("ab" * 32, settings) == (5, {0: "null", 3: "drei"}, [0, 3])
+    assert cache.load("ab" * 32, {"extractor": "pdfium", "version": "2"}) is None
+    assert cache.load("cd" * 32, settings) is None
+
+
+def test_complete_must_be_cached(tmp_path):
+    cache = PageTextCache(tmp_path)
+    cache.store("ab" * 32, {}, 5, {0: "null"}, complete=[0, 1])
+    assert cache.load("ab" * 32, {})[2] is None
+
+
+def test_extract_from_cache(bulletin, reference, options):
+    assert extract(bulletin, options()) == reference
+
+    metrics = Metrics(track_memory=False)
+    assert extract(bulletin, options(metrics=metrics)) == reference
+    assert metrics.values["pageCacheHit"] is True
+    assert metrics.values["pagesExtracted"] == 0
+
+
+def test_partial_pages_are_not_trusted(bulletin, reference, options):
+    # nur einzelne Seiten gelesen, ohne mark_complete: Texte landen im Cache,
+    # dürfen aber nicht als Kandidatenliste gelten
+    with open_page_texts(bulletin, options()) as src:
+        src.text(0)
+        src.text(len(src) - 1)
+
+    with open_page_texts(bulletin, options()) as src:
+        assert src.cache_hit
+        assert src.complete_pages is None
+
+    assert extract(bulletin, options()) == reference
+
+
+def test_aborted_stream_stores_nothing(bulletin, reference, options):
+    stream = stream_extract(bulletin, options())
+    next(stream)
+    stream.close()
+    assert PageTextCache(options().cache_dir).stats()["entries"] == 0
+
+    with pytest.raises(RuntimeError):
+        with open_page_texts(bulletin, options()) as src:
+            src.text(0)
+            raise RuntimeError("abgebrochen")
+    assert PageTextCache(options().cache_dir).stats()["entries"] == 0
+
+    assert extract(bulletin, options()) == reference
+
+
+def test_without_cache_each_page_extracted_once(bulletin, reference, options):
+    metrics = Metrics(track_memory=False)
+    assert extract(bulletin, options(use_cache=False, metrics=metrics)) == reference
+    assert metrics.values["pagesExtracted"] == metrics.values["candidatePages"]
+
+    with open_page_texts(bulletin, options(use_cache=False)) as src:
+        assert [i for i, _ in src.iter_texts()] == list(range(len(src)))
+        assert src.extracted == len(src)
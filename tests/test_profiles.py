@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from vaxio_poc.pipeline import extract_from_text, load_land_text
+from vaxio_poc.profiles import PROFILES, extract_profiles, extract_profiles_from_text, write_profiles
+
+
+@pytest.fixture
+def outputs(bulletin, options):
+    return extract_profiles(bulletin, list(PROFILES), options())
+
+
+def test_final_profile_equals_extract(bulletin, reference, outputs):
+    assert outputs["final"] == reference
+
+
+@pytest.mark.parametrize("name", list(PROFILES))
+def test_written_bytes_match_json_dumps(outputs, tmp_path, name):
+    # die alten Skripte schrieben json.dumps(output, ensure_ascii=..., indent=2)
+    path = write_profiles({name: outputs[name]}, tmp_path)[name]
+    expected = json.dumps(outputs[name], ensure_ascii=PROFILES[name].ensure_ascii, indent=2)
+    assert path.read_bytes() == expected.encode("utf-8")
+
+
+def test_legacy_profiles_keep_old_alias_markers(bulletin, options):
+    land_text = "Land Neu ► s. Land Aaaa\n" + load_land_text(bulletin, options())
+    outputs = extract_profiles_from_text(land_text, list(PROFILES), options())
+    assert outputs["final"]["Land Neu"]["aliasOf"] == "Land Aaaa"
+    for name in ("clean", "plusalias"):
+        assert "Land Neu" not in outputs[name]
+
+
+def test_profiles_use_option_aliases(bulletin, options):
+    opts = options(manual_aliases={"Atlantis": "Land Aaab"})
+    outputs = extract_profiles(bulletin, ["final", "clean"], opts)
+    assert outputs["final"]["Atlantis"]["aliasOf"] == "Land Aaab"
+    assert "Atlantis" not in outputs["clean"]  # clean hat eigene (leere) Aliase
+    assert outputs["final"] == extract_from_text(load_land_text(bulletin, opts), opts)
@@ -0,0 +1,57 @@
+import json
+
+from vaxio_poc.shards import load_shard, load_shards, write_shards
+
+
+def shard_file_name(out_dir, name):
+    index = json.loads((out_dir / "index.json").read_text(encoding="utf-8"))
+    return index["countries"][name]["file"].rsplit("/", 1)[-1]
+
+
+def record(name, for_all, alias_of=None):
+    rec = {"countryName": name, "recommendedForAll": for_all, "recommendedIfRisk": []}
+    if alias_of:
+        rec["aliasOf"] = alias_of
+    return rec
+
+
+def test_shards_roundtrip(reference, tmp_path):
+    write_shards(reference, tmp_path / "shards")
+    restored = load_shards(tmp_path / "shards")
+    assert restored == reference
+    assert list(restored) == list(reference)
+
+    alias = next(name for name, rec in reference.items() if "aliasOf" in rec)
+    assert load_shard(tmp_path / "shards", alias) == reference[alias]
+
+
+def test_shards_rewrite_only_changes(reference, tmp_path):
+    out_dir = tmp_path / "shards"
+    write_shards(reference, out_dir)
+    before = {p: p.stat().st_mtime_ns for p in out_dir.rglob("*.json")}
+
+    changed = json.loads(json.dumps(reference))
+    targets = {rec.get("aliasOf") for rec in reference.values()}
+    # Land ohne Aliase: sonst ändern sich deren Stub-Hashes mit
+    name = next(n for n, rec in changed.items() if n not in targets and "aliasOf" not in rec)
+    changed[name]["recommendedForAll"].append("Cholera")
+    stats = write_shards(changed, out_dir)
+
+    rewritten = [p for p, mtime in before.items() if p.stat().st_mtime_ns != mtime]
+    assert sorted(p.name for p in rewritten) == sorted(["index.json", shard_file_name(out_dir, name)])
+    assert stats["written"] == 1
+    assert load_shards(out_dir) == changed
+
+
+def test_stub_follows_renumbered_target(tmp_path):
+    out_dir = tmp_path / "shards"
+    output = {"Ziel": record("Ziel", ["Typhus"]), "Bali": record("Bali", ["Typhus"], "Ziel")}
+    write_shards(output, out_dir)
+    assert shard_file_name(out_dir, "Ziel") == "ziel.json"
+
+    # neues Land mit gleichem Slug davor: "Ziel" rutscht auf ziel-2.json
+    newer = {"ZIEL": record("ZIEL", ["Cholera"]), **output}
+    write_shards(newer, out_dir)
+    assert shard_file_name(out_dir, "Ziel") == "ziel-2.json"
+    assert load_shard(out_dir, "Bali") == output["Bali"]
+    assert load_shards(out_dir) == newer
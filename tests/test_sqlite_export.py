@@ -0,0 +1,32 @@
+import sqlite3
+
+from vaxio_poc.manifest import build_manifest
+from vaxio_poc.sqlite_export import read_sqlite, write_sqlite
+
+
+def test_sqlite_roundtrip(reference, tmp_path):
+    restored = read_sqlite(write_sqlite(reference, tmp_path / "stiko.sqlite"))
+    assert restored == reference
+    assert list(restored) == list(reference)
+
+
+def test_sqlite_queries(reference, tmp_path):
+    path = write_sqlite(reference, tmp_path / "stiko.sqlite")
+    conn = sqlite3.connect(path)
+    try:
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        names = {n for (n,) in conn.execute("SELECT name FROM country_names")}
+        for_all = {
+            n
+            for (n,) in conn.execute(
+                "SELECT DISTINCT n.name FROM country_names n"
+                " JOIN requirements r ON r.country_id = n.country_id"
+                " JOIN vaccines v ON v.id = r.vaccine_id"
+                " WHERE v.name = 'Hepatitis A' AND r.category = 'forAll'"
+            )
+        }
+    finally:
+        conn.close()
+    assert meta["datasetHash"] == build_manifest(reference)["datasetHash"]
+    assert names == set(reference)
+    assert for_all and for_all == {n for n, rec in reference.items() if "Hepatitis A" in rec["recommendedForAll"]}
@@ -0,0 +1,57 @@
+import io
+
+import pytest
+
+from vaxio_poc.cli import main
+from vaxio_poc.pipeline import clean_lines_from_text, extract_from_text
+from vaxio_poc.stream import stream_extract, stream_from_lines
+from vaxio_poc.synthetic import synthetic_country_lines
+from vaxio_poc.writer import dump_records, read_ndjson, write_records
+
+
+def test_stream_equals_extract(bulletin, reference, options):
+    streamed = dict(stream_extract(bulletin, options()))
+    assert streamed == reference
+    assert list(streamed) == list(reference)
+
+
+def test_stream_ndjson_roundtrip(bulletin, reference, options, tmp_path):
+    path = write_records(stream_extract(bulletin, options()), tmp_path / "stiko.ndjson", fmt="ndjson")
+    assert read_ndjson(path) == reference
+
+
+def test_duplicate_heading_later_block_wins(capsys):
+    lines = synthetic_country_lines(6)
+    first = lines.index("Land Aaab")
+    repeated = lines[:first] + lines[first:] + lines[:first]  # Land Aaaa zweimal
+    land_text = "\n".join(repeated)
+
+    streamed = {}
+    for name, rec in stream_from_lines(clean_lines_from_text(land_text)):
+        streamed[name] = rec
+    assert "Doppeltes Heading: Land Aaaa" in capsys.readouterr().err
+    assert streamed == extract_from_text(land_text)
+    assert list(streamed) == list(extract_from_text(land_text))
+
+
+def test_json_rejects_duplicate_names(tmp_path):
+    records = [("A", {"countryName": "A"}), ("A", {"countryName": "A"})]
+    with pytest.raises(ValueError, match="Doppelter Name"):
+        write_records(records, tmp_path / "dup.json")
+    assert list(tmp_path.iterdir()) == []
+
+    buf = io.StringIO()
+    dump_records(records, buf, fmt="ndjson")
+    assert buf.getvalue().count("\n") == 2
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [["--stream"], ["--stream", "--format", "ndjson", "--compact", "x.json"]],
+)
+def test_cli_stream_needs_plain_ndjson(bulletin, tmp_path, flags):
+    out = tmp_path / "out.json"
+    with pytest.raises(SystemExit) as exc:
+        main(["extract", str(bulletin), "-o", str(out), "--no-cache"] + flags)
+    assert exc.value.code == 2
+    assert not out.exists()
@@ -0,0 +1,62 @@
+import pytest
+
+from vaxio_poc.manifest import build_manifest
+
+np = pytest.importorskip("numpy")
+
+from vaxio_poc.tensor import LAYERS, build_tensor, load_tensor, write_tensor  # noqa: E402
+
+
+def test_npz_roundtrip(reference, tmp_path):
+    path = write_tensor(reference, tmp_path / "stiko_tensor.npz")
+    built = build_tensor(reference)
+    for mmap_mode in ("r", "c", None):
+        loaded = load_tensor(path, mmap_mode=mmap_mode)
+        assert sorted(loaded) == sorted(built)
+        for name, array in built.items():
+            np.testing.assert_array_equal(np.asarray(loaded[name]), array)
+
+
+def test_cells_match_records(reference):
+    built = build_tensor(reference)
+    countries = list(built["countries"])
+    vaccines = list(built["vaccines"])
+    layer = {name: i for i, name in enumerate(LAYERS)}
+    tensor = built["tensor"]
+    assert list(built["meta"])[2] == build_manifest(reference)["datasetHash"]
+    for c, (name, rec) in enumerate(reference.items()):
+        assert countries[c] == name
+        for_all = {vaccines[v] for v in tensor[c, :, layer["forAll"]].nonzero()[0]}
+        assert for_all == set(rec["recommendedForAll"])
+        for item in rec["recommendedIfRisk"]:
+            v = vaccines.index(item["vaccine"])
+            tags = [t for t in range(1, 10) if tensor[c, v, layer[f"riskTag{t}"]]]
+            assert set(item["riskTags"]) <= set(tags)
+        target = rec.get("aliasOf")
+        assert built["aliasOf"][c] == (countries.index(target) if target else -1)
+
+
+@pytest.mark.parametrize("mmap_mode", ["r+", "w+", "x"])
+def test_writable_mmap_modes_rejected(reference, tmp_path, mmap_mode):
+    path = write_tensor(reference, tmp_path / "stiko_tensor.npz")
+    before = path.read_bytes()
+    with pytest.raises(ValueError, match="mmap_mode"):
+        load_tensor(path, mmap_mode=mmap_mode)
+    assert path.read_bytes() == before
+
+
+def test_copy_on_write_keeps_file(reference, tmp_path):
+    path = write_tensor(reference, tmp_path / "stiko_tensor.npz")
+    before = path.read_bytes()
+    loaded = load_tensor(path, mmap_mode="c")
+    loaded["tensor"][...] = True
+    loaded["tensor"].flush()
+    del loaded
+    assert path.read_bytes() == before
+
+
+def test_unknown_risk_tag_rejected():
+    output = {"Land Neu": {"countryName": "Land Neu",
+                           "recommendedIfRisk": [{"vaccine": "Tollwut", "riskTags": [10]}]}}
+    with pytest.raises(ValueError, match="Land Neu -> Tollwut"):
+        build_tensor(output)
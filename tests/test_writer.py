@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from vaxio_poc.writer import iter_chunks, read_ndjson, write_records
+
+
+def test_formats_roundtrip(reference, tmp_path):
+    for fmt in ("json", "compact"):
+        path = write_records(reference, tmp_path / f"out.{fmt}.json", fmt=fmt)
+        assert json.loads(path.read_text(encoding="utf-8")) == reference
+    assert read_ndjson(write_records(reference, tmp_path / "out.ndjson", fmt="ndjson")) == reference
+
+
+@pytest.mark.parametrize("ensure_ascii", [False, True])
+def test_json_matches_json_dumps(tmp_path, ensure_ascii):
+    output = {
+        "Côte d'Ivoire": {"countryName": "Côte d'Ivoire", "recommendedForAll": ["Gelbfieber"]},
+        "Réunion": {"countryName": "Réunion", "aliasOf": "Frankreich", "recommendedIfRisk": []},
+    }
+    path = write_records(output, tmp_path / "out.json", ensure_ascii=ensure_ascii)
+    assert path.read_text(encoding="utf-8") == json.dumps(output, ensure_ascii=ensure_ascii, indent=2)
+
+
+def test_empty_dataset():
+    assert "".join(iter_chunks({})) == "{}"
+
+
+def test_failed_write_keeps_old_file(tmp_path):
+    path = write_records({"A": {"countryName": "A"}}, tmp_path / "out.json")
+    before = path.read_bytes()
+
+    def records():
+        yield "B", {"countryName": "B"}
+        raise RuntimeError("abgebrochen")
+
+    with pytest.raises(RuntimeError):
+        write_records(records(), path)
+    assert path.read_bytes() == before
+    assert list(tmp_path.iterdir()) == [path]